@@ -5,23 +5,64 @@ Creates a realistic dataset with intentional data quality issues
 to demonstrate the validation framework.
 """
 
+import argparse
+import json
 import sqlite3
-import random
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 
 
-def create_sample_database(db_path: str = "sample_data/test.db"):
-    """Create sample database with test data."""
+# Intentional data quality issues appended after the generated rows.
+# Ids and client links depend on the dataset size, so only the fixed
+# column values live here.
+
+# Duplicate clients (same name + DOB): first_name .. status
+_DUPLICATE_CLIENTS = (
+    ('John', 'Smith', 'john.dup@email.com', '204-555-1234', '1985-03-15', 'R3A 1B2', 'active'),
+    ('John', 'Smith', 'john.smith2@email.com', '204-555-5678', '1985-03-15', 'R3A 1B3', 'active'),
+)
+
+# Orphan services: program_id .. notes
+_ORPHAN_SERVICES = (
+    (1, '2024-01-15', 'Case Management', 2.0, 150.00, 'Orphan record'),
+    (2, '2024-02-20', 'Housing Search', 1.5, 100.00, 'Orphan record'),
+)
+
+
+def create_sample_database(
+    db_path: str = "sample_data/test.db",
+    num_clients: int = 200,
+    num_services: int = 500
+):
+    """
+    Create sample database with test data.
+    
+    Generated rows are produced inside SQLite and streamed straight into
+    the tables, so memory use stays flat even for very large demos
+    (e.g. num_services=1_000_000).
+    
+    Args:
+        db_path: Path of the SQLite file to (re)create
+        num_clients: Number of generated clients (before duplicates)
+        num_services: Number of generated services (before orphans)
+    """
     
     path = Path(db_path)
     path.parent.mkdir(parents=True, exist_ok=True)
     
-    # Remove existing database
-    if path.exists():
-        path.unlink()
+    # Remove existing database (and any WAL side files from a previous build)
+    for stale in (path, Path(f"{db_path}-wal"), Path(f"{db_path}-shm")):
+        if stale.exists():
+            stale.unlink()
     
     conn = sqlite3.connect(db_path)
+    
+    # Bulk-load tuning: one fsync per transaction instead of per statement
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-64000")
+    
     cursor = conn.cursor()
     
     # Create tables
@@ -75,6 +116,9 @@ def create_sample_database(db_path: str = "sample_data/test.db"):
         );
     """)
     
+    # Load all data in a single transaction
+    conn.execute("BEGIN")
+    
     # Insert programs
     programs = [
         (1, 'Emergency Shelter', '2023-01-01', '2025-12-31', 50, 'active'),
@@ -89,81 +133,115 @@ def create_sample_database(db_path: str = "sample_data/test.db"):
     )
     
     # Insert clients with various data quality issues
-    clients = []
     first_names = ['John', 'Jane', 'Michael', 'Sarah', 'David', 'Emily', 'Robert', 'Lisa', 'James', 'Maria']
     last_names = ['Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller', 'Davis', 'Wilson', 'Taylor']
+    # One clock read for the whole run: every generated row shares the
+    # same creation timestamp, and service dates count back from today
+    now = datetime.now()
+    created_at = now.isoformat()
     
-    for i in range(1, 201):
-        first_name = random.choice(first_names)
-        last_name = random.choice(last_names)
-        
-        # Intentional issues:
-        # - Some missing emails (completeness)
-        # - Some invalid postal codes (pattern)
-        # - Some duplicate names+DOB (duplicates)
-        
-        email = f"{first_name.lower()}.{last_name.lower()}{i}@email.com" if random.random() > 0.15 else None
-        
-        # Phone with various formats
-        phone = f"204-555-{random.randint(1000, 9999)}" if random.random() > 0.1 else None
-        
-        # Date of birth
-        dob = datetime(
-            random.randint(1950, 2005),
-            random.randint(1, 12),
-            random.randint(1, 28)
-        ).strftime('%Y-%m-%d')
-        
-        # Postal code - some invalid
-        if random.random() > 0.1:
-            postal = f"R{random.randint(1,3)}{random.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ')} {random.randint(1,9)}{random.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ')}{random.randint(1,9)}"
-        else:
-            postal = f"INVALID{random.randint(1,99)}"  # Invalid format
-        
-        status = random.choice(['active', 'active', 'active', 'inactive', 'pending'])
-        
-        clients.append((i, first_name, last_name, email, phone, dob, postal, status, datetime.now().isoformat()))
+    # Rows are generated inside SQLite (recursive CTE + random()) rather than
+    # in a Python loop, so no per-row tuples cross the bindings layer.
+    #
+    # Intentional issues:
+    # - Some missing emails (completeness)
+    # - Some invalid postal codes (pattern)
+    # - Some duplicate names+DOB (duplicates)
+    cursor.execute("""
+        WITH RECURSIVE seq(i, fn, ln) AS (
+            SELECT 1, abs(random()) % 10, abs(random()) % 10
+            UNION ALL
+            SELECT i + 1, abs(random()) % 10, abs(random()) % 10 FROM seq WHERE i < :num_clients
+        ),
+        named AS (
+            SELECT seq.i, f.value AS first_name, l.value AS last_name
+            FROM seq
+            JOIN json_each(:first_names) f ON f.key = seq.fn
+            JOIN json_each(:last_names) l ON l.key = seq.ln
+        )
+        INSERT INTO clients
+        SELECT
+            i,
+            first_name,
+            last_name,
+            CASE WHEN abs(random()) % 100 >= 15
+                 THEN lower(first_name) || '.' || lower(last_name) || i || '@email.com' END,
+            CASE WHEN abs(random()) % 100 >= 10
+                 THEN '204-555-' || (1000 + abs(random()) % 9000) END,
+            printf('%04d-%02d-%02d',
+                   1950 + abs(random()) % 56, 1 + abs(random()) % 12, 1 + abs(random()) % 28),
+            CASE WHEN abs(random()) % 100 >= 10
+                 THEN 'R' || (1 + abs(random()) % 3)
+                      || substr(:letters, 1 + abs(random()) % 26, 1) || ' '
+                      || (1 + abs(random()) % 9)
+                      || substr(:letters, 1 + abs(random()) % 26, 1)
+                      || (1 + abs(random()) % 9)
+                 ELSE 'INVALID' || (1 + abs(random()) % 99) END,  -- Invalid format
+            CASE abs(random()) % 5 WHEN 3 THEN 'inactive' WHEN 4 THEN 'pending' ELSE 'active' END,
+            :created_at
+        FROM named
+    """, {
+        'first_names': json.dumps(first_names),
+        'last_names': json.dumps(last_names),
+        'letters': 'ABCDEFGHIJKLMNOPQRSTUVWXYZ',
+        'created_at': created_at,
+        'num_clients': num_clients,
+    })
     
     # Add duplicate entries (same name + DOB)
-    clients.append((201, 'John', 'Smith', 'john.dup@email.com', '204-555-1234', '1985-03-15', 'R3A 1B2', 'active', datetime.now().isoformat()))
-    clients.append((202, 'John', 'Smith', 'john.smith2@email.com', '204-555-5678', '1985-03-15', 'R3A 1B3', 'active', datetime.now().isoformat()))
-    
     cursor.executemany(
         "INSERT INTO clients VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
-        clients
+        (
+            (num_clients + i, *row, created_at)
+            for i, row in enumerate(_DUPLICATE_CLIENTS, start=1)
+        )
     )
     
     # Insert services with issues
-    services = []
     service_types = ['Case Management', 'Housing Search', 'Benefits Assistance', 'Mental Health', 'Employment']
     
-    for i in range(1, 501):
-        client_id = random.randint(1, 200)
-        program_id = random.randint(1, 5)
-        service_date = (datetime.now() - timedelta(days=random.randint(0, 365))).strftime('%Y-%m-%d')
-        service_type = random.choice(service_types)
-        
-        # Hours - some invalid (negative or > 24)
-        if random.random() > 0.02:
-            hours = round(random.uniform(0.5, 8), 1)
-        else:
-            hours = random.choice([-1, 25, 30])  # Invalid
-        
-        # Cost - some outliers
-        if random.random() > 0.02:
-            cost = round(random.uniform(50, 500), 2)
-        else:
-            cost = round(random.uniform(5000, 10000), 2)  # Outlier
-        
-        services.append((i, client_id, program_id, service_date, service_type, hours, cost, None))
-    
-    # Add orphan services (invalid client_id)
-    services.append((501, 9999, 1, '2024-01-15', 'Case Management', 2.0, 150.00, 'Orphan record'))
-    services.append((502, 9998, 2, '2024-02-20', 'Housing Search', 1.5, 100.00, 'Orphan record'))
+    cursor.execute("""
+        WITH RECURSIVE seq(i, st, u_hours, u_cost) AS (
+            SELECT 1, abs(random()) % 5,
+                   abs(random()) / 9223372036854775807.0, abs(random()) / 9223372036854775807.0
+            UNION ALL
+            SELECT i + 1, abs(random()) % 5,
+                   abs(random()) / 9223372036854775807.0, abs(random()) / 9223372036854775807.0
+            FROM seq WHERE i < :num_services
+        )
+        INSERT INTO services
+        SELECT
+            i,
+            1 + abs(random()) % :num_clients,
+            1 + abs(random()) % 5,
+            date(:today, '-' || (abs(random()) % 366) || ' days'),
+            t.value,
+            -- Hours - some invalid (negative or > 24)
+            CASE WHEN abs(random()) % 100 >= 2
+                 THEN round(0.5 + u_hours * 7.5, 1)
+                 ELSE CASE abs(random()) % 3 WHEN 0 THEN -1 WHEN 1 THEN 25 ELSE 30 END END,
+            -- Cost - some outliers
+            CASE WHEN abs(random()) % 100 >= 2
+                 THEN round(50 + u_cost * 450, 2)
+                 ELSE round(5000 + u_cost * 5000, 2) END,
+            NULL
+        FROM seq
+        JOIN json_each(:service_types) t ON t.key = seq.st
+    """, {
+        'service_types': json.dumps(service_types),
+        'today': now.strftime('%Y-%m-%d'),
+        'num_clients': num_clients,
+        'num_services': num_services,
+    })
     
+    # Add orphan services (client_id well outside the generated range)
+    orphan_client_id = max(9999, num_clients + 1000)
     cursor.executemany(
         "INSERT INTO services VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
-        services
+        (
+            (num_services + i, orphan_client_id - (i - 1), *row)
+            for i, row in enumerate(_ORPHAN_SERVICES, start=1)
+        )
     )
     
     # Insert staff
@@ -183,11 +261,17 @@ def create_sample_database(db_path: str = "sample_data/test.db"):
     conn.close()
     
     print(f"Sample database created: {db_path}")
-    print(f"  - 202 clients (with completeness and duplicate issues)")
+    print(f"  - {num_clients + 2} clients (with completeness and duplicate issues)")
     print(f"  - 5 programs (with date validation issue)")
-    print(f"  - 502 services (with orphan records, range issues, outliers)")
+    print(f"  - {num_services + 2} services (with orphan records, range issues, outliers)")
     print(f"  - 5 staff members")
 
 
 if __name__ == '__main__':
-    create_sample_database()
+    parser = argparse.ArgumentParser(description='Generate the sample SQLite database')
+    parser.add_argument('--path', default='sample_data/test.db', help='Output database path')
+    parser.add_argument('--clients', type=int, default=200, help='Number of generated clients')
+    parser.add_argument('--services', type=int, default=500, help='Number of generated services')
+    args = parser.parse_args()
+    
+    create_sample_database(args.path, num_clients=args.clients, num_services=args.services)
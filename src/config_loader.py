@@ -11,6 +11,48 @@ from typing import Any
 
 import yaml
 
+# Prefer the libyaml C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+# Allowed values, in the order shown in error messages
+_SEVERITY_LEVELS = ['critical', 'high', 'medium', 'low']
+_RULE_TYPES = [
+    'completeness', 'referential_integrity', 'duplicates', 'uniqueness',
+    'range', 'pattern', 'date_range', 'outliers', 'cross_field', 'custom_sql'
+]
+_CONNECTION_TYPES = ['sqlserver', 'postgres', 'sqlite', 'csv']
+
+# Fields every rule must define, and extra fields required per rule type
+_RULE_REQUIRED_FIELDS = ('name', 'type', 'severity')
+_RULE_TYPE_REQUIRED_FIELDS = {
+    'completeness': ('columns',),
+    'referential_integrity': ('column', 'reference_table', 'reference_column'),
+    'custom_sql': ('query',),
+}
+
+
+def normalize_rule(rule: dict) -> dict:
+    """
+    Fill in optional rule fields so the engine can index them directly.
+    
+    Args:
+        rule: Rule definition as written in the configuration
+        
+    Returns:
+        The same rule dict, with 'table' and 'description' defaulted to ''
+        and 'severity' lowercased
+    """
+    rule.setdefault('table', '')
+    rule.setdefault('description', '')
+    severity = rule.get('severity')
+    if isinstance(severity, str):
+        rule['severity'] = severity.lower()
+    return rule
+
 
 class ConfigurationError(Exception):
     """Raised when configuration is invalid or missing."""
@@ -22,6 +64,11 @@ class ConfigLoader:
     
     ENV_PATTERN = re.compile(r'\$\{([^}]+)\}')
     
+    # O(1) membership checks for per-rule/per-connection validation
+    _VALID_SEVERITIES = frozenset(_SEVERITY_LEVELS)
+    _VALID_RULE_TYPES = frozenset(_RULE_TYPES)
+    _VALID_CONN_TYPES = frozenset(_CONNECTION_TYPES)
+    
     def __init__(self, config_path: str | Path, connections_path: str | Path | None = None):
         """
         Initialize configuration loader.
@@ -66,15 +113,24 @@ class ConfigLoader:
         content = self._substitute_env_vars(content)
         
         try:
-            return yaml.safe_load(content) or {}
+            return yaml.load(content, Loader=_YamlLoader) or {}
         except yaml.YAMLError as e:
             raise ConfigurationError(f"Invalid YAML in {path}: {e}")
     
     def _substitute_env_vars(self, content: str) -> str:
         """Replace ${VAR_NAME} patterns with environment variable values."""
+        # Skip the regex pass entirely for files without placeholders
+        if '${' not in content:
+            return content
+        
+        # Each variable is read from the environment at most once per file
+        cache: dict[str, str | None] = {}
+        
         def replace_match(match):
             var_name = match.group(1)
-            value = os.environ.get(var_name)
+            if var_name not in cache:
+                cache[var_name] = os.environ.get(var_name)
+            value = cache[var_name]
             if value is None:
                 # Keep the placeholder if env var not set (will be caught in validation)
                 return match.group(0)
@@ -91,6 +147,7 @@ class ConfigLoader:
             
         for i, rule in enumerate(rules):
             self._validate_rule(rule, i)
+            normalize_rule(rule)
             
         # Validate connections
         connections = self._connections.get('connections', {})
@@ -102,60 +159,41 @@ class ConfigLoader:
     
     def _validate_rule(self, rule: dict, index: int) -> None:
         """Validate a single rule definition."""
-        required_fields = ['name', 'type', 'severity']
-        
-        for field in required_fields:
+        for field in _RULE_REQUIRED_FIELDS:
             if field not in rule:
                 raise ConfigurationError(
                     f"Rule at index {index} missing required field: {field}"
                 )
                 
-        valid_severities = ['critical', 'high', 'medium', 'low']
-        if rule['severity'] not in valid_severities:
+        # Non-strings (e.g. a YAML list) are unhashable in a frozenset check
+        if not isinstance(rule['severity'], str) or rule['severity'] not in self._VALID_SEVERITIES:
             raise ConfigurationError(
                 f"Rule '{rule['name']}' has invalid severity: {rule['severity']}. "
-                f"Must be one of: {valid_severities}"
+                f"Must be one of: {_SEVERITY_LEVELS}"
             )
             
-        valid_types = [
-            'completeness', 'referential_integrity', 'duplicates', 'uniqueness',
-            'range', 'pattern', 'date_range', 'outliers', 'cross_field', 'custom_sql'
-        ]
-        if rule['type'] not in valid_types:
+        if not isinstance(rule['type'], str) or rule['type'] not in self._VALID_RULE_TYPES:
             raise ConfigurationError(
                 f"Rule '{rule['name']}' has invalid type: {rule['type']}. "
-                f"Must be one of: {valid_types}"
-            )
-            
-        # Type-specific validation
-        if rule['type'] == 'completeness' and 'columns' not in rule:
-            raise ConfigurationError(
-                f"Rule '{rule['name']}' (completeness) requires 'columns' field"
+                f"Must be one of: {_RULE_TYPES}"
             )
             
-        if rule['type'] == 'referential_integrity':
-            required = ['column', 'reference_table', 'reference_column']
-            for field in required:
-                if field not in rule:
-                    raise ConfigurationError(
-                        f"Rule '{rule['name']}' (referential_integrity) requires '{field}' field"
-                    )
-                    
-        if rule['type'] == 'custom_sql' and 'query' not in rule:
-            raise ConfigurationError(
-                f"Rule '{rule['name']}' (custom_sql) requires 'query' field"
-            )
+        # Type-specific validation: one lookup instead of a check per type
+        for field in _RULE_TYPE_REQUIRED_FIELDS.get(rule['type'], ()):
+            if field not in rule:
+                raise ConfigurationError(
+                    f"Rule '{rule['name']}' ({rule['type']}) requires '{field}' field"
+                )
     
     def _validate_connection(self, name: str, conn: dict) -> None:
         """Validate a database connection definition."""
         if 'type' not in conn:
             raise ConfigurationError(f"Connection '{name}' missing 'type' field")
             
-        valid_types = ['sqlserver', 'postgres', 'sqlite', 'csv']
-        if conn['type'] not in valid_types:
+        if not isinstance(conn['type'], str) or conn['type'] not in self._VALID_CONN_TYPES:
             raise ConfigurationError(
                 f"Connection '{name}' has invalid type: {conn['type']}. "
-                f"Must be one of: {valid_types}"
+                f"Must be one of: {_CONNECTION_TYPES}"
             )
             
         # Check for unresolved environment variables
@@ -183,6 +221,11 @@ class ConfigLoader:
             'sample_size': 5,
             'parallel_execution': True,
             'max_workers': 4,
+            'min_workers': 2,
+            'pool_ping_after': 60,
+            'result_cache_ttl': 0,
+            'result_cache_size': 1024,
+            'stats_cache_ttl': 0,
             'output_dir': 'reports'
         }
         return {**defaults, **self._config.get('settings', {})}
@@ -8,16 +8,27 @@ Provides connectors for different database types:
 - CSV: Flat file data sources
 """
 
+from types import MappingProxyType
+from typing import Mapping
+
 from src.connectors.base import BaseConnector, ConnectionError, QueryError
+from src.connectors.pool import ConnectorPool
 from src.connectors.sqlserver import SQLServerConnector
+from src.connectors.sqlserver_arrow import SQLServerArrowConnector
 from src.connectors.sqlite import SQLiteConnector
 
 
-# Registry mapping connection types to connector classes
-CONNECTOR_REGISTRY: dict[str, type[BaseConnector]] = {
+# Registry mapping connection types to connector classes (read-only view,
+# so callers cannot accidentally mutate the set of supported connectors)
+CONNECTOR_REGISTRY: Mapping[str, type[BaseConnector]] = MappingProxyType({
     'sqlserver': SQLServerConnector,
     'sqlite': SQLiteConnector,
-}
+})
+
+# Alternative implementations selected by a connection's 'backend' key
+CONNECTOR_BACKENDS: Mapping[tuple[str, str], type[BaseConnector]] = MappingProxyType({
+    ('sqlserver', 'arrow'): SQLServerArrowConnector,
+})
 
 
 def get_connector(connection_type: str) -> type[BaseConnector] | None:
@@ -44,22 +55,66 @@ def create_connector(config: dict) -> BaseConnector:
         Initialized connector instance
         
     Raises:
-        ValueError: If connection type is unknown
+        ValueError: If connection type or backend is unknown
     """
     conn_type = config.get('type')
     if not conn_type:
         raise ValueError("Connection configuration must include 'type' field")
     
-    connector_class = get_connector(conn_type)
+    connector_class = CONNECTOR_REGISTRY.get(conn_type)
     if not connector_class:
         available = list(CONNECTOR_REGISTRY.keys())
         raise ValueError(
             f"Unknown connection type: {conn_type}. Available types: {available}"
         )
     
+    backend = config.get('backend')
+    if backend:
+        connector_class = CONNECTOR_BACKENDS.get((conn_type, backend))
+        if not connector_class:
+            available = [b for t, b in CONNECTOR_BACKENDS if t == conn_type]
+            raise ValueError(
+                f"Unknown backend '{backend}' for {conn_type}. Available backends: {available}"
+            )
+    
     return connector_class(config)
 
 
+def create_pool(
+    config: dict,
+    min_size: int = 1,
+    max_size: int = 4,
+    timeout: float = 30.0,
+    ping_after: float = 60.0
+) -> ConnectorPool:
+    """
+    Create and open a connector pool from configuration.
+    
+    Args:
+        config: Connection configuration with 'type' field
+        min_size: Connectors opened up front
+        max_size: Maximum concurrently open connectors
+        timeout: Seconds to wait for a free connector
+        ping_after: Idle seconds before a connector is tested on reuse
+        
+    Returns:
+        Opened ConnectorPool
+        
+    Raises:
+        ValueError: If connection type or backend is unknown
+        ConnectionError: If connection fails
+    """
+    pool = ConnectorPool(
+        config,
+        min_size=min_size,
+        max_size=max_size,
+        timeout=timeout,
+        ping_after=ping_after
+    )
+    pool.open()
+    return pool
+
+
 def list_connector_types() -> list[str]:
     """Return list of available connector types."""
     return list(CONNECTOR_REGISTRY.keys())
@@ -69,10 +124,14 @@ __all__ = [
     'BaseConnector',
     'ConnectionError',
     'QueryError',
+    'ConnectorPool',
     'SQLServerConnector',
+    'SQLServerArrowConnector',
     'SQLiteConnector',
     'CONNECTOR_REGISTRY',
+    'CONNECTOR_BACKENDS',
     'get_connector',
     'create_connector',
+    'create_pool',
     'list_connector_types',
 ]
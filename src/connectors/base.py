@@ -6,7 +6,9 @@ the connection and query execution methods.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any
+from contextlib import contextmanager
+from itertools import repeat
+from typing import Any, Iterator
 
 
 class ConnectionError(Exception):
@@ -32,6 +34,14 @@ class BaseConnector(ABC):
     
     connector_type: str = "base"  # Override in subclasses
     
+    # SQL dialect of generated queries; validators key cached SQL on it.
+    # The default matches quote_identifier's SQL Server [brackets].
+    dialect: str = "mssql"
+    
+    # Whether one instance may be shared by concurrent worker threads.
+    # ConnectorPool opens a separate connector per worker when False.
+    thread_safe: bool = False
+    
     def __init__(self, config: dict):
         """
         Initialize connector with configuration.
@@ -66,15 +76,68 @@ class BaseConnector(ABC):
         Args:
             query: SQL query string
             params: Optional query parameters
-            
+        
         Returns:
             List of dictionaries, one per row
-            
+        
         Raises:
             QueryError: If query execution fails
         """
         pass
     
+    def execute_query_iter(self, query: str, params: dict | None = None) -> Iterator[dict]:
+        """
+        Execute a SQL query and yield result rows one at a time.
+        
+        Default implementation materializes via execute_query(); connectors
+        that can stream from the cursor override this.
+        
+        Args:
+            query: SQL query string
+            params: Optional query parameters
+        
+        Yields:
+            One dictionary per row
+        
+        Raises:
+            QueryError: If query execution fails
+        """
+        yield from self.execute_query(query, params)
+    
+    def execute_batch(self, queries: list[str]) -> list[list[dict]]:
+        """
+        Execute several independent SELECT queries and return each result.
+        
+        Default implementation runs the queries one by one; connectors
+        whose driver can return multiple result sets from one statement
+        override this to send the whole batch in a single round trip.
+        
+        Args:
+            queries: SQL query strings (no trailing semicolons)
+        
+        Returns:
+            One list of row dictionaries per query, in order
+        
+        Raises:
+            QueryError: If any query fails
+        """
+        return [self.execute_query(query) for query in queries]
+    
+    @contextmanager
+    def session(self) -> Iterator['BaseConnector']:
+        """
+        Run several queries from the current thread on one connection.
+        
+        Connectors with an internal connection pool override this to
+        keep the same pooled connection checked out for the block,
+        instead of acquiring and releasing one per query. The default
+        (one connection per connector) has nothing to bind.
+        
+        Yields:
+            This connector
+        """
+        yield self
+    
     @abstractmethod
     def test_connection(self) -> bool:
         """
@@ -94,7 +157,7 @@ class BaseConnector(ABC):
         
         Args:
             name: Table or column name
-            
+        
         Returns:
             Safely quoted identifier
         """
@@ -102,6 +165,38 @@ class BaseConnector(ABC):
         clean_name = name.strip('[]"\'`')
         return f'[{clean_name}]'
     
+    def get_table_version(self, table: str) -> Any:
+        """
+        Return a token that changes whenever the table's data changes.
+        
+        Used by RuleEngine's result cache to decide whether a cached
+        validation result is still valid. The default returns None
+        (version unknown), which disables caching for the table.
+        
+        Args:
+            table: Table name
+        
+        Returns:
+            Hashable version token, or None if it cannot be determined
+        """
+        return None
+    
+    def estimate_row_count(self, table: str) -> int | None:
+        """
+        Return a cheap estimate of the table's row count.
+        
+        Read from catalog statistics rather than counting rows, so the
+        result may be slightly stale. The default returns None (no
+        estimate available).
+        
+        Args:
+            table: Table name
+        
+        Returns:
+            Estimated number of rows, or None if unknown
+        """
+        return None
+    
     @property
     def is_connected(self) -> bool:
         """Check if currently connected."""
@@ -117,19 +212,59 @@ class BaseConnector(ABC):
         self.disconnect()
         return False  # Don't suppress exceptions
     
-    def _rows_to_dicts(self, cursor, rows: list) -> list[dict]:
+    def _fetch_dicts(self, cursor, batch_size: int = 1000) -> list[dict]:
         """
-        Convert database rows to list of dictionaries.
+        Fetch all remaining rows from a cursor as dictionaries.
+        
+        Rows are pulled with fetchmany() in batches, so the raw result set
+        and its dict conversion are never held in memory at the same time.
+        Column names are resolved once per query rather than per row, and
+        each batch is converted with map() so the per-row dict/zip calls
+        run without a Python-level loop body.
         
         Args:
-            cursor: Database cursor with description
-            rows: List of row tuples
-            
+            cursor: Database cursor positioned after execute()
+            batch_size: Number of rows to fetch per round trip
+        
         Returns:
-            List of dictionaries with column names as keys
+            List of dictionaries with column names as keys (empty if the
+            statement produced no result set)
         """
-        if not rows:
+        # description is a driver property; read it once. None means the
+        # statement produced no result set.
+        description = cursor.description
+        if description is None:
             return []
-            
-        columns = [desc[0] for desc in cursor.description]
-        return [dict(zip(columns, row)) for row in rows]
+        
+        columns = tuple(desc[0] for desc in description)
+        records = []
+        while True:
+            batch = cursor.fetchmany(batch_size)
+            if not batch:
+                break
+            records.extend(map(dict, map(zip, repeat(columns), batch)))
+        return records
+    
+    def _iter_dicts(self, cursor, batch_size: int = 1000) -> Iterator[dict]:
+        """
+        Yield remaining cursor rows as dictionaries without materializing.
+        
+        Same batching as _fetch_dicts, but only one batch is held at a time.
+        
+        Args:
+            cursor: Database cursor positioned after execute()
+            batch_size: Number of rows to fetch per round trip
+        
+        Yields:
+            One dictionary per row, with column names as keys
+        """
+        description = cursor.description
+        if description is None:
+            return
+        
+        columns = tuple(desc[0] for desc in description)
+        while True:
+            batch = cursor.fetchmany(batch_size)
+            if not batch:
+                break
+            yield from map(dict, map(zip, repeat(columns), batch))
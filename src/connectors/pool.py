@@ -0,0 +1,200 @@
+"""
+Connector pool - shares database connections between worker threads.
+
+RuleEngine checks out one connector per rule from a ConnectorPool, so
+parallel workers never queue behind a single driver connection.
+"""
+
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from src.connectors.base import BaseConnector, ConnectionError
+
+
+class ConnectorPool:
+    """
+    Bounded pool of connected connectors for one connection config.
+    
+    min_size connectors are opened up front; more are opened on demand
+    up to max_size, after which acquire() waits for one to be returned.
+    
+    Connectors that are thread-safe (e.g. SQLite, which pools its own
+    connections internally) are not duplicated: every caller shares one
+    instance, sized by the connector's own settings.
+    
+    A pool can stay open between runs. Connectors that sat idle for
+    longer than ping_after seconds are checked with test_connection()
+    before being handed out, and replaced if the server dropped them.
+    
+    Example:
+        
+        pool = create_pool(conn_config, min_size=2, max_size=8)
+        try:
+            with pool.acquire() as connector:
+                rows = connector.execute_query("SELECT 1")
+        finally:
+            pool.close()
+    """
+    
+    def __init__(
+        self,
+        config: dict,
+        min_size: int = 1,
+        max_size: int = 4,
+        timeout: float = 30.0,
+        ping_after: float = 60.0
+    ):
+        """
+        Initialize connector pool (no connections are opened yet).
+        
+        Args:
+            config: Connection configuration with 'type' field
+            min_size: Connectors opened by open()
+            max_size: Upper bound on concurrently open connectors
+            timeout: Seconds acquire() waits for a free connector
+            ping_after: Idle seconds after which a connector is tested
+                before reuse
+        """
+        self.config = config
+        self.max_size = max(1, max_size)
+        self.min_size = max(1, min(min_size, self.max_size))
+        self.timeout = timeout
+        self.ping_after = ping_after
+        
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._connectors: list[BaseConnector] = []
+        self._lock = threading.Lock()
+        self._shared: BaseConnector | None = None
+        self._closed = True
+    
+    @property
+    def size(self) -> int:
+        """Number of connectors currently open."""
+        return len(self._connectors)
+    
+    @property
+    def closed(self) -> bool:
+        """Whether the pool is closed (not yet opened, or shut down)."""
+        return self._closed
+    
+    def open(self) -> None:
+        """
+        Open the initial connectors.
+        
+        The first connector is opened eagerly so connection errors
+        surface here rather than on the first query.
+        
+        Raises:
+            ConnectionError: If connection fails
+        """
+        self._closed = False
+        try:
+            connector = self._new_connector()
+            if connector.thread_safe:
+                self._shared = connector
+                return
+            
+            self._release(connector)
+            for _ in range(self.min_size - 1):
+                self._release(self._new_connector())
+        except Exception:
+            self.close()
+            raise
+    
+    def _new_connector(self) -> BaseConnector:
+        """Create, connect and track a new connector."""
+        # Imported here to avoid a cycle with the package __init__
+        from src.connectors import create_connector
+        
+        connector = create_connector(self.config)
+        connector.connect()
+        self._connectors.append(connector)
+        return connector
+    
+    @contextmanager
+    def acquire(self) -> Iterator[BaseConnector]:
+        """
+        Borrow a connector for the duration of the block.
+        
+        Yields:
+            Connected connector reserved for the caller
+        
+        Raises:
+            ConnectionError: If the pool is closed or no connector
+                becomes available within the timeout
+        """
+        if self._closed:
+            raise ConnectionError("Connector pool is closed")
+        
+        if self._shared is not None:
+            yield self._shared
+            return
+        
+        try:
+            connector, released_at = self._idle.get_nowait()
+        except queue.Empty:
+            connector = None
+            with self._lock:
+                if len(self._connectors) < self.max_size:
+                    connector = self._new_connector()
+                    released_at = time.monotonic()
+            if connector is None:
+                try:
+                    connector, released_at = self._idle.get(timeout=self.timeout)
+                except queue.Empty:
+                    raise ConnectionError("Timed out waiting for a pooled connection")
+        
+        if time.monotonic() - released_at > self.ping_after:
+            connector = self._revalidate(connector)
+        
+        try:
+            yield connector
+        finally:
+            self._release(connector)
+    
+    def _release(self, connector: BaseConnector) -> None:
+        """Return a connector to the idle queue."""
+        self._idle.put((connector, time.monotonic()))
+    
+    def _revalidate(self, connector: BaseConnector) -> BaseConnector:
+        """Replace a connector that no longer answers a test query."""
+        if connector.test_connection():
+            return connector
+        
+        with self._lock:
+            self._connectors.remove(connector)
+        try:
+            connector.disconnect()
+        except Exception:
+            pass
+
+        # The dropped connector no longer counts towards max_size, so a
+        # failed reconnect leaves its slot free for the next caller
+        with self._lock:
+            return self._new_connector()
+
+    def close(self) -> None:
+        """Disconnect every connector opened by the pool."""
+        self._closed = True
+        with self._lock:
+            connectors, self._connectors = self._connectors, []
+        for connector in connectors:
+            try:
+                connector.disconnect()
+            except Exception:
+                pass
+        
+        self._idle = queue.LifoQueue()
+        self._shared = None
+    
+    def __enter__(self) -> 'ConnectorPool':
+        """Context manager entry - open the pool."""
+        self.open()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit - close all connectors."""
+        self.close()
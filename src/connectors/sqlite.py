@@ -5,26 +5,228 @@ SQLite is useful for local development, testing, and demos without
 requiring a full database server setup.
 """
 
+import functools
+import math
+import os
+import queue
+import re
 import sqlite3
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 from src.connectors.base import BaseConnector, ConnectionError, QueryError
 
 
+# SQL Server constructs rewritten by _adapt_query
+_BRACKET_RE = re.compile(r'\[([^\]]+)\]', re.IGNORECASE)
+_DATEADD_RE = re.compile(
+    r"DATEADD\s*\(\s*(\w+)\s*,\s*(-?\d+)\s*,\s*(?:GETDATE\(\)|datetime\('now'\))\s*\)",
+    re.IGNORECASE
+)
+_TOP_RE = re.compile(r'SELECT\s+TOP\s+(\d+)\s+', re.IGNORECASE)
+_OFFSET_FETCH_RE = re.compile(
+    r'OFFSET\s+(\d+)\s+ROWS\s+FETCH\s+(?:NEXT|FIRST)\s+(\d+)\s+ROWS\s+ONLY',
+    re.IGNORECASE
+)
+_ISNULL_RE = re.compile(r'\bISNULL\s*\(', re.IGNORECASE)
+
+# Substrings (upper-cased) that indicate a query may need adapting
+_ADAPT_MARKERS = ('[', 'GETDATE', 'DATEADD', 'TOP', 'OFFSET', 'ISNULL')
+
+
+@functools.lru_cache(maxsize=512)
+def _adapt_query_cached(query: str) -> str:
+    """
+    Rewrite SQL Server constructs to SQLite syntax.
+    
+    Pure function of the query text, so repeated validator queries are
+    served from the cache instead of re-running the regex passes.
+    """
+    # Most validator queries are already SQLite-compatible; skip the
+    # regex passes entirely when no SQL Server construct is present
+    upper = query.upper()
+    if not any(marker in upper for marker in _ADAPT_MARKERS):
+        return query
+    
+    adapted = query
+    
+    # Replace bracket quoting with double quotes
+    adapted = _BRACKET_RE.sub(r'"\1"', adapted)
+    
+    # Replace GETDATE() with SQLite equivalent
+    adapted = adapted.replace('GETDATE()', "datetime('now')")
+    adapted = adapted.replace('getdate()', "datetime('now')")
+    
+    # Replace DATEADD
+    # DATEADD(month, -6, GETDATE()) -> datetime('now', '-6 months')
+    def dateadd_replace(match):
+        unit = match.group(1).lower()
+        amount = match.group(2)
+        # Map SQL Server units to SQLite
+        unit_map = {'month': 'months', 'day': 'days', 'year': 'years', 'hour': 'hours'}
+        sqlite_unit = unit_map.get(unit, unit + 's')
+        return f"datetime('now', '{amount} {sqlite_unit}')"
+    adapted = _DATEADD_RE.sub(dateadd_replace, adapted)
+    
+    # Handle TOP N (simple cases)
+    top_match = _TOP_RE.search(adapted)
+    if top_match:
+        limit_val = top_match.group(1)
+        adapted = _TOP_RE.sub('SELECT ', adapted)
+        # Add LIMIT at end if not already present
+        if 'LIMIT' not in adapted.upper():
+            adapted = adapted.rstrip(';') + f' LIMIT {limit_val}'
+    
+    # Handle OFFSET FETCH (convert to LIMIT OFFSET)
+    def offset_fetch_replace(match):
+        offset = match.group(1)
+        limit = match.group(2)
+        return f'LIMIT {limit} OFFSET {offset}'
+    adapted = _OFFSET_FETCH_RE.sub(offset_fetch_replace, adapted)
+    
+    # Replace ISNULL with COALESCE
+    adapted = _ISNULL_RE.sub('COALESCE(', adapted)
+    
+    return adapted
+
+
+def _concat_ws(separator, *values):
+    """SQL Server CONCAT_WS: join non-NULL values with a separator."""
+    if separator is None:
+        return None
+    return separator.join(str(v) for v in values if v is not None)
+    
+
+@functools.lru_cache(maxsize=256)
+def _compile_regexp(pattern: str) -> re.Pattern:
+    """Compiled REGEXP pattern, reused across rows and queries."""
+    return re.compile(pattern)
+
+
+def _regexp(pattern, value):
+    """SQLite REGEXP operator (value REGEXP pattern): re.search semantics."""
+    if pattern is None or value is None:
+        return None
+    return _compile_regexp(pattern).search(str(value)) is not None
+
+
+# Idle connections that only read PRAGMA data_version, one per database
+# file and shared by every connector on it: path -> (lock, inode,
+# connection). See SQLiteConnector.get_table_version.
+_VERSION_WATCHERS: dict[str, tuple[threading.Lock, int, sqlite3.Connection]] = {}
+_VERSION_WATCHERS_LOCK = threading.Lock()
+
+
+def _data_version(path: str, timeout: float) -> tuple[int, int]:
+    """
+    Read (inode, PRAGMA data_version) for a database file.
+    
+    The watcher connection is reopened if the file has been replaced,
+    since it would otherwise keep reading the old file.
+    """
+    inode = os.stat(path).st_ino
+    with _VERSION_WATCHERS_LOCK:
+        watcher = _VERSION_WATCHERS.get(path)
+        if watcher is None or watcher[1] != inode:
+            if watcher is not None:
+                watcher[2].close()
+            connection = sqlite3.connect(path, timeout=timeout, check_same_thread=False)
+            watcher = (threading.Lock(), inode, connection)
+            _VERSION_WATCHERS[path] = watcher
+    
+    lock, _, connection = watcher
+    with lock:
+        return inode, connection.execute("PRAGMA data_version").fetchone()[0]
+
+
+class _Stdev:
+    """SQL Server STDEV aggregate: sample standard deviation, NULLs ignored."""
+    
+    def __init__(self):
+        # Welford's online algorithm, numerically stable in one pass
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+    
+    def step(self, value):
+        if value is None:
+            return
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+    
+    def finalize(self):
+        if self.count < 2:
+            return None
+        return math.sqrt(self.m2 / (self.count - 1))
+
+
+@dataclass(slots=True, frozen=True)
+class SQLiteConfig:
+    """Typed SQLite connection settings, resolved once per connector."""
+    
+    path: str = ':memory:'
+    timeout: float = 30.0
+    cached_statements: int = 256
+    pool_size: int = 4
+    read_only: bool = False
+    foreign_keys: bool = False
+    
+    @classmethod
+    def from_dict(cls, config: dict) -> 'SQLiteConfig':
+        """
+        Build settings from a connection configuration dictionary.
+        
+        Args:
+            config: Connection configuration (unknown keys are ignored)
+            
+        Returns:
+            SQLiteConfig with defaults for missing options
+        """
+        path = str(config.get('path', ':memory:'))
+        pool_size = 1 if path == ':memory:' else max(1, int(config.get('pool_size', 4)))
+        return cls(
+            path=path,
+            timeout=float(config.get('timeout', 30)),
+            cached_statements=int(config.get('cached_statements', 256)),
+            pool_size=pool_size,
+            read_only=bool(config.get('read_only', False)),
+            foreign_keys=bool(config.get('foreign_keys', False)),
+        )
+
+
 class SQLiteConnector(BaseConnector):
     """
     Connector for SQLite databases.
     
+    Queries run on a small pool of connections so that parallel rule
+    execution does not serialize on a single cursor. Connections are
+    opened lazily, up to pool_size, and handed out via acquire().
+    
     Configuration options:
         path: Path to SQLite database file
         timeout: Connection timeout in seconds (default: 30)
+        cached_statements: Size of sqlite3's prepared statement cache
+            (default: 256)
+        pool_size: Maximum number of pooled connections (default: 4).
+            In-memory databases always use a single connection, since
+            each new connection would open a separate, empty database.
+        read_only: Set PRAGMA query_only on pooled connections
+            (default: false)
+        foreign_keys: Enforce foreign key constraints (default: false).
+            Validation queries only read, so the PRAGMA is skipped unless
+            enabled.
         
     Example configuration:
     
         local_db:
           type: sqlite
           path: ./data/test.db
+          pool_size: 4
           
         memory_db:
           type: sqlite
@@ -32,54 +234,177 @@ class SQLiteConnector(BaseConnector):
     """
     
     connector_type = "sqlite"
+    dialect = "sqlite"
+    thread_safe = True  # Queries run on pooled per-call connections
     
     def __init__(self, config: dict):
         """Initialize SQLite connector."""
         super().__init__(config)
-        self._cursor = None
+        self.cfg = SQLiteConfig.from_dict(config)
+        self._dir_checked = False
+        self._pool: queue.Queue | None = None
+        self._pool_lock = threading.Lock()
+        self._cursors: list[sqlite3.Cursor] = []
+        
+        # Cursor bound to the calling thread by session()
+        self._session = threading.local()
     
     def connect(self) -> None:
         """Establish connection to SQLite database."""
         try:
-            db_path = self.config.get('path', ':memory:')
-            timeout = self.config.get('timeout', 30)
+            db_path = self.cfg.path
             
-            # Create parent directories if needed (unless in-memory)
-            if db_path != ':memory:':
-                path = Path(db_path)
-                path.parent.mkdir(parents=True, exist_ok=True)
+            # Create parent directories if needed (unless in-memory).
+            # Only done on the first connect; reconnects skip the stat calls.
+            if not self._dir_checked and db_path != ':memory:':
+                Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+                self._dir_checked = True
             
-            self._connection = sqlite3.connect(db_path, timeout=timeout)
+            self._pool = queue.Queue(maxsize=self.cfg.pool_size)
+            self._cursors = []
             
-            # Enable foreign keys
-            self._connection.execute("PRAGMA foreign_keys = ON")
+            # Open the first connection eagerly so connection errors
+            # surface here rather than on the first query
+            cursor = self._open_cursor()
+            self._connection = cursor.connection
             
-            # Return rows as sqlite3.Row for dict-like access
-            self._connection.row_factory = sqlite3.Row
+            # WAL lets pooled readers proceed alongside a writer. The mode
+            # is persistent for the database file, so it is set once here.
+            if self.cfg.pool_size > 1:
+                try:
+                    self._connection.execute("PRAGMA journal_mode = WAL")
+                except sqlite3.Error:
+                    pass  # e.g. read-only file; default journal still works
             
-            self._cursor = self._connection.cursor()
+            self._pool.put(cursor)
             self._connected = True
             
         except sqlite3.Error as e:
+            self._close_all()
             raise ConnectionError(f"Failed to connect to SQLite: {e}")
     
+    def _open_cursor(self) -> sqlite3.Cursor:
+        """Open a new pooled connection and return its cursor."""
+        cfg = self.cfg
+        
+        # Adapted query strings are memoized, so repeat validation
+        # queries hit sqlite3's statement cache instead of re-preparing.
+        # Pooled connections are handed between worker threads, but only
+        # ever used by one thread at a time.
+        connection = sqlite3.connect(
+            cfg.path,
+            timeout=cfg.timeout,
+            cached_statements=cfg.cached_statements,
+            check_same_thread=False,
+        )
+        
+        # FK enforcement only matters for writes; skip the round trip
+        # on each pooled connection unless requested
+        if cfg.foreign_keys:
+            connection.execute("PRAGMA foreign_keys = ON")
+        
+        if cfg.read_only:
+            connection.execute("PRAGMA query_only = ON")
+        
+        # SQLite has no CONCAT_WS or STDEV; provide SQL Server's
+        # semantics so validator queries run unchanged. REGEXP is an
+        # operator without a built-in implementation.
+        connection.create_function("CONCAT_WS", -1, _concat_ws, deterministic=True)
+        connection.create_function("REGEXP", 2, _regexp, deterministic=True)
+        connection.create_aggregate("STDEV", 1, _Stdev)
+        
+        # Plain tuple rows: _fetch_dicts maps them to dicts by column
+        # name in one pass, so a sqlite3.Row factory would only add a
+        # second per-row object
+        
+        cursor = connection.cursor()
+        self._cursors.append(cursor)
+        return cursor
+    
+    @contextmanager
+    def acquire(self) -> Iterator[sqlite3.Cursor]:
+        """
+        Borrow a cursor from the connection pool.
+        
+        A new connection is opened if none is idle and the pool has not
+        reached pool_size; otherwise waits for one to be returned.
+        
+        Yields:
+            Cursor on a connection reserved for the caller
+            
+        Raises:
+            ConnectionError: If no connection becomes available in time
+        """
+        bound = getattr(self._session, 'cursor', None)
+        if bound is not None:
+            yield bound
+            return
+        
+        if not self._connected:
+            self.connect()
+        
+        pool = self._pool
+        try:
+            cursor = pool.get_nowait()
+        except queue.Empty:
+            cursor = None
+            with self._pool_lock:
+                if len(self._cursors) < self.cfg.pool_size:
+                    try:
+                        cursor = self._open_cursor()
+                    except sqlite3.Error as e:
+                        raise ConnectionError(f"Failed to connect to SQLite: {e}")
+            if cursor is None:
+                try:
+                    cursor = pool.get(timeout=self.cfg.timeout)
+                except queue.Empty:
+                    raise ConnectionError("Timed out waiting for a pooled SQLite connection")
+        
+        try:
+            yield cursor
+        finally:
+            pool.put(cursor)
+    
+    @contextmanager
+    def session(self) -> Iterator['SQLiteConnector']:
+        """
+        Keep one pooled connection checked out for the calling thread.
+        
+        Queries run inside the block (including nested sessions) reuse
+        it instead of going back to the pool between queries.
+        """
+        if getattr(self._session, 'cursor', None) is not None:
+            yield self
+            return
+        
+        with self.acquire() as cursor:
+            self._session.cursor = cursor
+            try:
+                yield self
+            finally:
+                self._session.cursor = None
+    
     def disconnect(self) -> None:
-        """Close SQLite connection."""
-        if self._cursor:
+        """Close all pooled SQLite connections."""
+        self._close_all()
+        self._connected = False
+    
+    def _close_all(self) -> None:
+        """Close every connection opened by the pool."""
+        for cursor in self._cursors:
+            connection = cursor.connection
             try:
-                self._cursor.close()
+                cursor.close()
             except Exception:
                 pass
-            self._cursor = None
-            
-        if self._connection:
             try:
-                self._connection.close()
+                connection.close()
             except Exception:
                 pass
-            self._connection = None
-            
-        self._connected = False
+        
+        self._cursors = []
+        self._pool = None
+        self._connection = None
     
     def execute_query(self, query: str, params: dict | None = None) -> list[dict]:
         """
@@ -88,32 +413,57 @@ class SQLiteConnector(BaseConnector):
         Note: SQLite has limited SQL syntax compared to SQL Server.
         Some queries may need adjustment.
         """
-        if not self._connected:
-            self.connect()
-        
         # Adapt SQL Server syntax to SQLite
         adapted_query = self._adapt_query(query)
         
-        try:
-            if params:
-                self._cursor.execute(adapted_query, params)
-            else:
-                self._cursor.execute(adapted_query)
-            
-            rows = self._cursor.fetchall()
-            return [dict(row) for row in rows]
+        with self.acquire() as cursor:
+            try:
+                if params:
+                    cursor.execute(adapted_query, params)
+                else:
+                    cursor.execute(adapted_query)
+                
+                return self._fetch_dicts(cursor)
+                
+            except sqlite3.Error as e:
+                raise QueryError(f"Query execution failed: {e}\nQuery: {adapted_query[:500]}")
+    
+    def execute_query_iter(self, query: str, params: dict | None = None) -> Iterator[dict]:
+        """
+        Execute SQL query and stream results one row at a time.
+        
+        Rows are stepped from the cursor in batches, so large result sets
+        are never fully buffered in memory. The pooled connection stays
+        checked out until the iterator is exhausted or closed.
+        
+        Args:
+            query: SQL query string
+            params: Optional named parameters
+        
+        Yields:
+            Row dictionaries
+        """
+        adapted_query = self._adapt_query(query)
+        
+        with self.acquire() as cursor:
+            try:
+                if params:
+                    cursor.execute(adapted_query, params)
+                else:
+                    cursor.execute(adapted_query)
+                
+                yield from self._iter_dicts(cursor)
             
-        except sqlite3.Error as e:
-            raise QueryError(f"Query execution failed: {e}\nQuery: {adapted_query[:500]}")
+            except sqlite3.Error as e:
+                raise QueryError(f"Query execution failed: {e}\nQuery: {adapted_query[:500]}")
     
     def test_connection(self) -> bool:
         """Test if connection is working."""
         try:
-            if not self._connected:
-                self.connect()
-            self._cursor.execute("SELECT 1 AS test")
-            result = self._cursor.fetchone()
-            return result is not None and result['test'] == 1
+            with self.acquire() as cursor:
+                cursor.execute("SELECT 1 AS test")
+                result = cursor.fetchone()
+            return result is not None and result[0] == 1
         except Exception:
             return False
     
@@ -131,58 +481,48 @@ class SQLiteConnector(BaseConnector):
         - GETDATE() -> datetime('now')
         - TOP N -> LIMIT N
         - OFFSET/FETCH -> LIMIT/OFFSET
+        
+        Results are memoized per query string (see _adapt_query_cached).
+        """
+        return _adapt_query_cached(query)
+    
+    def get_table_version(self, table: str) -> tuple | None:
         """
-        adapted = query
-        
-        # Replace bracket quoting with double quotes
-        import re
-        adapted = re.sub(r'\[([^\]]+)\]', r'"\1"', adapted)
-        
-        # Replace GETDATE() with SQLite equivalent
-        adapted = adapted.replace('GETDATE()', "datetime('now')")
-        adapted = adapted.replace('getdate()', "datetime('now')")
-        
-        # Replace DATEADD
-        # DATEADD(month, -6, GETDATE()) -> datetime('now', '-6 months')
-        dateadd_pattern = r"DATEADD\s*\(\s*(\w+)\s*,\s*(-?\d+)\s*,\s*(?:GETDATE\(\)|datetime\('now'\))\s*\)"
-        def dateadd_replace(match):
-            unit = match.group(1).lower()
-            amount = match.group(2)
-            # Map SQL Server units to SQLite
-            unit_map = {'month': 'months', 'day': 'days', 'year': 'years', 'hour': 'hours'}
-            sqlite_unit = unit_map.get(unit, unit + 's')
-            return f"datetime('now', '{amount} {sqlite_unit}')"
-        adapted = re.sub(dateadd_pattern, dateadd_replace, adapted, flags=re.IGNORECASE)
-        
-        # Handle TOP N (simple cases)
-        top_pattern = r'SELECT\s+TOP\s+(\d+)\s+'
-        def top_replace(match):
-            return f'SELECT '
-        top_match = re.search(top_pattern, adapted, re.IGNORECASE)
-        if top_match:
-            limit_val = top_match.group(1)
-            adapted = re.sub(top_pattern, 'SELECT ', adapted, flags=re.IGNORECASE)
-            # Add LIMIT at end if not already present
-            if 'LIMIT' not in adapted.upper():
-                adapted = adapted.rstrip(';') + f' LIMIT {limit_val}'
-        
-        # Handle OFFSET FETCH (convert to LIMIT OFFSET)
-        offset_fetch_pattern = r'OFFSET\s+(\d+)\s+ROWS\s+FETCH\s+(?:NEXT|FIRST)\s+(\d+)\s+ROWS\s+ONLY'
-        def offset_fetch_replace(match):
-            offset = match.group(1)
-            limit = match.group(2)
-            return f'LIMIT {limit} OFFSET {offset}'
-        adapted = re.sub(offset_fetch_pattern, offset_fetch_replace, adapted, flags=re.IGNORECASE)
-        
-        # Replace CONCAT_WS (SQLite doesn't have it directly)
-        # This is a simplified replacement
-        concat_ws_pattern = r"CONCAT_WS\s*\(\s*'([^']+)'\s*,\s*(.+?)\)"
-        # For now, we'll skip this complex replacement and let it fail gracefully
-        
-        # Replace ISNULL with COALESCE
-        adapted = re.sub(r'\bISNULL\s*\(', 'COALESCE(', adapted, flags=re.IGNORECASE)
-        
-        return adapted
+        Version token for the database file, from PRAGMA data_version.
+        
+        data_version changes whenever another connection, in this or
+        any other process, commits to the database. It is read on an
+        idle connection shared by every connector on the same file (see
+        _data_version), which never writes itself, so every commit is
+        seen and all connectors report comparable versions. SQLite keeps
+        no per-table change counter, so any commit changes every table's
+        version. Uncommitted writes do not change it.
+        """
+        if self.cfg.path == ':memory:':
+            return None
+        
+        try:
+            return _data_version(os.path.abspath(self.cfg.path), self.cfg.timeout)
+        except (OSError, sqlite3.Error):
+            return None
+    
+    def estimate_row_count(self, table: str) -> int | None:
+        """
+        Upper bound on the row count from the largest rowid.
+        
+        MAX(rowid) is a single b-tree lookup. Deleted rows make it an
+        overestimate; WITHOUT ROWID tables return None.
+        """
+        try:
+            rows = self.execute_query(
+                f"SELECT MAX(rowid) AS row_count FROM {self.quote_identifier(table)}"
+            )
+        except QueryError:
+            return None
+        
+        if not rows:
+            return None
+        return int(rows[0]['row_count'] or 0)
     
     def get_tables(self) -> list[str]:
         """Get list of tables in the database."""
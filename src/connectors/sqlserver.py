@@ -5,12 +5,99 @@ Supports both Windows Authentication (trusted connection) and
 SQL Server Authentication (username/password).
 """
 
-import pyodbc
-from typing import Any
+import struct
+import time
+from typing import Any, Iterator
 
 from src.connectors.base import BaseConnector, ConnectionError, QueryError
 
 
+# pyodbc is imported on first connect (see _import_pyodbc), so commands
+# that never talk to SQL Server, e.g. --dry-run or SQLite runs, skip
+# loading the ODBC driver manager
+pyodbc = None
+
+# ODBC connection attribute for the TDS packet size, used when pyodbc
+# does not export it (older releases)
+_SQL_ATTR_PACKET_SIZE_DEFAULT = 112
+
+
+def _import_pyodbc():
+    """Import pyodbc into the module namespace on first use."""
+    global pyodbc
+    if pyodbc is None:
+        try:
+            import pyodbc as _pyodbc
+        except ImportError as e:
+            raise ConnectionError(
+                f"SQL Server connections require pyodbc (pip install pyodbc): {e}"
+            )
+        pyodbc = _pyodbc
+    return pyodbc
+
+
+# Raw ODBC layouts handed to output converters: SQL_TIMESTAMP_STRUCT
+# (year, month, day, hour, minute, second, fraction in ns) and
+# SQL_DATE_STRUCT (year, month, day)
+_TIMESTAMP_STRUCT = struct.Struct('<6hI')
+_DATE_STRUCT = struct.Struct('<3h')
+
+
+def _timestamp_to_str(raw: bytes | None) -> str | None:
+    """Format a raw SQL timestamp exactly like str(datetime)."""
+    if raw is None:
+        return None
+    year, month, day, hour, minute, second, fraction = _TIMESTAMP_STRUCT.unpack(raw)
+    text = f'{year:04d}-{month:02d}-{day:02d} {hour:02d}:{minute:02d}:{second:02d}'
+    micro = fraction // 1000
+    return f'{text}.{micro:06d}' if micro else text
+
+
+def _date_to_str(raw: bytes | None) -> str | None:
+    """Format a raw SQL date exactly like str(date)."""
+    if raw is None:
+        return None
+    year, month, day = _DATE_STRUCT.unpack(raw)
+    return f'{year:04d}-{month:02d}-{day:02d}'
+
+
+# Column metadata lookup used by get_columns()
+_COLUMNS_QUERY = """
+    SELECT 
+        COLUMN_NAME,
+        DATA_TYPE,
+        IS_NULLABLE,
+        CHARACTER_MAXIMUM_LENGTH,
+        NUMERIC_PRECISION,
+        NUMERIC_SCALE
+    FROM INFORMATION_SCHEMA.COLUMNS
+    WHERE TABLE_NAME = ?
+    ORDER BY ORDINAL_POSITION
+"""
+
+# Last recorded write and current row count, used as a data version
+_TABLE_VERSION_QUERY = """
+    SELECT
+        (SELECT MAX(last_user_update)
+         FROM sys.dm_db_index_usage_stats
+         WHERE database_id = DB_ID() AND object_id = OBJECT_ID(?)) AS last_update,
+        (SELECT SUM(row_count)
+         FROM sys.dm_db_partition_stats
+         WHERE object_id = OBJECT_ID(?) AND index_id IN (0, 1)) AS row_count
+"""
+
+# Rows in the heap or clustered index, from partition metadata
+_ROW_COUNT_QUERY = """
+    SELECT SUM(row_count) AS row_count
+    FROM sys.dm_db_partition_stats
+    WHERE object_id = OBJECT_ID(?) AND index_id IN (0, 1)
+"""
+
+# Statements sent per execute_batch() round trip, so one huge batch
+# does not hold a single result stream open for the whole run
+_MAX_BATCH_STATEMENTS = 32
+
+
 class SQLServerConnector(BaseConnector):
     """
     Connector for Microsoft SQL Server databases.
@@ -24,16 +111,23 @@ class SQLServerConnector(BaseConnector):
         password: SQL Server login password
         driver: ODBC driver name (default: auto-detect)
         timeout: Connection timeout in seconds (default: 30)
-        
-    Example configurations:
+        arraysize: Rows fetched per round trip (default: 10000)
+        packet_size: TDS network packet size in bytes (default: 32768)
+        metadata_cache_ttl: Seconds to cache INFORMATION_SCHEMA lookups
+            (default: 300, 0 disables caching)
+        datetime_strings: Return DATE/DATETIME values as strings decoded
+            straight from the driver buffer, instead of building datetime
+            objects that reports only stringify again (default: True)
     
+    Example configurations:
+        
         # Windows Authentication
         sqlserver_prod:
           type: sqlserver
           host: server.domain.com
           database: production
           trusted_connection: true
-          
+        
         # SQL Authentication
         sqlserver_dev:
           type: sqlserver
@@ -53,17 +147,54 @@ class SQLServerConnector(BaseConnector):
         'SQL Server',
     ]
     
+    # Detected driver, shared by all instances (installed drivers do not
+    # change while the process runs)
+    _driver_cache: str | None = None
+    
     def __init__(self, config: dict):
         """Initialize SQL Server connector."""
         super().__init__(config)
         self._cursor = None
+        self._columns_cursor = None  # Dedicated, pre-typed cursor for get_columns
+        self.arraysize = int(config.get('arraysize', 10000))
+        self.datetime_strings = bool(config.get('datetime_strings', True))
+        
+        # INFORMATION_SCHEMA cache: table list plus columns per table,
+        # each entry stored with the monotonic time it was loaded
+        self._metadata_ttl = float(config.get('metadata_cache_ttl', 300))
+        self._tables_cache: tuple[float, list[str]] | None = None
+        self._columns_cache: dict[str, tuple[float, list[dict]]] = {}
+        
+        # Connection string plus the config snapshot it was built from
+        self._conn_str_cache: tuple[tuple, str] | None = None
     
     def connect(self) -> None:
         """Establish connection to SQL Server."""
+        _import_pyodbc()
         try:
             connection_string = self._build_connection_string()
-            self._connection = pyodbc.connect(connection_string)
+            
+            # Larger packets mean fewer round trips for big result sets.
+            # Rule queries are read-only, so autocommit avoids holding an
+            # implicit transaction open between queries.
+            self._connection = pyodbc.connect(
+                connection_string,
+                autocommit=True,
+                attrs_before={
+                    getattr(pyodbc, 'SQL_ATTR_PACKET_SIZE', _SQL_ATTR_PACKET_SIZE_DEFAULT):
+                        self._packet_size()
+                },
+            )
+            
+            # Validators run their arithmetic in SQL, so date values are
+            # only ever shown in samples: skip the datetime objects
+            if self.datetime_strings:
+                self._connection.add_output_converter(pyodbc.SQL_TYPE_TIMESTAMP, _timestamp_to_str)
+                self._connection.add_output_converter(pyodbc.SQL_TYPE_DATE, _date_to_str)
+            
             self._cursor = self._connection.cursor()
+            self._cursor.arraysize = self.arraysize
+            self._cursor.fast_executemany = True
             self._connected = True
         except pyodbc.Error as e:
             raise ConnectionError(f"Failed to connect to SQL Server: {e}")
@@ -76,14 +207,21 @@ class SQLServerConnector(BaseConnector):
             except Exception:
                 pass
             self._cursor = None
-            
+        
+        if self._columns_cursor:
+            try:
+                self._columns_cursor.close()
+            except Exception:
+                pass
+            self._columns_cursor = None
+        
         if self._connection:
             try:
                 self._connection.close()
             except Exception:
                 pass
             self._connection = None
-            
+        
         self._connected = False
     
     def execute_query(self, query: str, params: dict | None = None) -> list[dict]:
@@ -93,13 +231,13 @@ class SQLServerConnector(BaseConnector):
         Args:
             query: SQL query string
             params: Optional named parameters (not commonly used with pyodbc)
-            
+        
         Returns:
             List of row dictionaries
         """
         if not self._connected:
             self.connect()
-            
+        
         try:
             if params:
                 # Convert named params to positional for pyodbc
@@ -107,16 +245,75 @@ class SQLServerConnector(BaseConnector):
             else:
                 self._cursor.execute(query)
             
-            # Check if query returns results
-            if self._cursor.description:
-                rows = self._cursor.fetchall()
-                return self._rows_to_dicts(self._cursor, rows)
+            # Empty list for statements that return no result set
+            return self._fetch_dicts(self._cursor, self.arraysize)
+        
+        except pyodbc.Error as e:
+            raise QueryError(f"Query execution failed: {e}\nQuery: {query[:500]}")
+    
+    def execute_query_iter(self, query: str, params: dict | None = None) -> Iterator[dict]:
+        """
+        Execute SQL query and stream results one row at a time.
+        
+        Rows are pulled from the server in arraysize batches, so large
+        result sets are never fully buffered in memory. The cursor is
+        busy until the iterator is exhausted or closed.
+        
+        Args:
+            query: SQL query string
+            params: Optional named parameters
+        
+        Yields:
+            Row dictionaries
+        """
+        if not self._connected:
+            self.connect()
+        
+        try:
+            if params:
+                self._cursor.execute(query, list(params.values()))
             else:
-                return []
-                
+                self._cursor.execute(query)
+            
+            yield from self._iter_dicts(self._cursor, self.arraysize)
+        
         except pyodbc.Error as e:
             raise QueryError(f"Query execution failed: {e}\nQuery: {query[:500]}")
     
+    def execute_batch(self, queries: list[str]) -> list[list[dict]]:
+        """
+        Execute several SELECT queries as one multi-statement batch.
+        
+        Queries are sent _MAX_BATCH_STATEMENTS at a time, joined with
+        semicolons, and each result set is read with cursor.nextset().
+        SET NOCOUNT ON keeps row-count messages from showing up as extra
+        result sets.
+        
+        Args:
+            queries: SQL query strings (no trailing semicolons)
+        
+        Returns:
+            One list of row dictionaries per query, in order
+        """
+        if not self._connected:
+            self.connect()
+        
+        results = []
+        for start in range(0, len(queries), _MAX_BATCH_STATEMENTS):
+            chunk = queries[start:start + _MAX_BATCH_STATEMENTS]
+            batch = ";\n".join(["SET NOCOUNT ON", *chunk])
+            try:
+                self._cursor.execute(batch)
+                for i in range(len(chunk)):
+                    if i and not self._cursor.nextset():
+                        raise QueryError(
+                            f"Batch returned {i} result sets for {len(chunk)} queries"
+                        )
+                    results.append(self._fetch_dicts(self._cursor, self.arraysize))
+            except pyodbc.Error as e:
+                raise QueryError(f"Batch execution failed: {e}\nQuery: {batch[:500]}")
+        return results
+    
     def test_connection(self) -> bool:
         """Test if connection is working."""
         try:
@@ -129,7 +326,11 @@ class SQLServerConnector(BaseConnector):
             return False
     
     def _build_connection_string(self) -> str:
-        """Build ODBC connection string from config."""
+        """Build ODBC connection string from config (cached until config changes)."""
+        config_key = tuple(self.config.items())
+        if self._conn_str_cache and self._conn_str_cache[0] == config_key:
+            return self._conn_str_cache[1]
+        
         host = self.config.get('host', 'localhost')
         database = self.config.get('database', '')
         port = self.config.get('port', 1433)
@@ -139,43 +340,51 @@ class SQLServerConnector(BaseConnector):
         # Find available driver
         driver = self.config.get('driver') or self._detect_driver()
         
-        # Build base connection string
-        parts = [
-            f"DRIVER={{{driver}}}",
-            f"SERVER={host},{port}",
-            f"DATABASE={database}",
-            f"Connection Timeout={timeout}",
-        ]
-        
         if trusted:
-            parts.append("Trusted_Connection=yes")
+            auth_part = "Trusted_Connection=yes"
         else:
             username = self.config.get('username', '')
             password = self.config.get('password', '')
-            parts.append(f"UID={username}")
-            parts.append(f"PWD={password}")
+            auth_part = f"UID={username};PWD={password}"
         
         # Handle encryption settings for newer drivers
+        encrypt_part = ""
         if 'ODBC Driver 18' in driver:
             # Driver 18 requires explicit encryption settings
             encrypt = self.config.get('encrypt', 'yes')
             trust_cert = self.config.get('trust_server_certificate', 'yes')
-            parts.append(f"Encrypt={encrypt}")
-            parts.append(f"TrustServerCertificate={trust_cert}")
+            encrypt_part = f";Encrypt={encrypt};TrustServerCertificate={trust_cert}"
         
-        return ';'.join(parts)
+        # Packet Size is also set for drivers that ignore attrs_before
+        connection_string = (
+            f"DRIVER={{{driver}}};SERVER={host},{port};DATABASE={database};"
+            f"Connection Timeout={timeout};Packet Size={self._packet_size()};"
+            f"{auth_part}{encrypt_part}"
+        )
+        self._conn_str_cache = (config_key, connection_string)
+        return connection_string
+    
+    def _packet_size(self) -> int:
+        """Return configured TDS packet size in bytes."""
+        return int(self.config.get('packet_size', 32768))
     
     def _detect_driver(self) -> str:
-        """Detect available ODBC driver."""
-        available_drivers = pyodbc.drivers()
+        """Detect available ODBC driver (once per process)."""
+        cls = type(self)
+        if cls._driver_cache:
+            return cls._driver_cache
+        
+        available_drivers = _import_pyodbc().drivers()
         
         for driver in self.DRIVERS:
             if driver in available_drivers:
+                cls._driver_cache = driver
                 return driver
         
         # If no known driver found, try first available SQL Server driver
         for driver in available_drivers:
             if 'sql server' in driver.lower():
+                cls._driver_cache = driver
                 return driver
         
         raise ConnectionError(
@@ -187,8 +396,44 @@ class SQLServerConnector(BaseConnector):
         clean_name = name.strip('[]"\'`')
         return f'[{clean_name}]'
     
+    def get_table_version(self, table: str) -> tuple | None:
+        """
+        Version token from the table's last write and row count.
+        
+        Read from sys.dm_db_index_usage_stats, which requires VIEW SERVER
+        STATE and is reset when the server restarts; returns None (no
+        caching) when it is unavailable or the table has no recorded
+        writes.
+        """
+        try:
+            rows = self.execute_query(_TABLE_VERSION_QUERY, {'table': table, 'object': table})
+        except QueryError:
+            return None
+        
+        if not rows or rows[0]['last_update'] is None:
+            return None
+        return (rows[0]['last_update'], rows[0]['row_count'])
+    
+    def estimate_row_count(self, table: str) -> int | None:
+        """Row count from sys.dm_db_partition_stats (no table scan)."""
+        try:
+            rows = self.execute_query(_ROW_COUNT_QUERY, {'table': table})
+        except QueryError:
+            return None
+        
+        if not rows or rows[0]['row_count'] is None:
+            return None
+        return int(rows[0]['row_count'])
+    
+    def _is_fresh(self, loaded_at: float) -> bool:
+        """Check whether a cache entry loaded at the given time is usable."""
+        return time.monotonic() - loaded_at < self._metadata_ttl
+    
     def get_tables(self) -> list[str]:
-        """Get list of tables in the database."""
+        """Get list of tables in the database (cached for metadata_cache_ttl)."""
+        if self._tables_cache and self._is_fresh(self._tables_cache[0]):
+            return list(self._tables_cache[1])
+        
         query = """
             SELECT TABLE_NAME 
             FROM INFORMATION_SCHEMA.TABLES 
@@ -196,22 +441,27 @@ class SQLServerConnector(BaseConnector):
             ORDER BY TABLE_NAME
         """
         results = self.execute_query(query)
-        return [r['TABLE_NAME'] for r in results]
+        tables = [r['TABLE_NAME'] for r in results]
+        self._tables_cache = (time.monotonic(), tables)
+        return list(tables)
     
     def get_columns(self, table: str) -> list[dict]:
-        """Get column information for a table."""
-        query = """
-            SELECT 
-                COLUMN_NAME,
-                DATA_TYPE,
-                IS_NULLABLE,
-                CHARACTER_MAXIMUM_LENGTH,
-                NUMERIC_PRECISION,
-                NUMERIC_SCALE
-            FROM INFORMATION_SCHEMA.COLUMNS
-            WHERE TABLE_NAME = ?
-            ORDER BY ORDINAL_POSITION
-        """
-        self._cursor.execute(query, [table])
-        rows = self._cursor.fetchall()
-        return self._rows_to_dicts(self._cursor, rows)
+        """Get column information for a table (cached for metadata_cache_ttl)."""
+        cached = self._columns_cache.get(table)
+        if cached and self._is_fresh(cached[0]):
+            return list(cached[1])
+        
+        if not self._connected:
+            self.connect()
+        
+        # Reuse one cursor with the parameter type declared up front, so the
+        # driver binds the same NVARCHAR(128) (sysname) parameter every call
+        # and the server can reuse its cached plan
+        if self._columns_cursor is None:
+            self._columns_cursor = self._connection.cursor()
+            self._columns_cursor.setinputsizes([(pyodbc.SQL_WVARCHAR, 128, 0)])
+        
+        self._columns_cursor.execute(_COLUMNS_QUERY, [table])
+        columns = self._fetch_dicts(self._columns_cursor, self.arraysize)
+        self._columns_cache[table] = (time.monotonic(), columns)
+        return list(columns)
@@ -0,0 +1,107 @@
+"""
+SQL Server connector backed by arrow-odbc for bulk result fetching.
+
+Rule queries are fetched as Arrow record batches using bulk ODBC
+fetches, instead of one pyodbc row object at a time. Connection
+handling, metadata lookups and connectivity tests still go through
+pyodbc (inherited from SQLServerConnector), since those queries are tiny.
+
+Requires the optional arrow-odbc and pyarrow packages.
+"""
+
+from typing import Iterator
+
+from src.connectors.base import ConnectionError, QueryError
+from src.connectors.sqlserver import SQLServerConnector
+
+try:
+    from arrow_odbc import read_arrow_batches_from_odbc
+    ARROW_ODBC_AVAILABLE = True
+except ImportError:
+    ARROW_ODBC_AVAILABLE = False
+
+
+class SQLServerArrowConnector(SQLServerConnector):
+    """
+    SQL Server connector that fetches query results via arrow-odbc.
+    
+    Selected with `backend: arrow` on a sqlserver connection. Accepts the
+    same configuration options as SQLServerConnector; `arraysize` sets the
+    number of rows per Arrow batch.
+    
+    Tradeoff: large result sets convert much faster (the row-to-dict
+    conversion happens in Arrow's C++ code), but each query opens its own
+    ODBC connection, so many small queries are slower than with pyodbc.
+    
+    Example configuration:
+        
+        sqlserver_bulk:
+          type: sqlserver
+          backend: arrow
+          host: server.domain.com
+          database: warehouse
+          trusted_connection: true
+          arraysize: 50000
+    """
+    
+    def connect(self) -> None:
+        """Establish connection to SQL Server (pyodbc, for metadata)."""
+        if not ARROW_ODBC_AVAILABLE:
+            raise ConnectionError(
+                "The 'arrow' backend requires arrow-odbc: pip install arrow-odbc pyarrow"
+            )
+        super().connect()
+    
+    def execute_query(self, query: str, params: dict | None = None) -> list[dict]:
+        """
+        Execute SQL query and return results.
+        
+        Args:
+            query: SQL query string
+            params: Optional named parameters (bound positionally)
+        
+        Returns:
+            List of row dictionaries
+        """
+        records = []
+        for batch in self._read_batches(query, params):
+            records.extend(batch.to_pylist())
+        return records
+    
+    def execute_query_iter(self, query: str, params: dict | None = None) -> Iterator[dict]:
+        """
+        Execute SQL query and stream results one Arrow batch at a time.
+        
+        Args:
+            query: SQL query string
+            params: Optional named parameters (bound positionally)
+        
+        Yields:
+            Row dictionaries
+        """
+        for batch in self._read_batches(query, params):
+            yield from batch.to_pylist()
+    
+    def _read_batches(self, query: str, params: dict | None) -> Iterator:
+        """Run a query through arrow-odbc and yield its record batches."""
+        if not self._connected:
+            self.connect()
+        
+        # arrow-odbc binds parameters as text; the server converts them
+        parameters = None
+        if params:
+            parameters = [None if v is None else str(v) for v in params.values()]
+        
+        try:
+            reader = read_arrow_batches_from_odbc(
+                query=query,
+                connection_string=self._build_connection_string(),
+                batch_size=self.arraysize,
+                parameters=parameters,
+            )
+            # Statements without a result set produce no reader
+            if reader is None:
+                return
+            yield from reader
+        except Exception as e:
+            raise QueryError(f"Query execution failed: {e}\nQuery: {query[:500]}")
@@ -6,6 +6,7 @@ Provides CLI interface for running validations.
 
 import argparse
 import sys
+import time
 from pathlib import Path
 
 from src.config_loader import load_config, ConfigurationError
@@ -71,6 +72,18 @@ Examples:
         help='Directory to save JSON report'
     )
     
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        help='Number of rules to run concurrently (overrides settings.max_workers; 1 = sequential)'
+    )
+    
+    parser.add_argument(
+        '--compress',
+        choices=['gzip', 'zstd'],
+        help='Compress saved JSON reports (zstd falls back to gzip without the zstandard package)'
+    )
+    
     parser.add_argument(
         '--dry-run',
         action='store_true',
@@ -96,7 +109,7 @@ Examples:
         config = load_config(args.config, args.connections)
         
         # Create rule engine
-        engine = RuleEngine(config, args.connection)
+        engine = RuleEngine(config, args.connection, max_workers=args.workers)
         
         # Dry run - just show rules
         if args.dry_run:
@@ -111,10 +124,19 @@ Examples:
             print()
             return 0
         
-        # Progress callback
+        # Progress callback, rate-limited to ~10 updates per second so
+        # terminal writes don't slow down runs with many fast rules
+        last_emit = [0.0]
+        
         def progress(rule_name: str, current: int, total: int):
-            if not args.quiet:
-                print(f"\r  Running: {current}/{total} - {rule_name}...", end='', flush=True)
+            if args.quiet:
+                return
+            now = time.monotonic()
+            if current != total and now - last_emit[0] < 0.1:
+                return
+            last_emit[0] = now
+            sys.stdout.write(f"\r  Running: {current}/{total} - {rule_name}...")
+            sys.stdout.flush()
         
         engine.set_progress_callback(progress)
         
@@ -124,7 +146,10 @@ Examples:
             print()
         
         # Run validation
-        report = engine.run(severity_filter=args.severity)
+        try:
+            report = engine.run(severity_filter=args.severity)
+        finally:
+            engine.close()
         
         if not args.quiet:
             print("\r" + " " * 60 + "\r", end='')  # Clear progress line
@@ -135,7 +160,11 @@ Examples:
         
         # Save to file if requested
         if args.output:
-            full_path, summary_path = save_report(report, args.output)
+            # Nobody reads the report interactively in quiet mode, so skip
+            # the indentation (smaller files, faster serialization)
+            full_path, summary_path = save_report(
+                report, args.output, compress=args.compress, compact=args.quiet
+            )
             if not args.quiet:
                 print(f"Full report saved to: {full_path}")
                 print(f"Summary saved to: {summary_path}")
@@ -11,15 +11,32 @@ import sys
 
 from src.validators.base import ValidationReport, ValidationResult, Severity
 
-try:
-    from rich.console import Console
-    from rich.table import Table
-    from rich.panel import Panel
-    from rich.text import Text
-    from rich import box
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
+# Rich is imported on first use (see _import_rich), so runs that never
+# render to the console, e.g. with --quiet, skip its import cost.
+# None means the import has not been attempted yet.
+RICH_AVAILABLE: bool | None = None
+
+
+def _import_rich() -> bool:
+    """Import Rich into module globals on first call; return availability."""
+    global RICH_AVAILABLE, Console, Table, Panel, Text, box
+    if RICH_AVAILABLE is None:
+        try:
+            from rich.console import Console
+            from rich.table import Table
+            from rich.panel import Panel
+            from rich.text import Text
+            from rich import box
+            RICH_AVAILABLE = True
+        except ImportError:
+            RICH_AVAILABLE = False
+    return RICH_AVAILABLE
+
+
+# Fields shown first in record previews, and fields tried as record IDs
+_PRIORITY_FIELDS = ('id', 'ID', 'client_id', 'customer_id', 'name', 'email')
+_PRIORITY_SET = frozenset(_PRIORITY_FIELDS)
+_ID_FIELDS = ('id', 'ID', 'client_id', 'customer_id', 'record_id')
 
 
 class ConsoleReporter:
@@ -52,11 +69,21 @@ class ConsoleReporter:
             use_rich: Use Rich formatting if available
             output: Output stream (default: stdout)
         """
-        self.use_rich = use_rich and RICH_AVAILABLE
+        self.use_rich = use_rich and _import_rich()
         self.output = output or sys.stdout
         
         if self.use_rich:
             self.console = Console(file=self.output)
+            
+            # Styled "<symbol> [SEVERITY]" prefixes, built once instead of
+            # formatting and parsing markup for every failed rule
+            self._severity_headers = {
+                severity: Text.assemble(
+                    f"{self.SEVERITY_SYMBOLS.get(severity, '•')} ",
+                    (f"[{severity.value.upper()}]", self.SEVERITY_COLORS.get(severity, 'white')),
+                )
+                for severity in Severity
+            }
     
     def report(self, report: ValidationReport) -> None:
         """Display validation report."""
@@ -77,7 +104,7 @@ class ConsoleReporter:
         info_text.append(f"Connection: ", style="dim")
         info_text.append(f"{report.connection_name}\n", style="cyan")
         info_text.append(f"Timestamp: ", style="dim")
-        info_text.append(f"{report.timestamp.strftime('%Y-%m-%d %H:%M:%S')}\n", style="cyan")
+        info_text.append(f"{report.timestamp_display}\n", style="cyan")
         info_text.append(f"Duration: ", style="dim")
         info_text.append(f"{report.duration_seconds:.2f} seconds\n", style="cyan")
         info_text.append(f"Rules Executed: ", style="dim")
@@ -96,8 +123,10 @@ class ConsoleReporter:
         if passed_results:
             self.console.print()
             self.console.print("[green]✓ Passed Rules[/green]")
-            for result in passed_results:
-                self.console.print(f"  [dim]• {result.rule_name}[/dim]")
+            # One print for the whole list rather than one per rule
+            self.console.print(Text("\n").join(
+                Text(f"  • {result.rule_name}", style="dim") for result in passed_results
+            ))
         
         self.console.print()
         self.console.rule()
@@ -133,49 +162,50 @@ class ConsoleReporter:
         self.console.print("[bold red]Failed Rules[/bold red]")
         self.console.print()
         
+        # Lines are assembled as Text rather than markup strings: nothing
+        # is re-parsed per print, and brackets in rule names, errors or
+        # record values are shown literally
         for result in report.failed_results:
-            severity_color = self.SEVERITY_COLORS.get(result.severity, 'white')
-            symbol = self.SEVERITY_SYMBOLS.get(result.severity, '•')
-            
             # Rule header
-            self.console.print(
-                f"{symbol} [{severity_color}][{result.severity.value.upper()}][/{severity_color}] "
-                f"[bold]{result.rule_name}[/bold]"
-            )
+            header = self._severity_headers[result.severity].copy()
+            header.append(" ")
+            header.append(result.rule_name, style="bold")
+            lines = [header]
             
             # Details
             if result.table:
-                self.console.print(f"  [dim]Table:[/dim] {result.table}")
+                lines.append(Text.assemble(("  Table:", "dim"), f" {result.table}"))
             
             if result.error_message:
-                self.console.print(f"  [red]Error:[/red] {result.error_message}")
+                lines.append(Text.assemble(("  Error:", "red"), f" {result.error_message}"))
             else:
-                self.console.print(f"  [dim]Violations:[/dim] {result.violation_count:,} records")
+                lines.append(Text.assemble(("  Violations:", "dim"), f" {result.violation_count:,} records"))
             
             if result.description:
-                self.console.print(f"  [dim]Description:[/dim] {result.description}")
+                lines.append(Text.assemble(("  Description:", "dim"), f" {result.description}"))
             
             # Sample records
             if result.sample_records:
-                self.console.print(f"  [dim]Sample violations:[/dim]")
+                lines.append(Text("  Sample violations:", style="dim"))
                 for i, record in enumerate(result.sample_records[:3]):
                     # Show key fields only
                     preview = self._format_record_preview(record)
-                    self.console.print(f"    {i+1}. {preview}")
+                    lines.append(Text(f"    {i+1}. {preview}"))
             
             # Query (truncated)
             if result.query:
                 query_preview = result.query[:200].replace('\n', ' ')
                 if len(result.query) > 200:
                     query_preview += "..."
-                self.console.print(f"  [dim]Query:[/dim] {query_preview}")
+                lines.append(Text.assemble(("  Query:", "dim"), f" {query_preview}"))
             
-            self.console.print()
+            lines.append(Text())
+            self.console.print(Text("\n").join(lines))
     
     def _report_plain(self, report: ValidationReport) -> None:
         """Display report using plain text."""
         print("=" * 80, file=self.output)
-        print(f"DATA QUALITY REPORT - {report.timestamp.strftime('%Y-%m-%d %H:%M:%S')}", file=self.output)
+        print(f"DATA QUALITY REPORT - {report.timestamp_display}", file=self.output)
         print("=" * 80, file=self.output)
         print(file=self.output)
         
@@ -226,29 +256,23 @@ class ConsoleReporter:
     
     def _format_record_preview(self, record: dict, max_fields: int = 4) -> str:
         """Format a record for preview display."""
-        # Prioritize ID fields and important columns
-        priority_fields = ['id', 'ID', 'client_id', 'customer_id', 'name', 'email']
-        
         fields_to_show = []
-        shown = set()
         
-        # First, add priority fields
-        for field in priority_fields:
-            if field in record and field not in shown:
-                value = record[field]
-                if value is not None:
-                    fields_to_show.append(f"{field}={self._truncate_value(value)}")
-                    shown.add(field)
-                    if len(fields_to_show) >= max_fields:
-                        break
+        # First, add priority fields (ID fields and important columns)
+        for field in _PRIORITY_FIELDS:
+            value = record.get(field)
+            if value is not None:
+                fields_to_show.append(f"{field}={self._truncate_value(value)}")
+                if len(fields_to_show) >= max_fields:
+                    return ", ".join(fields_to_show)
         
         # Then add remaining fields
         for key, value in record.items():
-            if key not in shown and not key.startswith('_'):
-                if value is not None:
-                    fields_to_show.append(f"{key}={self._truncate_value(value)}")
-                    if len(fields_to_show) >= max_fields:
-                        break
+            if value is None or key in _PRIORITY_SET or key.startswith('_'):
+                continue
+            fields_to_show.append(f"{key}={self._truncate_value(value)}")
+            if len(fields_to_show) >= max_fields:
+                break
         
         return ", ".join(fields_to_show)
     
@@ -261,7 +285,7 @@ class ConsoleReporter:
     
     def _get_id_from_record(self, record: dict):
         """Extract ID field from record."""
-        for field in ['id', 'ID', 'client_id', 'customer_id', 'record_id']:
+        for field in _ID_FIELDS:
             if field in record:
                 return record[field]
         # Return first field value as fallback
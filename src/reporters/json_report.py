@@ -5,13 +5,99 @@ Outputs are designed for easy ingestion by BI tools like Power BI,
 and for programmatic processing.
 """
 
+import base64
+import gzip
 import json
-from datetime import datetime
+import os
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
 from pathlib import Path
 from typing import Any
+from uuid import UUID
 
 from src.validators.base import ValidationReport
 
+# Optional fast serializer; falls back to the standard library
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional zstd compression; gzip is used when unavailable
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+COMPRESSION_TYPES = ('gzip', 'zstd')
+
+
+def _encode_bytes(value: bytes) -> str:
+    """Encode binary column values as base64 text."""
+    return base64.b64encode(value).decode('ascii')
+
+
+# Converters for non-JSON-native values commonly found in database rows,
+# keyed by exact type so the common case is a single dict lookup
+_JSON_CONVERTERS = {
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+    time: time.isoformat,
+    timedelta: timedelta.total_seconds,
+    Decimal: float,
+    UUID: str,
+    bytes: _encode_bytes,
+    bytearray: _encode_bytes,
+    memoryview: lambda v: _encode_bytes(v.tobytes()),
+    set: list,
+    frozenset: list,
+}
+
+
+def _json_default(value: Any) -> Any:
+    """
+    Convert a value the JSON encoder cannot serialize natively.
+    
+    Known types keep a typed representation (ISO dates, numeric decimals,
+    base64 bytes) for BI tools; anything else falls back to str() so a
+    single odd value never prevents a report from being written.
+    """
+    converter = _JSON_CONVERTERS.get(type(value))
+    if converter is None:
+        # Subclasses of known types (e.g. pandas Timestamp is a datetime)
+        for base, candidate in _JSON_CONVERTERS.items():
+            if isinstance(value, base):
+                converter = candidate
+                break
+        else:
+            return str(value)
+    return converter(value)
+
+
+def _dumps(obj: Any, indent: bool = True) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON.
+    
+    Uses orjson when installed (which handles datetime and UUID natively),
+    otherwise the json module. Other values are converted by
+    _json_default.
+    
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with 2-space indentation
+        
+    Returns:
+        JSON document as bytes
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_json_default, option=option)
+    return json.dumps(obj, indent=2 if indent else None, default=_json_default).encode('utf-8')
+
 
 class JSONReporter:
     """
@@ -23,15 +109,74 @@ class JSONReporter:
     - Integration with alerting systems
     """
     
-    def __init__(self, output_dir: str | Path = "reports"):
+    def __init__(
+        self,
+        output_dir: str | Path = "reports",
+        compress: str | None = None,
+        compact: bool = False,
+        max_samples: int = 10,
+        max_query_length: int = 4096
+    ):
         """
         Initialize JSON reporter.
         
         Args:
             output_dir: Directory to save reports (created if needed)
+            compress: Compress output files with 'gzip' or 'zstd'
+                (default: uncompressed). 'zstd' falls back to gzip when
+                the zstandard package is not installed.
+            compact: Write reports without indentation (smaller and
+                faster to serialize; each result stays on its own line)
+            max_samples: Maximum sample records written per result
+            max_query_length: Longer validation queries are truncated
+                (with a trailing '...')
+        
+        The sample and query caps keep report size bounded for wide tables
+        and rules that collect many samples; the full query can always be
+        regenerated from the rule configuration.
         """
+        if compress is not None and compress not in COMPRESSION_TYPES:
+            raise ValueError(
+                f"Unknown compression: {compress}. Must be one of: {list(COMPRESSION_TYPES)}"
+            )
+        if compress == 'zstd' and not ZSTD_AVAILABLE:
+            compress = 'gzip'
+        
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.compress = compress
+        self.indent = not compact
+        self.max_samples = max(0, int(max_samples))
+        self.max_query_length = max(0, int(max_query_length))
+    
+    def _open(self, filename: str, mode: str = 'wb', buffering: int = -1) -> tuple[Path, Any]:
+        """
+        Open an output file, applying the configured compression.
+        
+        Args:
+            filename: File name within output_dir (suffix added if compressed)
+            mode: Binary write mode, 'wb' or 'ab'
+            buffering: Buffer size for uncompressed files (-1: default)
+            
+        Returns:
+            Tuple of (path, writable binary file object)
+        """
+        filepath = self.output_dir / filename
+        
+        if self.compress == 'zstd':
+            filepath = filepath.with_name(filepath.name + '.zst')
+            # Appending writes a new zstd frame; concatenated frames decode
+            # as one stream
+            cctx = zstandard.ZstdCompressor(level=3)
+            return filepath, cctx.stream_writer(open(filepath, mode))
+        
+        if self.compress == 'gzip':
+            filepath = filepath.with_name(filepath.name + '.gz')
+            # Level 1 is nearly free CPU-wise and still shrinks JSON a lot;
+            # appending adds a gzip member, which readers handle transparently
+            return filepath, gzip.open(filepath, mode, compresslevel=1)
+        
+        return filepath, open(filepath, mode, buffering=buffering)
     
     def save(
         self, 
@@ -49,16 +194,24 @@ class JSONReporter:
             Path to saved file
         """
         if filename is None:
-            timestamp = report.timestamp.strftime('%Y%m%d_%H%M%S')
+            timestamp = report.timestamp_slug
             filename = f"dq_report_{timestamp}.json"
         
-        filepath = self.output_dir / filename
-        
-        # Convert report to dict and serialize
-        report_dict = self._serialize_report(report)
+        filepath, f = self._open(filename)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(report_dict, f, indent=2, default=str)
+        # Stream results one at a time rather than building the full
+        # report dict, so peak memory is bounded by the largest result
+        with f:
+            f.write(b'{\n')
+            for key, value in self._serialize_header(report).items():
+                f.write(b'  ' + _dumps(key) + b': ')
+                f.write(_dumps(value, self.indent).replace(b'\n', b'\n  ') + b',\n')
+            
+            f.write(b'  "results": [')
+            for i, result in enumerate(report.results):
+                f.write(b',\n    ' if i else b'\n    ')
+                f.write(_dumps(self._serialize_result(result), self.indent).replace(b'\n', b'\n    '))
+            f.write(b'\n  ]\n}\n' if report.results else b']\n}\n')
         
         return filepath
     
@@ -78,13 +231,11 @@ class JSONReporter:
             Path to saved file
         """
         if filename is None:
-            timestamp = report.timestamp.strftime('%Y%m%d_%H%M%S')
+            timestamp = report.timestamp_slug
             filename = f"dq_summary_{timestamp}.json"
         
-        filepath = self.output_dir / filename
-        
         summary = {
-            'timestamp': report.timestamp.isoformat(),
+            'timestamp': report.timestamp_iso,
             'connection': report.connection_name,
             'duration_seconds': report.duration_seconds,
             'total_rules': report.total_rules,
@@ -103,15 +254,17 @@ class JSONReporter:
             ]
         }
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2)
+        filepath, f = self._open(filename)
+        with f:
+            f.write(_dumps(summary, self.indent))
         
         return filepath
     
     def append_to_history(
         self,
         report: ValidationReport,
-        history_file: str = "dq_history.jsonl"
+        history_file: str = "dq_history.jsonl",
+        fsync: bool = False
     ) -> Path:
         """
         Append summary to JSONL history file (one record per line).
@@ -121,15 +274,15 @@ class JSONReporter:
         Args:
             report: ValidationReport to append
             history_file: Name of history file
+            fsync: Force the record to stable storage before returning
+                (off by default; the OS flushes it on its own schedule)
             
         Returns:
             Path to history file
         """
-        filepath = self.output_dir / history_file
-        
         # Create compact summary record
         record = {
-            'timestamp': report.timestamp.isoformat(),
+            'timestamp': report.timestamp_iso,
             'connection': report.connection_name,
             'total': report.total_rules,
             'passed': report.passed_count,
@@ -140,17 +293,27 @@ class JSONReporter:
         }
         
         # Append as single line
-        with open(filepath, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(record) + '\n')
+        # The record is written in one call, so a large buffer means a single
+        # write syscall on close
+        filepath, f = self._open(history_file, 'ab', buffering=65536)
+        with f:
+            f.write(_dumps(record, indent=False) + b'\n')
+        
+        if fsync:
+            fd = os.open(filepath, os.O_RDWR)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
         
         return filepath
     
-    def _serialize_report(self, report: ValidationReport) -> dict:
-        """Convert ValidationReport to JSON-serializable dict."""
+    def _serialize_header(self, report: ValidationReport) -> dict:
+        """Build the metadata and summary sections of a report."""
         return {
             'metadata': {
                 'connection_name': report.connection_name,
-                'timestamp': report.timestamp.isoformat(),
+                'timestamp': report.timestamp_iso,
                 'duration_seconds': report.duration_seconds,
                 'settings': report.settings
             },
@@ -159,14 +322,15 @@ class JSONReporter:
                 'passed_count': report.passed_count,
                 'failed_count': report.failed_count,
                 'failures_by_severity': report.failures_by_severity()
-            },
-            'results': [
-                self._serialize_result(r) for r in report.results
-            ]
+            }
         }
     
     def _serialize_result(self, result) -> dict:
-        """Convert ValidationResult to dict."""
+        """Convert ValidationResult to dict (samples and query capped)."""
+        query = result.query
+        if len(query) > self.max_query_length:
+            query = query[:self.max_query_length] + '...'
+        
         return {
             'rule_name': result.rule_name,
             'rule_type': result.rule_type,
@@ -177,15 +341,17 @@ class JSONReporter:
             'description': result.description,
             'execution_time_ms': result.execution_time_ms,
             'error_message': result.error_message,
-            'sample_records': result.sample_records,
-            'query': result.query,
+            'sample_records': result.sample_records[:self.max_samples],
+            'query': query,
             'metadata': result.metadata
         }
 
 
 def save_report(
     report: ValidationReport,
-    output_dir: str = "reports"
+    output_dir: str = "reports",
+    compress: str | None = None,
+    compact: bool = False
 ) -> tuple[Path, Path]:
     """
     Convenience function to save both full report and summary.
@@ -193,11 +359,13 @@ def save_report(
     Args:
         report: ValidationReport to save
         output_dir: Output directory
+        compress: Optional compression ('gzip' or 'zstd')
+        compact: Write unindented JSON
         
     Returns:
         Tuple of (full_report_path, summary_path)
     """
-    reporter = JSONReporter(output_dir)
+    reporter = JSONReporter(output_dir, compress=compress, compact=compact)
     full_path = reporter.save(report)
     summary_path = reporter.save_summary(report)
     reporter.append_to_history(report)
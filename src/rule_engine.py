@@ -5,22 +5,46 @@ Manages the execution of validation rules, handling parallel execution,
 error handling, and result aggregation.
 """
 
+import asyncio
+import dataclasses
+import hashlib
+import itertools
+import json
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
 from typing import Callable
 
-from src.config_loader import ConfigLoader
-from src.connectors import create_connector, BaseConnector
+from src.config_loader import ConfigLoader, normalize_rule
+from src.connectors import create_pool, ConnectorPool
 from src.validators import (
     VALIDATOR_REGISTRY,
     ValidationResult,
     ValidationReport,
     Severity,
-    BaseValidator
+    BaseValidator,
+    FusedValidator
 )
 
 
+def _batch_validator_class(batch: list[dict]) -> type[BaseValidator] | None:
+    """
+    Validator class that executes a batch (see RuleEngine._coalesce).
+    
+    Batches of several fusable rules, possibly of different types, go
+    to FusedValidator; other batches hold rules of one type.
+    
+    Returns:
+        Validator class, or None if the first rule's type is unknown
+    """
+    validator_class = VALIDATOR_REGISTRY.get(batch[0]['type'])
+    if validator_class is not None and len(batch) > 1 and validator_class.fusable:
+        return FusedValidator
+    return validator_class
+
+
 class RuleEngine:
     """
     Orchestrates execution of data quality validation rules.
@@ -33,17 +57,28 @@ class RuleEngine:
     - Stopping on critical failures if configured
     """
     
-    def __init__(self, config: ConfigLoader, connection_name: str | None = None):
+    def __init__(
+        self,
+        config: ConfigLoader,
+        connection_name: str | None = None,
+        max_workers: int | None = None
+    ):
         """
         Initialize rule engine.
         
         Args:
             config: Loaded configuration
             connection_name: Name of connection to use (default: first available)
+            max_workers: Override the configured worker count (1 runs
+                rules sequentially)
         """
         self.config = config
         self.settings = config.get_settings()
         
+        if max_workers is not None:
+            self.settings['max_workers'] = max_workers
+            self.settings['parallel_execution'] = max_workers > 1
+        
         # Determine connection to use
         if connection_name:
             self.connection_name = connection_name
@@ -54,7 +89,19 @@ class RuleEngine:
                 raise ValueError("No database connections configured")
             self.connection_name = names[0]
         
-        self._connector: BaseConnector | None = None
+        self._pool: ConnectorPool | None = None
+        
+        # Validators are stateless between rules, so one instance per
+        # (rule type, pooled connector) is reused for the whole run
+        self._validator_cache: dict[tuple[str, int], BaseValidator] = {}
+        
+        # Results of earlier runs on this engine, reused while the source
+        # tables report the same data version (disabled when ttl is 0)
+        self._result_cache_ttl = self.settings.get('result_cache_ttl', 0)
+        self._result_cache_size = max(1, self.settings.get('result_cache_size', 1024))
+        self._result_cache: dict[bytes, tuple[float, tuple, ValidationResult]] = {}
+        self._result_cache_lock = threading.Lock()
+        
         self._progress_callback: Callable[[str, int, int], None] | None = None
     
     def set_progress_callback(self, callback: Callable[[str, int, int], None]) -> None:
@@ -83,147 +130,451 @@ class RuleEngine:
         """
         start_time = time.time()
         
-        # Get rules to execute
+        rules = self._select_rules(rules, severity_filter)
+        if not rules:
+            return self._make_report([], 0)
+        
+        self._ensure_pool()
+        
+        # Execute rules
+        if self.settings.get('parallel_execution', True):
+            results = self._run_parallel(rules)
+        else:
+            results = self._run_sequential(rules)
+        
+        return self._make_report(results, time.time() - start_time)
+    
+    async def run_async(
+        self,
+        rules: list[dict] | None = None,
+        severity_filter: list[str] | None = None
+    ) -> ValidationReport:
+        """
+        Execute validation rules from asyncio code and return report.
+        
+        Same semantics as run(), for callers that already run an event
+        loop (schedulers, web services). Rules are dispatched concurrently
+        as asyncio tasks; the blocking database calls run on a pool of
+        max_workers threads, so the event loop is never blocked.
+        
+        Args:
+            rules: Specific rules to run (default: all configured rules)
+            severity_filter: Only run rules with these severity levels
+            
+        Returns:
+            ValidationReport with all results
+        """
+        start_time = time.time()
+        
+        rules = self._select_rules(rules, severity_filter)
+        if not rules:
+            return self._make_report([], 0)
+        
+        await asyncio.to_thread(self._ensure_pool)
+        
+        results = await self._run_async(rules)
+        return self._make_report(results, time.time() - start_time)
+    
+    def _ensure_pool(self) -> None:
+        """
+        Open the connector pool for this engine's connection, once.
+        
+        The pool stays open across run() calls so scheduled or repeated
+        runs skip the connection handshake; close() shuts it down. Sized
+        from settings: min_workers connectors are opened up front and the
+        pool grows up to max_workers (one per concurrent rule).
+        """
+        if self._pool is not None and not self._pool.closed:
+            return
+        
+        if self.settings.get('parallel_execution', True):
+            max_size = self.settings.get('max_workers', 4)
+        else:
+            max_size = 1
+        
+        # Cached validators hold connectors from the previous pool
+        self._validator_cache.clear()
+        
+        conn_config = self.config.get_connection(self.connection_name)
+        self._pool = create_pool(
+            conn_config,
+            min_size=self.settings.get('min_workers', 2),
+            max_size=max_size,
+            ping_after=self.settings.get('pool_ping_after', 60)
+        )
+    
+    def close(self) -> None:
+        """Close the engine's pooled database connections."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+        self._validator_cache.clear()
+    
+    def __enter__(self) -> 'RuleEngine':
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit - close pooled connections."""
+        self.close()
+    
+    def _select_rules(
+        self,
+        rules: list[dict] | None,
+        severity_filter: list[str] | None
+    ) -> list[dict]:
+        """Resolve the rules to execute, applying the severity filter."""
+        # Get rules to execute; configured rules were normalized at load
         if rules is None:
             rules = self.config.get_rules()
+        else:
+            rules = [normalize_rule(dict(r)) for r in rules]
         
         # Apply severity filter
         if severity_filter:
             filter_set = set(s.lower() for s in severity_filter)
-            rules = [r for r in rules if r['severity'].lower() in filter_set]
+            rules = [r for r in rules if r['severity'] in filter_set]
         
-        if not rules:
-            return ValidationReport(
-                connection_name=self.connection_name,
-                timestamp=datetime.now(),
-                duration_seconds=0,
-                results=[],
-                settings=self.settings
-            )
-        
-        # Create connector
-        conn_config = self.config.get_connection(self.connection_name)
-        self._connector = create_connector(conn_config)
-        
-        try:
-            self._connector.connect()
-            
-            # Execute rules
-            if self.settings.get('parallel_execution', True):
-                results = self._run_parallel(rules)
-            else:
-                results = self._run_sequential(rules)
-            
-            duration = time.time() - start_time
-            
-            return ValidationReport(
-                connection_name=self.connection_name,
-                timestamp=datetime.now(),
-                duration_seconds=round(duration, 2),
-                results=results,
-                settings=self.settings
-            )
-            
-        finally:
-            self._connector.disconnect()
+        return rules
+    
+    def _make_report(self, results: list[ValidationResult], duration: float) -> ValidationReport:
+        """Wrap results in a ValidationReport for this engine's connection."""
+        return ValidationReport(
+            connection_name=self.connection_name,
+            timestamp=datetime.now(),
+            duration_seconds=round(duration, 2),
+            results=results,
+            settings=self.settings
+        )
     
     def _run_sequential(self, rules: list[dict]) -> list[ValidationResult]:
         """Execute rules one at a time."""
         results = []
         stop_on_critical = self.settings.get('stop_on_critical', False)
         
-        for i, rule in enumerate(rules):
-            result = self._execute_rule(rule)
-            results.append(result)
+        for batch in self._coalesce(rules):
+            batch_results = self._execute_batch(batch)
             
-            # Progress callback
-            if self._progress_callback:
-                self._progress_callback(rule['name'], i + 1, len(rules))
+            for result in batch_results:
+                results.append(result)
+                
+                # Progress callback
+                if self._progress_callback:
+                    self._progress_callback(result.rule_name, len(results), len(rules))
             
             # Check for critical failure
-            if stop_on_critical and result.failed and result.severity == Severity.CRITICAL:
+            if stop_on_critical and self._has_critical_failure(batch_results):
                 break
         
         return results
     
     def _run_parallel(self, rules: list[dict]) -> list[ValidationResult]:
-        """Execute rules in parallel using thread pool."""
+        """
+        Execute rules in parallel using thread pool.
+        
+        Each rule (or batch of rules on one table) checks out its own
+        connector from the connector pool, so workers do not contend for
+        a single connection. At most max_workers batches are in flight:
+        new ones are submitted only as others finish, so a critical
+        failure with stop_on_critical skips everything not yet started.
+        """
         max_workers = self.settings.get('max_workers', 4)
         stop_on_critical = self.settings.get('stop_on_critical', False)
         
-        results = []
-        completed = 0
+        # deque.append and next(count) are atomic, so these stay safe
+        # if collection ever moves off a single thread
+        results: deque[ValidationResult] = deque()
+        counter = itertools.count(1)
         should_stop = False
         
+        pending_batches = iter(self._coalesce(rules))
+        in_flight = {}
+        
+        # Progress callbacks run on this (collecting) thread only
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all rules
-            future_to_rule = {
-                executor.submit(self._execute_rule, rule): rule
-                for rule in rules
-            }
-            
-            # Collect results as they complete
-            for future in as_completed(future_to_rule):
-                if should_stop:
-                    future.cancel()
-                    continue
-                    
-                rule = future_to_rule[future]
-                try:
-                    result = future.result()
-                    results.append(result)
+            while True:
+                # Top up the in-flight set
+                while not should_stop and len(in_flight) < max_workers:
+                    batch = next(pending_batches, None)
+                    if batch is None:
+                        break
+                    in_flight[executor.submit(self._execute_batch, batch)] = batch
+                
+                if not in_flight:
+                    break
+                
+                # Collect results as they complete
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    batch = in_flight.pop(future)
+                    try:
+                        batch_results = future.result()
+                    except Exception as e:
+                        # Rule execution failed unexpectedly
+                        batch_results = [
+                            self._failed_result(rule, f"Execution failed: {str(e)}")
+                            for rule in batch
+                        ]
                     
-                    completed += 1
-                    if self._progress_callback:
-                        self._progress_callback(rule['name'], completed, len(rules))
+                    for result in batch_results:
+                        results.append(result)
+                        completed = next(counter)
+                        if self._progress_callback:
+                            self._progress_callback(result.rule_name, completed, len(rules))
                     
                     # Check for critical failure
-                    if stop_on_critical and result.failed and result.severity == Severity.CRITICAL:
+                    if stop_on_critical and self._has_critical_failure(batch_results):
                         should_stop = True
-                        
+        
+        return list(results)
+    
+    async def _run_async(self, rules: list[dict]) -> list[ValidationResult]:
+        """
+        Execute rules as asyncio tasks backed by a bounded thread pool.
+        
+        A semaphore keeps at most max_workers batches in the executor, so
+        large rule sets don't queue one executor future per rule up
+        front. On a critical failure with stop_on_critical, an event stops
+        rules that have not started yet and pending tasks are cancelled.
+        """
+        max_workers = self.settings.get('max_workers', 4)
+        stop_on_critical = self.settings.get('stop_on_critical', False)
+        
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        stop = asyncio.Event()
+        slots = asyncio.Semaphore(max_workers)
+        results: list[ValidationResult] = []
+        
+        async def run_one(batch: list[dict]) -> None:
+            async with slots:
+                if stop.is_set():
+                    return
+                try:
+                    batch_results = await loop.run_in_executor(
+                        executor, self._execute_batch, batch
+                    )
                 except Exception as e:
                     # Rule execution failed unexpectedly
-                    results.append(ValidationResult(
-                        rule_name=rule['name'],
-                        rule_type=rule['type'],
-                        severity=Severity.from_string(rule['severity']),
-                        passed=False,
-                        error_message=f"Execution failed: {str(e)}"
-                    ))
-                    completed += 1
+                    batch_results = [
+                        self._failed_result(rule, f"Execution failed: {str(e)}")
+                        for rule in batch
+                    ]
+            
+            # Tasks resume on the event loop thread, so no locking needed
+            for result in batch_results:
+                results.append(result)
+                if self._progress_callback:
+                    self._progress_callback(result.rule_name, len(results), len(rules))
+            
+            # Check for critical failure
+            if stop_on_critical and self._has_critical_failure(batch_results):
+                stop.set()
+                current = asyncio.current_task()
+                for task in tasks:
+                    if task is not current:
+                        task.cancel()
+        
+        tasks = [asyncio.ensure_future(run_one(batch)) for batch in self._coalesce(rules)]
+        try:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
         
         return results
     
+    def _coalesce(self, rules: list[dict]) -> list[list[dict]]:
+        """
+        Group rules into units of work.
+        
+        Rules of a batchable type (see BaseValidator.batchable) on the
+        same table form one batch, so they share a single table scan.
+        Fusable rules (see BaseValidator.fusable) on the same table form
+        one batch whatever their type. Every other rule is its own
+        batch. Batches keep the order in which their first rule appears.
+        """
+        batches: list[list[dict]] = []
+        by_table: dict[tuple[str, str], list[dict]] = {}
+        
+        for rule in rules:
+            validator_class = VALIDATOR_REGISTRY.get(rule['type'])
+            if (
+                validator_class is None
+                or not (validator_class.batchable or validator_class.fusable)
+                or not rule['table']
+            ):
+                batches.append([rule])
+                continue
+            
+            rule_type = FusedValidator.validator_type if validator_class.fusable else rule['type']
+            key = (rule_type, rule['table'])
+            batch = by_table.get(key)
+            if batch is None:
+                batch = by_table[key] = []
+                batches.append(batch)
+            batch.append(rule)
+        
+        return batches
+    
     def _execute_rule(self, rule: dict) -> ValidationResult:
         """Execute a single validation rule."""
-        rule_type = rule['type']
+        return self._execute_batch([rule])[0]
+    
+    def _execute_batch(self, batch: list[dict]) -> list[ValidationResult]:
+        """
+        Execute a batch of rules on one connector.
         
+        Cached results are reused where possible; the remaining rules go
+        to the validator together (validate_many) and share the elapsed
+        time equally. Batches of several fusable rules go to
+        FusedValidator, which counts them all in one scan.
+        """
         # Get validator class
-        validator_class = VALIDATOR_REGISTRY.get(rule_type)
+        validator_class = _batch_validator_class(batch)
         if not validator_class:
-            return ValidationResult(
-                rule_name=rule['name'],
-                rule_type=rule_type,
-                severity=Severity.from_string(rule['severity']),
-                passed=False,
-                error_message=f"Unknown validator type: {rule_type}"
-            )
+            return [
+                self._failed_result(rule, f"Unknown validator type: {batch[0]['type']}")
+                for rule in batch
+            ]
+        rule_type = batch[0]['type']
+        if validator_class is FusedValidator:
+            rule_type = FusedValidator.validator_type
         
         # Create validator and execute
         try:
-            validator = validator_class(self._connector, self.settings)
-            start = time.time()
-            result = validator.validate(rule)
-            result.execution_time_ms = (time.time() - start) * 1000
-            return result
+            # One pooled connection serves all of the batch's queries
+            with self._pool.acquire() as connector, connector.session():
+                results: dict[int, ValidationResult] = {}
+                cache_entries: dict[int, tuple[bytes, tuple]] = {}
+                table_versions: dict[str, object] = {}
+                pending = []
+                
+                for i, rule in enumerate(batch):
+                    if self._result_cache_ttl > 0:
+                        cache_key, versions = self._result_cache_key(
+                            rule, VALIDATOR_REGISTRY[rule['type']], connector, table_versions
+                        )
+                        cached = self._get_cached_result(cache_key, versions)
+                        if cached is not None:
+                            results[i] = cached
+                            continue
+                        if versions is not None:
+                            cache_entries[i] = (cache_key, versions)
+                    pending.append(i)
+                
+                if pending:
+                    key = (rule_type, id(connector))
+                    validator = self._validator_cache.get(key)
+                    if validator is None:
+                        validator = validator_class(connector, self.settings)
+                        self._validator_cache[key] = validator
+                    
+                    start = time.time()
+                    if len(pending) == 1:
+                        fresh = [validator.validate(batch[pending[0]])]
+                    else:
+                        fresh = validator.validate_many([batch[i] for i in pending])
+                    elapsed_ms = (time.time() - start) * 1000 / len(pending)
+                    
+                    for i, result in zip(pending, fresh):
+                        result.execution_time_ms = elapsed_ms
+                        results[i] = result
+                        if i in cache_entries and result.error_message is None:
+                            self._store_result(*cache_entries[i], result)
+            
+            return [results[i] for i in range(len(batch))]
         except Exception as e:
-            return ValidationResult(
-                rule_name=rule['name'],
-                rule_type=rule_type,
-                severity=Severity.from_string(rule['severity']),
-                passed=False,
-                error_message=f"Validator error: {str(e)}"
-            )
+            return [self._failed_result(rule, f"Validator error: {str(e)}") for rule in batch]
+    
+    def _failed_result(self, rule: dict, message: str) -> ValidationResult:
+        """Build the result for a rule that could not be executed."""
+        return ValidationResult(
+            rule_name=rule['name'],
+            rule_type=rule['type'],
+            severity=Severity.from_string(rule['severity']),
+            passed=False,
+            error_message=message
+        )
+    
+    @staticmethod
+    def _has_critical_failure(results: list[ValidationResult]) -> bool:
+        """Check whether any result is a failed critical rule."""
+        return any(r.failed and r.severity == Severity.CRITICAL for r in results)
+    
+    def _result_cache_key(
+        self,
+        rule: dict,
+        validator_class: type[BaseValidator],
+        connector,
+        table_versions: dict[str, object] | None = None
+    ) -> tuple[bytes, tuple | None]:
+        """
+        Compute the result cache key and data versions for a rule.
+        
+        Args:
+            rule: Rule configuration dictionary
+            validator_class: Validator class of the rule's type
+            connector: Connector the rule runs on
+            table_versions: Versions already read for this batch, by
+                table; filled in as tables are looked up, so rules on
+                the same table share one get_table_version() call
+        
+        Returns:
+            Tuple of (rule digest, source table versions); versions is
+            None when any table's version is unknown (not cacheable)
+        """
+        payload = json.dumps(
+            [self.connection_name, self.settings.get('sample_size', 5), rule],
+            sort_keys=True,
+            default=str
+        )
+        digest = hashlib.sha256(payload.encode()).digest()
+        
+        tables = validator_class.source_tables(rule)
+        if not tables:
+            return digest, None
+        
+        if table_versions is None:
+            table_versions = {}
+        for table in tables:
+            if table not in table_versions:
+                table_versions[table] = connector.get_table_version(table)
+        
+        versions = tuple(table_versions[t] for t in tables)
+        if any(v is None for v in versions):
+            return digest, None
+        return digest, versions
+    
+    def _get_cached_result(self, key: bytes, versions: tuple | None) -> ValidationResult | None:
+        """Return a copy of a fresh cached result for the same data, if any."""
+        if versions is None:
+            return None
+        
+        with self._result_cache_lock:
+            entry = self._result_cache.pop(key, None)
+            if entry is None:
+                return None
+            
+            stored_at, stored_versions, result = entry
+            if stored_versions != versions or time.monotonic() - stored_at >= self._result_cache_ttl:
+                return None
+            
+            # Re-insert so eviction drops the least recently used entry
+            self._result_cache[key] = entry
+        
+        return dataclasses.replace(
+            result,
+            execution_time_ms=0.0,
+            metadata={**result.metadata, 'cached': True}
+        )
+    
+    def _store_result(self, key: bytes, versions: tuple, result: ValidationResult) -> None:
+        """Cache a result, evicting the least recently used entry when full."""
+        with self._result_cache_lock:
+            self._result_cache.pop(key, None)
+            if len(self._result_cache) >= self._result_cache_size:
+                del self._result_cache[next(iter(self._result_cache))]
+            self._result_cache[key] = (time.monotonic(), versions, result)
     
     def run_single_rule(self, rule: dict) -> ValidationResult:
         """
@@ -235,14 +586,8 @@ class RuleEngine:
         Returns:
             ValidationResult
         """
-        conn_config = self.config.get_connection(self.connection_name)
-        self._connector = create_connector(conn_config)
-        
-        try:
-            self._connector.connect()
-            return self._execute_rule(rule)
-        finally:
-            self._connector.disconnect()
+        self._ensure_pool()
+        return self._execute_rule(normalize_rule(dict(rule)))
     
     def dry_run(self) -> list[dict]:
         """
@@ -257,8 +602,8 @@ class RuleEngine:
                 'name': r['name'],
                 'type': r['type'],
                 'severity': r['severity'],
-                'table': r.get('table', 'N/A'),
-                'description': r.get('description', '')
+                'table': r['table'] or 'N/A',
+                'description': r['description']
             }
             for r in rules
         ]
@@ -9,34 +9,86 @@ Each validator type checks for a specific category of data quality issue:
 - Pattern: Format validation with regex
 - Outliers: Statistical anomalies
 - Custom SQL: Flexible user-defined checks
+
+FusedValidator is not a rule type: it counts rules of several of the
+above types on one table in a single scan.
 """
 
+import importlib
+from collections.abc import Mapping
+from typing import Iterator
+
 from src.validators.base import (
     BaseValidator,
     ValidationResult,
     ValidationReport,
     Severity
 )
-from src.validators.completeness import CompletenessValidator
-from src.validators.referential import ReferentialIntegrityValidator
-from src.validators.duplicates import DuplicatesValidator
-from src.validators.range_check import RangeValidator
-from src.validators.pattern import PatternValidator
-from src.validators.outliers import OutliersValidator
-from src.validators.custom_sql import CustomSQLValidator
+# Validator implementations are imported on first use, so commands that
+# never execute a rule (dry run, config checks) skip loading them
+_LAZY_CLASSES = {
+    'CompletenessValidator': 'src.validators.completeness',
+    'ReferentialIntegrityValidator': 'src.validators.referential',
+    'DuplicatesValidator': 'src.validators.duplicates',
+    'RangeValidator': 'src.validators.range_check',
+    'PatternValidator': 'src.validators.pattern',
+    'OutliersValidator': 'src.validators.outliers',
+    'CustomSQLValidator': 'src.validators.custom_sql',
+    'FusedValidator': 'src.validators.fused',
+}
+
+
+def _load_class(name: str) -> type[BaseValidator]:
+    """Import the module defining a validator class and return the class."""
+    return getattr(importlib.import_module(_LAZY_CLASSES[name]), name)
+
+
+class _LazyRegistry(Mapping):
+    """Read-only mapping of rule types to validator classes, resolved on access."""
+    
+    def __init__(self, class_names: dict[str, str]):
+        self._class_names = class_names
+        self._resolved: dict[str, type[BaseValidator]] = {}
+    
+    def __getitem__(self, rule_type: str) -> type[BaseValidator]:
+        try:
+            return self._resolved[rule_type]
+        except KeyError:
+            validator_class = _load_class(self._class_names[rule_type])
+            self._resolved[rule_type] = validator_class
+            return validator_class
+    
+    def __contains__(self, rule_type: object) -> bool:
+        # Membership checks (config validation) must not import anything
+        return rule_type in self._class_names
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._class_names)
+    
+    def __len__(self) -> int:
+        return len(self._class_names)
 
 
 # Registry mapping rule types to validator classes
-VALIDATOR_REGISTRY: dict[str, type[BaseValidator]] = {
-    'completeness': CompletenessValidator,
-    'referential_integrity': ReferentialIntegrityValidator,
-    'duplicates': DuplicatesValidator,
-    'uniqueness': DuplicatesValidator,  # Alias - duplicates with single column
-    'range': RangeValidator,
-    'pattern': PatternValidator,
-    'outliers': OutliersValidator,
-    'custom_sql': CustomSQLValidator,
-}
+VALIDATOR_REGISTRY: Mapping[str, type[BaseValidator]] = _LazyRegistry({
+    'completeness': 'CompletenessValidator',
+    'referential_integrity': 'ReferentialIntegrityValidator',
+    'duplicates': 'DuplicatesValidator',
+    'uniqueness': 'DuplicatesValidator',  # Alias - duplicates with single column
+    'range': 'RangeValidator',
+    'pattern': 'PatternValidator',
+    'outliers': 'OutliersValidator',
+    'custom_sql': 'CustomSQLValidator',
+})
+
+
+def __getattr__(name: str):
+    """Resolve validator classes lazily (PEP 562)."""
+    if name in _LAZY_CLASSES:
+        validator_class = _load_class(name)
+        globals()[name] = validator_class
+        return validator_class
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_validator(rule_type: str) -> type[BaseValidator] | None:
@@ -45,7 +97,7 @@ def get_validator(rule_type: str) -> type[BaseValidator] | None:
     
     Args:
         rule_type: The type of validation rule
-        
+    
     Returns:
         Validator class or None if not found
     """
@@ -69,34 +121,8 @@ __all__ = [
     'PatternValidator',
     'OutliersValidator',
     'CustomSQLValidator',
+    'FusedValidator',
     'VALIDATOR_REGISTRY',
     'get_validator',
     'list_validator_types',
-]
-    Returns:
-        Validator class or None if not found
-    """
-    return VALIDATOR_REGISTRY.get(rule_type.lower())
-
-
-def list_validators() -> list[str]:
-    """Return list of available validator types."""
-    return list(VALIDATOR_REGISTRY.keys())
-
-
-__all__ = [
-    'BaseValidator',
-    'ValidationResult',
-    'ValidationReport',
-    'Severity',
-    'CompletenessValidator',
-    'ReferentialIntegrityValidator',
-    'DuplicatesValidator',
-    'RangeValidator',
-    'PatternValidator',
-    'OutliersValidator',
-    'CustomSQLValidator',
-    'VALIDATOR_REGISTRY',
-    'get_validator',
-    'list_validators',
 ]
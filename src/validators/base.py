@@ -4,10 +4,14 @@ Base validator class defining the interface for all validators.
 All validation types inherit from BaseValidator and implement the validate() method.
 """
 
+import time
 from abc import ABC, abstractmethod
+from contextlib import closing
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import cached_property, lru_cache
+from itertools import islice
 from typing import Any, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -24,15 +28,35 @@ class Severity(Enum):
     @classmethod
     def from_string(cls, value: str) -> "Severity":
         """Convert string to Severity enum."""
-        return cls(value.lower())
+        # Called for every result built; common spellings skip lower()
+        # and the enum's value lookup
+        severity = _SEVERITY_NAMES.get(value)
+        if severity is None:
+            severity = cls(value.lower())
+        return severity
     
     def __lt__(self, other: "Severity") -> bool:
         """Enable sorting by severity (critical > high > medium > low)."""
-        order = [Severity.CRITICAL, Severity.HIGH, Severity.MEDIUM, Severity.LOW]
-        return order.index(self) > order.index(other)
+        return _SEVERITY_RANK[self] < _SEVERITY_RANK[other]
 
 
-@dataclass
+# Severity by configured spelling ('high', 'HIGH', 'High')
+_SEVERITY_NAMES = {
+    spelling: severity
+    for severity in Severity
+    for spelling in (severity.value, severity.value.upper(), severity.value.capitalize())
+}
+
+# Ordinal per severity (higher is more severe), used for comparisons
+_SEVERITY_RANK = {
+    Severity.LOW: 0,
+    Severity.MEDIUM: 1,
+    Severity.HIGH: 2,
+    Severity.CRITICAL: 3,
+}
+
+
+@dataclass(slots=True)
 class ValidationResult:
     """
     Result of a single validation rule execution.
@@ -71,6 +95,8 @@ class ValidationResult:
     
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
+        # A dict display is the fastest way to build this in CPython
+        # (faster than dict(zip(keys, values)) or dataclasses.asdict)
         return {
             'rule_name': self.rule_name,
             'rule_type': self.rule_type,
@@ -105,50 +131,80 @@ class ValidationReport:
     results: list[ValidationResult]
     settings: dict = field(default_factory=dict)
     
+    @cached_property
+    def timestamp_iso(self) -> str:
+        """Timestamp in ISO-8601 format (formatted once per report)."""
+        return self.timestamp.isoformat()
+    
+    @cached_property
+    def timestamp_display(self) -> str:
+        """Timestamp formatted for human-readable output."""
+        return self.timestamp.strftime('%Y-%m-%d %H:%M:%S')
+    
+    @cached_property
+    def timestamp_slug(self) -> str:
+        """Timestamp formatted for use in file names."""
+        return self.timestamp.strftime('%Y%m%d_%H%M%S')
+    
     @property
     def total_rules(self) -> int:
         """Total number of rules executed."""
         return len(self.results)
     
+    @cached_property
+    def _summary(self) -> tuple[int, dict[Severity, list[ValidationResult]]]:
+        """
+        Passed count and failures grouped by severity, from one pass.
+        
+        Computed on first use and cached; results must not be modified
+        after the report has been summarized.
+        """
+        passed = 0
+        failures: dict[Severity, list[ValidationResult]] = {s: [] for s in Severity}
+        for result in self.results:
+            if result.passed:
+                passed += 1
+            else:
+                failures[result.severity].append(result)
+        return passed, failures
+    
     @property
     def passed_count(self) -> int:
         """Number of rules that passed."""
-        return sum(1 for r in self.results if r.passed)
+        return self._summary[0]
     
     @property
     def failed_count(self) -> int:
         """Number of rules that failed."""
-        return sum(1 for r in self.results if r.failed)
+        return len(self.results) - self._summary[0]
     
     @property
     def failed_results(self) -> list[ValidationResult]:
         """Get only failed results, sorted by severity."""
-        failed = [r for r in self.results if r.failed]
-        return sorted(failed, key=lambda r: r.severity)
+        # _SEVERITY_RANK is in ascending rank order, so concatenating the
+        # buckets gives the same order as a stable sort by severity
+        failures = self._summary[1]
+        return [r for s in _SEVERITY_RANK for r in failures[s]]
     
     @property
     def critical_failures(self) -> list[ValidationResult]:
         """Get critical severity failures."""
-        return [r for r in self.results if r.failed and r.severity == Severity.CRITICAL]
+        return list(self._summary[1][Severity.CRITICAL])
     
     @property
     def high_failures(self) -> list[ValidationResult]:
         """Get high severity failures."""
-        return [r for r in self.results if r.failed and r.severity == Severity.HIGH]
+        return list(self._summary[1][Severity.HIGH])
     
     def failures_by_severity(self) -> dict[str, int]:
         """Count failures grouped by severity."""
-        counts = {'critical': 0, 'high': 0, 'medium': 0, 'low': 0}
-        for result in self.results:
-            if result.failed:
-                counts[result.severity.value] += 1
-        return counts
+        return {s.value: len(failures) for s, failures in self._summary[1].items()}
     
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
         return {
             'connection_name': self.connection_name,
-            'timestamp': self.timestamp.isoformat(),
+            'timestamp': self.timestamp_iso,
             'duration_seconds': self.duration_seconds,
             'summary': {
                 'total_rules': self.total_rules,
@@ -161,6 +217,93 @@ class ValidationReport:
         }
 
 
+# Row-limiting wrapper per connector dialect (see BaseConnector.dialect)
+_LIMIT_FORMATS = {
+    'mssql': 'SELECT TOP {limit} * FROM ({query}) AS t{order}',
+    'sqlite': 'SELECT * FROM ({query}) AS t{order} LIMIT {limit}',
+    'postgres': 'SELECT * FROM ({query}) AS t{order} LIMIT {limit}',
+    'mysql': 'SELECT * FROM ({query}) AS t{order} LIMIT {limit}',
+}
+
+
+# Sample record values of these exact types are already JSON-friendly
+# and are kept as-is; one set lookup replaces an isinstance() chain
+_JSON_SCALARS = frozenset({str, int, float, bool, type(None)})
+
+
+# Identifier quoting per connector dialect, for SQL built outside a
+# validator instance (e.g. in cached query builders)
+_QUOTE_FORMATS = {
+    'mssql': '[{}]',
+    'sqlite': '"{}"',
+    'postgres': '"{}"',
+    'mysql': '`{}`',
+}
+
+
+# Bind placeholder per connector dialect: pyodbc binds the params dict
+# positionally, sqlite3 and the DB-API "pyformat" drivers by name
+_PARAM_FORMATS = {
+    'mssql': '?',
+    'sqlite': ':{}',
+    'postgres': '%({})s',
+    'mysql': '%({})s',
+}
+
+
+def _dialect_param(name: str, dialect: str) -> str:
+    """
+    Bind placeholder for a named query parameter in the given dialect.
+    
+    Positional dialects ignore the name, so the params dict must list
+    values in the order their placeholders appear in the query.
+    """
+    return _PARAM_FORMATS.get(dialect, _PARAM_FORMATS['mssql']).format(name)
+
+
+@lru_cache(maxsize=4096)
+def _dialect_quote(name: str, dialect: str) -> str:
+    """
+    Quote an identifier for the given connector dialect.
+    
+    Memoized: the builders call it several times per column, and rule
+    suites quote the same few table and column names over and over.
+    """
+    quote_format = _QUOTE_FORMATS.get(dialect, _QUOTE_FORMATS['mssql'])
+    return quote_format.format(name.strip('[]"\'`'))
+
+
+def _dialect_limit(query: str, limit: int, dialect: str, order_by: str | None = None) -> str:
+    """Wrap a query in the dialect's row-limiting syntax."""
+    limit_format = _LIMIT_FORMATS.get(dialect, _LIMIT_FORMATS['mssql'])
+    order = f" ORDER BY {order_by}" if order_by else ""
+    return limit_format.format(query=query, limit=limit, order=order)
+
+
+@lru_cache(maxsize=512)
+def _violations_sql(query: str, limit: int, dialect: str) -> str:
+    """Add a window count to a violation query and limit its rows."""
+    return _dialect_limit(
+        f"SELECT v.*, COUNT(*) OVER () AS _violation_count FROM ({query}) AS v",
+        limit,
+        dialect
+    )
+
+
+def _bracket_quote(name: str) -> str:
+    """Default SQL Server style identifier quoting."""
+    return f'[{name}]'
+
+
+# Table and column statistics shared by the validators of every rule,
+# keyed by (id of the connection config, *stats key). Each entry keeps
+# its config so a recycled id never matches, and the table's data
+# version so it is never used after a write: (loaded_at, config,
+# version, value).
+_STATS_CACHE: dict[tuple, tuple[float, dict, Any, Any]] = {}
+_STATS_CACHE_MAX = 1024
+
+
 class BaseValidator(ABC):
     """
     Abstract base class for all validators.
@@ -168,10 +311,24 @@ class BaseValidator(ABC):
     Subclasses must implement:
         - validator_type: Class attribute identifying the validation type
         - validate(): Method that performs the actual validation
+    
+    RuleEngine reuses one instance for many rules (including from
+    several threads when the connector is shared), so validate() must
+    keep per-rule state in locals rather than on self.
     """
     
     validator_type: str = "base"  # Override in subclasses
     
+    # Whether validate_many() can check several rules on the same table
+    # more cheaply than one validate() call each. RuleEngine groups such
+    # rules by table when True.
+    batchable: bool = False
+    
+    # Whether compile_predicate() can express a rule as one condition on
+    # its table's rows. RuleEngine fuses such rules on the same table,
+    # whatever their type, into one aggregate scan (see FusedValidator).
+    fusable: bool = False
+    
     def __init__(self, connector: "BaseConnector", settings: dict | None = None):
         """
         Initialize validator with database connector.
@@ -183,6 +340,10 @@ class BaseValidator(ABC):
         self.connector = connector
         self.settings = settings or {}
         self.sample_size = self.settings.get('sample_size', 5)
+        
+        # Identifier quoting, resolved once: called for every table and
+        # column name in every query. Falls back to SQL Server style.
+        self._quote = getattr(connector, 'quote_identifier', None) or _bracket_quote
     
     @abstractmethod
     def validate(self, rule: dict) -> ValidationResult:
@@ -191,12 +352,58 @@ class BaseValidator(ABC):
         
         Args:
             rule: Rule configuration dictionary
-            
+        
         Returns:
             ValidationResult with pass/fail status and details
         """
         pass
     
+    def validate_many(self, rules: list[dict]) -> list[ValidationResult]:
+        """
+        Execute validation for several rules of this type on one table.
+        
+        Args:
+            rules: Rule configurations (same type and table)
+        
+        Returns:
+            One ValidationResult per rule, in the same order
+        """
+        return [self.validate(rule) for rule in rules]
+    
+    def compile_predicate(self, rule: dict, prefix: str = "") -> tuple[str, dict, dict] | None:
+        """
+        Express a rule as a boolean SQL condition on its table's rows.
+        
+        Lets FusedValidator count the violations of many rules in one
+        aggregate query. Implemented by validators with fusable = True.
+        
+        Args:
+            rule: Rule configuration dictionary
+            prefix: Prefix for bind parameter names, keeping them unique
+                among the rules of one fused query
+        
+        Returns:
+            Tuple of (condition true for violating rows, bind parameters
+            in placeholder order, result metadata), or None if the rule
+            cannot be expressed as a predicate
+        """
+        return None
+    
+    @classmethod
+    def source_tables(cls, rule: dict) -> list[str] | None:
+        """
+        Tables a rule reads from, used to validate cached results.
+        
+        Args:
+            rule: Rule configuration dictionary
+        
+        Returns:
+            Table names, or None if they cannot be determined (the
+            rule's results are then never cached)
+        """
+        table = rule.get('table')
+        return [table] if table else None
+    
     def _build_result(
         self,
         rule: dict,
@@ -218,10 +425,14 @@ class BaseValidator(ABC):
             query: SQL query used
             error_message: Error if validation failed to execute
             metadata: Additional data
-            
+        
         Returns:
             Populated ValidationResult
         """
+        metadata = metadata or {}
+        if violation_count > 0 and not rule.get('include_samples', True):
+            metadata['samples_omitted'] = True
+        
         return ValidationResult(
             rule_name=rule['name'],
             rule_type=rule['type'],
@@ -233,9 +444,65 @@ class BaseValidator(ABC):
             table=rule.get('table', ''),
             description=rule.get('description', ''),
             error_message=error_message,
-            metadata=metadata or {}
+            metadata=metadata
+        )
+    
+    def _get_stats(self, key: tuple) -> Any:
+        """
+        Look up statistics cached by a recent rule on the same connection.
+        
+        Args:
+            key: Stats key, e.g. ('quartiles', table, column); the second
+                element is always the table
+        
+        Returns:
+            Cached value, or None if missing, older than stats_cache_ttl,
+            or the table's data version has changed (or is unknown)
+        """
+        ttl = self.settings.get('stats_cache_ttl', 0)
+        if ttl <= 0:
+            return None
+        entry = _STATS_CACHE.get((id(self.connector.config), *key))
+        if entry is None or entry[1] is not self.connector.config:
+            return None
+        if time.monotonic() - entry[0] >= ttl:
+            return None
+        version = self.connector.get_table_version(key[1])
+        if version is None or version != entry[2]:
+            return None
+        return entry[3]
+    
+    def _put_stats(self, key: tuple, value: Any) -> None:
+        """Cache statistics for other rules on the same connection."""
+        if self.settings.get('stats_cache_ttl', 0) <= 0:
+            return
+        version = self.connector.get_table_version(key[1])
+        if version is None:
+            return
+        if len(_STATS_CACHE) >= _STATS_CACHE_MAX:
+            _STATS_CACHE.clear()
+        _STATS_CACHE[(id(self.connector.config), *key)] = (
+            time.monotonic(), self.connector.config, version, value
         )
     
+    def _estimated_rowcount(self, table: str) -> int | None:
+        """Connector row-count estimate, shared across rules (see _get_stats)."""
+        estimate = self._get_stats(('rows', table))
+        if estimate is None:
+            estimate = self.connector.estimate_row_count(table)
+            if estimate is not None:
+                self._put_stats(('rows', table), estimate)
+        return estimate
+    
+    def _sample_limit(self, rule: dict) -> int:
+        """
+        Number of sample records to fetch for a rule.
+        
+        Rules with include_samples: false only need pass/fail and a
+        count, so no sample query is run for them.
+        """
+        return self.sample_size if rule.get('include_samples', True) else 0
+    
     def _get_sample(self, records: list[dict]) -> list[dict]:
         """Return up to sample_size records."""
         return records[:self.sample_size]
@@ -246,8 +513,105 @@ class BaseValidator(ABC):
     
     def _quote_identifier(self, name: str) -> str:
         """Quote a table or column name for SQL."""
-        # Use connector's quoting if available
-        if hasattr(self.connector, 'quote_identifier'):
-            return self.connector.quote_identifier(name)
-        # Default to SQL Server style
-        return f'[{name}]'
+        return self._quote(name)
+    
+    def _dialect(self) -> str:
+        """SQL dialect of the connector (see BaseConnector.dialect)."""
+        return getattr(self.connector, 'dialect', 'mssql')
+    
+    def _limit_query(self, query: str, limit: int, order_by: str | None = None) -> str:
+        """
+        Wrap a query so it returns at most `limit` rows.
+        
+        The syntax is chosen from the connector's dialect up front,
+        rather than trying OFFSET/FETCH, TOP and LIMIT in turn.
+        
+        Args:
+            query: SELECT query without ORDER BY
+            limit: Maximum number of rows
+            order_by: Optional ORDER BY expression over the query's columns
+        
+        Returns:
+            Row-limited SQL query
+        """
+        return _dialect_limit(query, limit, self._dialect(), order_by)
+    
+    def _fetch_violations(
+        self,
+        query: str,
+        rule: dict,
+        params: dict | None = None
+    ) -> tuple[int, list[dict]]:
+        """
+        Count a violation query's rows and fetch a sample in one scan.
+        
+        A window count is added to the row-limited query, so the total
+        arrives on every sample row instead of needing a separate COUNT
+        through the same predicate.
+        
+        Args:
+            query: SELECT query returning violating records
+            rule: Rule configuration (for include_samples)
+            params: Values for the query's bind placeholders
+        
+        Returns:
+            Tuple of (violation_count, sample_records)
+        """
+        sample_limit = self._sample_limit(rule)
+        rows = self.connector.execute_query(
+            _violations_sql(query, max(sample_limit, 1), self._dialect()),
+            params
+        )
+        if not rows:
+            return 0, []
+        
+        violation_count = int(rows[0]['_violation_count'])
+        for row in rows:
+            del row['_violation_count']
+        return violation_count, rows[:sample_limit]
+    
+    def _fetch_sample(self, query: str, limit: int, params: dict | None = None) -> list[dict]:
+        """
+        Stream a query and keep only its first rows.
+        
+        For queries that cannot be wrapped in a row limit: at most limit
+        rows are converted and held, and the cursor is closed as soon
+        as they have been read.
+        
+        Args:
+            query: SELECT query
+            limit: Maximum number of rows to return
+            params: Values for the query's bind placeholders
+        
+        Returns:
+            Up to limit row dictionaries
+        """
+        with closing(self.connector.execute_query_iter(query, params)) as rows:
+            return list(islice(rows, limit))
+    
+    def _serialize_records(self, records: list[dict]) -> list[dict]:
+        """
+        Convert records to JSON-serializable format.
+        
+        Rows whose values are all plain scalars (the usual case, e.g.
+        every SQLite row without BLOBs) are checked with one C-level
+        superset test and returned as they are; only rows holding dates,
+        decimals and the like are rebuilt value by value.
+        """
+        scalars = _JSON_SCALARS
+        serialize = self._serialize_value
+        return [
+            record if scalars.issuperset(map(type, record.values()))
+            else {k: v if type(v) in scalars else serialize(v) for k, v in record.items()}
+            for record in records
+        ]
+    
+    def _serialize_value(self, value: Any) -> Any:
+        """Convert value to JSON-serializable format."""
+        if type(value) in _JSON_SCALARS:
+            return value
+        # Subclasses of the basic types (e.g. IntEnum) stay as they are
+        if isinstance(value, (int, float, str)):
+            return value
+        # Handle dates, decimals, bytes, etc.
+        return str(value)
@@ -5,10 +5,90 @@ This is one of the most common data quality checks, ensuring that mandatory
 fields are populated.
 """
 
-import time
-from typing import Any
+import functools
 
-from src.validators.base import BaseValidator, ValidationResult
+from src.validators.base import BaseValidator, ValidationResult, _dialect_limit, _dialect_quote
+
+
+@functools.lru_cache(maxsize=512)
+def _completeness_predicates(
+    columns: tuple[str, ...],
+    check_empty: bool,
+    check_whitespace: bool,
+    dialect: str
+) -> tuple[str, tuple[str, ...]]:
+    """
+    Build the violation predicate for a set of columns.
+    
+    Returns:
+        Tuple of (WHERE clause matching any incomplete column, one CASE
+        expression per column naming it when incomplete)
+    """
+    # One condition per column; used both in WHERE and to report
+    # which column(s) are incomplete for each record
+    conditions = []
+    case_expressions = []
+    for col in columns:
+        quoted = _dialect_quote(col, dialect)
+        col_conds = [f'{quoted} IS NULL']
+        if check_empty:
+            col_conds.append(f"{quoted} = ''")
+        if check_whitespace:
+            col_conds.append(f"LTRIM(RTRIM({quoted})) = ''")
+        
+        col_condition = ' OR '.join(col_conds)
+        conditions.append(f'({col_condition})')
+        case_expressions.append(f"CASE WHEN {col_condition} THEN '{col}' ELSE NULL END")
+    
+    return ' OR '.join(conditions), tuple(case_expressions)
+
+
+@functools.lru_cache(maxsize=512)
+def _build_completeness_sql(
+    table: str,
+    columns: tuple[str, ...],
+    check_empty: bool,
+    check_whitespace: bool,
+    dialect: str,
+    sample_size: int
+) -> str:
+    """
+    Build the violation query for a completeness rule.
+    
+    A single query returns up to sample_size violating rows, each also
+    carrying the total violation count (COUNT(*) OVER () is evaluated
+    before the row limit), so the predicate is scanned once per rule.
+    
+    Memoized on the rule signature, so repeated runs of the same rule
+    (scheduled monitors, multiple partitions) skip rebuilding the SQL.
+    
+    Args:
+        table: Table to validate
+        columns: Column names to check
+        check_empty: Flag empty strings as violations
+        check_whitespace: Flag whitespace-only strings as violations
+        dialect: Connector dialect, selects identifier quoting and
+            row-limiting syntax
+        sample_size: Number of violating rows to return
+    
+    Returns:
+        SQL query string
+    """
+    where_clause, case_expressions = _completeness_predicates(
+        columns, check_empty, check_whitespace, dialect
+    )
+    
+    # Sample rows plus the total count in one round trip. At least one
+    # row is fetched so the count is still available when sample_size is 0.
+    query = f"""
+        SELECT
+            *,
+            CONCAT_WS(', ', {', '.join(case_expressions)}) AS _incomplete_columns,
+            COUNT(*) OVER () AS _violation_count
+        FROM {_dialect_quote(table, dialect)}
+        WHERE {where_clause}
+    """
+    return _dialect_limit(query, max(sample_size, 1), dialect)
 
 
 class CompletenessValidator(BaseValidator):
@@ -20,7 +100,8 @@ class CompletenessValidator(BaseValidator):
         columns: List of column names to check
         check_empty_strings: Also flag empty strings as violations (default: True)
         check_whitespace: Also flag whitespace-only strings (default: False)
-        
+        include_samples: Fetch sample violating records (default: True)
+    
     Example rule:
         - name: clients_required_fields
           table: clients
@@ -31,82 +112,30 @@ class CompletenessValidator(BaseValidator):
     """
     
     validator_type = "completeness"
+    batchable = True
+    fusable = True
     
     def validate(self, rule: dict) -> ValidationResult:
         """Check for NULL/empty values in specified columns."""
-        start_time = time.time()
-        
         table = rule['table']
         columns = rule['columns']
         check_empty = rule.get('check_empty_strings', True)
         check_whitespace = rule.get('check_whitespace', False)
+        sample_limit = self._sample_limit(rule)
         
-        # Build WHERE conditions for each column
-        conditions = []
-        for col in columns:
-            col_conditions = [f'{self._quote_identifier(col)} IS NULL']
-            
-            if check_empty:
-                col_conditions.append(f'{self._quote_identifier(col)} = \'\'')
-                
-            if check_whitespace:
-                col_conditions.append(f'LTRIM(RTRIM({self._quote_identifier(col)})) = \'\'')
-            
-            conditions.append(f'({" OR ".join(col_conditions)})')
-        
-        where_clause = ' OR '.join(conditions)
-        
-        # Build query to find violations
-        # We want to know which column(s) are incomplete for each record
-        case_expressions = []
-        for col in columns:
-            col_conds = [f'{self._quote_identifier(col)} IS NULL']
-            if check_empty:
-                col_conds.append(f'{self._quote_identifier(col)} = \'\'')
-            if check_whitespace:
-                col_conds.append(f'LTRIM(RTRIM({self._quote_identifier(col)})) = \'\'')
-            
-            case_expr = f"CASE WHEN {' OR '.join(col_conds)} THEN '{col}' ELSE NULL END"
-            case_expressions.append(case_expr)
-        
-        # Query with violation details
-        query = f"""
-            SELECT 
-                *,
-                CONCAT_WS(', ', {', '.join(case_expressions)}) AS _incomplete_columns
-            FROM {self._quote_identifier(table)}
-            WHERE {where_clause}
-        """
-        
-        # Count query (more efficient for large tables)
-        count_query = f"""
-            SELECT COUNT(*) as violation_count
-            FROM {self._quote_identifier(table)}
-            WHERE {where_clause}
-        """
+        query = _build_completeness_sql(
+            table,
+            tuple(columns),
+            check_empty,
+            check_whitespace,
+            self._dialect(),
+            sample_limit
+        )
         
         try:
-            # Get count first
-            count_result = self.connector.execute_query(count_query)
-            violation_count = count_result[0]['violation_count'] if count_result else 0
-            
-            # Get sample records if there are violations
-            sample_records = []
-            if violation_count > 0:
-                sample_query = f"{query} OFFSET 0 ROWS FETCH NEXT {self.sample_size} ROWS ONLY"
-                try:
-                    sample_records = self.connector.execute_query(sample_query)
-                except Exception:
-                    # Fallback for databases that don't support OFFSET/FETCH
-                    sample_query = f"SELECT TOP {self.sample_size} * FROM ({query}) AS t"
-                    try:
-                        sample_records = self.connector.execute_query(sample_query)
-                    except Exception:
-                        # Last resort: just get all and limit in Python
-                        all_records = self.connector.execute_query(query)
-                        sample_records = all_records[:self.sample_size]
-            
-            execution_time = (time.time() - start_time) * 1000
+            records = self.connector.execute_query(query)
+            violation_count = records[0]['_violation_count'] if records else 0
+            sample_records = records[:sample_limit]
             
             return self._build_result(
                 rule=rule,
@@ -120,9 +149,8 @@ class CompletenessValidator(BaseValidator):
                     'check_whitespace': check_whitespace
                 }
             )
-            
+        
         except Exception as e:
-            execution_time = (time.time() - start_time) * 1000
             return self._build_result(
                 rule=rule,
                 passed=False,
@@ -130,6 +158,114 @@ class CompletenessValidator(BaseValidator):
                 query=query.strip()
             )
     
+    def validate_many(self, rules: list[dict]) -> list[ValidationResult]:
+        """
+        Validate several completeness rules on the same table in one scan.
+        
+        One aggregate query counts the violations of every rule; only
+        rules that actually failed fetch sample records, together in one
+        execute_batch() call. Falls back to validating rules one by one
+        if the aggregate or the sample batch fails.
+        """
+        dialect = self._dialect()
+        
+        counts = []
+        for i, rule in enumerate(rules):
+            where_clause, _ = _completeness_predicates(
+                tuple(rule['columns']),
+                rule.get('check_empty_strings', True),
+                rule.get('check_whitespace', False),
+                dialect
+            )
+            counts.append(f"SUM(CASE WHEN {where_clause} THEN 1 ELSE 0 END) AS _r{i}")
+        
+        count_query = f"""
+            SELECT
+                {', '.join(counts)}
+            FROM {_dialect_quote(rules[0]['table'], dialect)}
+        """
+        
+        try:
+            row = self.connector.execute_query(count_query)[0]
+        except Exception:
+            return [self.validate(rule) for rule in rules]
+        
+        # Rules that failed fetch their samples together: one round trip
+        # on connectors that support multi-statement batches. Rules
+        # without samples are fully answered by the aggregate.
+        failed = [
+            i for i in range(len(rules))
+            if row[f'_r{i}'] and self._sample_limit(rules[i])
+        ]
+        sample_queries = [
+            _build_completeness_sql(
+                rules[i]['table'],
+                tuple(rules[i]['columns']),
+                rules[i].get('check_empty_strings', True),
+                rules[i].get('check_whitespace', False),
+                dialect,
+                self.sample_size
+            )
+            for i in failed
+        ]
+        try:
+            samples = dict(zip(failed, self.connector.execute_batch(sample_queries)))
+        except Exception:
+            samples = {}
+        
+        results = []
+        for i, rule in enumerate(rules):
+            metadata = {
+                'columns_checked': rule['columns'],
+                'check_empty_strings': rule.get('check_empty_strings', True),
+                'check_whitespace': rule.get('check_whitespace', False)
+            }
+            
+            # SUM over an empty table is NULL
+            if not row[f'_r{i}']:
+                results.append(self._build_result(
+                    rule=rule,
+                    passed=True,
+                    query=count_query.strip(),
+                    metadata=metadata
+                ))
+            elif not self._sample_limit(rule):
+                results.append(self._build_result(
+                    rule=rule,
+                    passed=False,
+                    violation_count=int(row[f'_r{i}']),
+                    query=count_query.strip(),
+                    metadata=metadata
+                ))
+            elif i in samples:
+                records = samples[i]
+                violation_count = records[0]['_violation_count'] if records else 0
+                results.append(self._build_result(
+                    rule=rule,
+                    passed=violation_count == 0,
+                    violation_count=violation_count,
+                    sample_records=self._clean_sample_records(records[:self.sample_size]),
+                    query=sample_queries[failed.index(i)].strip(),
+                    metadata=metadata
+                ))
+            else:
+                results.append(self.validate(rule))
+        return results
+    
+    def compile_predicate(self, rule: dict, prefix: str = "") -> tuple[str, dict, dict] | None:
+        """Express the rule as one missing-value condition (see BaseValidator)."""
+        check_empty = rule.get('check_empty_strings', True)
+        check_whitespace = rule.get('check_whitespace', False)
+        where_clause, _ = _completeness_predicates(
+            tuple(rule['columns']), check_empty, check_whitespace, self._dialect()
+        )
+        metadata = {
+            'columns_checked': rule['columns'],
+            'check_empty_strings': check_empty,
+            'check_whitespace': check_whitespace
+        }
+        return where_clause, {}, metadata
+    
     def _clean_sample_records(self, records: list[dict]) -> list[dict]:
         """Remove internal columns from sample records for cleaner output."""
         cleaned = []
@@ -144,12 +280,3 @@ class CompletenessValidator(BaseValidator):
                 cleaned_record['incomplete_fields'] = record['_incomplete_columns']
             cleaned.append(cleaned_record)
         return cleaned
-    
-    def _serialize_value(self, value: Any) -> Any:
-        """Convert value to JSON-serializable format."""
-        if value is None:
-            return None
-        if isinstance(value, (int, float, str, bool)):
-            return value
-        # Handle dates, decimals, etc.
-        return str(value)
@@ -5,8 +5,8 @@ Provides maximum flexibility for complex business rules that can't be
 expressed with the built-in validators.
 """
 
-import time
-from typing import Any
+from contextlib import closing
+from itertools import islice
 
 from src.validators.base import BaseValidator, ValidationResult
 
@@ -21,8 +21,10 @@ class CustomSQLValidator(BaseValidator):
     Configuration:
         query: SQL query that returns violating records
         count_query: Optional separate query for counting (more efficient for large results)
+        include_samples: Fetch sample violating records (default: True);
+            false only counts them
         description: Human-readable explanation of what the rule checks
-        
+    
     Example rules:
         - name: active_clients_have_services
           type: custom_sql
@@ -37,7 +39,7 @@ class CustomSQLValidator(BaseValidator):
                 FROM services 
                 WHERE service_date >= DATEADD(month, -6, GETDATE())
               )
-              
+        
         - name: orphan_payments
           type: custom_sql
           severity: critical
@@ -56,10 +58,13 @@ class CustomSQLValidator(BaseValidator):
     
     validator_type = "custom_sql"
     
+    @classmethod
+    def source_tables(cls, rule: dict) -> list[str] | None:
+        """Arbitrary SQL may read any table, so results are never cached."""
+        return None
+    
     def validate(self, rule: dict) -> ValidationResult:
         """Execute custom SQL query and check for violations."""
-        start_time = time.time()
-        
         query = rule.get('query', '').strip()
         count_query = rule.get('count_query', '').strip()
         
@@ -71,28 +76,17 @@ class CustomSQLValidator(BaseValidator):
             )
         
         try:
-            # Get violation count
             if count_query:
-                # Use provided count query
+                # Use provided count query, sampling only when needed
                 count_result = self.connector.execute_query(count_query)
                 violation_count = self._extract_count(count_result)
+                sample_records = []
+                if violation_count > 0 and self._sample_limit(rule):
+                    sample_records = self._get_sample_records(query)
+            elif self._sample_limit(rule):
+                violation_count, sample_records = self._count_and_sample(query)
             else:
-                # Wrap query in COUNT
-                wrapped_count = f"SELECT COUNT(*) as violation_count FROM ({query}) AS validation_results"
-                try:
-                    count_result = self.connector.execute_query(wrapped_count)
-                    violation_count = self._extract_count(count_result)
-                except Exception:
-                    # If wrapping fails, execute query and count in Python
-                    all_results = self.connector.execute_query(query)
-                    violation_count = len(all_results)
-            
-            # Get sample records if there are violations
-            sample_records = []
-            if violation_count > 0:
-                sample_records = self._get_sample_records(query)
-            
-            execution_time = (time.time() - start_time) * 1000
+                violation_count, sample_records = self._count_only(query), []
             
             return self._build_result(
                 rule=rule,
@@ -105,9 +99,8 @@ class CustomSQLValidator(BaseValidator):
                     'has_count_query': bool(count_query)
                 }
             )
-            
+        
         except Exception as e:
-            execution_time = (time.time() - start_time) * 1000
             return self._build_result(
                 rule=rule,
                 passed=False,
@@ -115,6 +108,75 @@ class CustomSQLValidator(BaseValidator):
                 query=query
             )
     
+    def _count_and_sample(self, query: str) -> tuple[int, list[dict]]:
+        """
+        Count violations and fetch a sample in one round-trip.
+        
+        The inner query runs once: a window count over its rows is added
+        as a column, and the row-limited result carries both the total
+        and the sample. Where window functions are not allowed over the
+        query, a single-row COUNT is LEFT JOINed to the sample instead,
+        still in one round trip. Queries that cannot be wrapped fall
+        back to a separate count and sample.
+        
+        Args:
+            query: User query returning violating records
+        
+        Returns:
+            Tuple of (violation_count, sample_records)
+        """
+        inner = query.rstrip(';')
+        windowed = self._limit_query(
+            f"SELECT v.*, COUNT(*) OVER () AS _violation_count FROM ({inner}) AS v",
+            max(self.sample_size, 1)
+        )
+        # Without violations, the join yields one row: the count and NULLs
+        joined = f"""
+            SELECT c._violation_count, s.*
+            FROM (SELECT COUNT(*) AS _violation_count FROM ({inner}) AS v) c
+            LEFT JOIN ({self._limit_query(inner, max(self.sample_size, 1))}) s ON 1 = 1
+        """
+        for combined in (windowed, joined):
+            try:
+                rows = self.connector.execute_query(combined)
+            except Exception:
+                continue
+            violation_count = int(rows[0]['_violation_count']) if rows else 0
+            if not violation_count:
+                return 0, []
+            for row in rows:
+                del row['_violation_count']
+            return violation_count, rows[:self.sample_size]
+        
+        # Wrap query in COUNT
+        try:
+            violation_count = self._wrapped_count(query)
+        except Exception:
+            # If wrapping fails, stream the query and count in Python,
+            # keeping only the sample rows in memory
+            with closing(self.connector.execute_query_iter(query)) as rows:
+                sample_records = list(islice(rows, self.sample_size))
+                violation_count = len(sample_records) + sum(1 for _ in rows)
+            return violation_count, sample_records
+        
+        sample_records = []
+        if violation_count > 0:
+            sample_records = self._get_sample_records(query)
+        return violation_count, sample_records
+    
+    def _count_only(self, query: str) -> int:
+        """Count violations without fetching any records."""
+        try:
+            return self._wrapped_count(query)
+        except Exception:
+            with closing(self.connector.execute_query_iter(query)) as rows:
+                return sum(1 for _ in rows)
+    
+    def _wrapped_count(self, query: str) -> int:
+        """Count the rows of a query by wrapping it in COUNT(*)."""
+        wrapped_count = f"SELECT COUNT(*) as violation_count FROM ({query}) AS validation_results"
+        return self._extract_count(self.connector.execute_query(wrapped_count))
+    
     def _extract_count(self, result: list[dict]) -> int:
         """Extract count from query result."""
         if not result:
@@ -135,56 +197,16 @@ class CustomSQLValidator(BaseValidator):
     
     def _get_sample_records(self, query: str) -> list[dict]:
         """Get sample of violating records."""
-        # Try different pagination syntaxes
-        try:
-            # SQL Server / PostgreSQL OFFSET FETCH
-            sample_query = f"{query} OFFSET 0 ROWS FETCH NEXT {self.sample_size} ROWS ONLY"
-            return self.connector.execute_query(sample_query)
-        except Exception:
-            pass
-        
-        try:
-            # SQL Server TOP
-            # This is hacky but works for simple queries
-            if query.upper().strip().startswith('SELECT'):
-                sample_query = query.replace('SELECT', f'SELECT TOP {self.sample_size}', 1)
-                return self.connector.execute_query(sample_query)
-        except Exception:
-            pass
-        
+        # Wrap in the connector's row-limiting syntax. Arbitrary user SQL
+        # may not be wrappable (CTEs, ORDER BY in SQL Server subqueries),
+        # so fall back to streaming the query and keeping the first rows.
         try:
-            # PostgreSQL / SQLite LIMIT
-            sample_query = f"{query} LIMIT {self.sample_size}"
+            sample_query = self._limit_query(query.strip().rstrip(';'), self.sample_size)
             return self.connector.execute_query(sample_query)
         except Exception:
             pass
         
         try:
-            # Subquery approach
-            sample_query = f"SELECT TOP {self.sample_size} * FROM ({query}) AS t"
-            return self.connector.execute_query(sample_query)
-        except Exception:
-            pass
-        
-        # Last resort: get all and slice
-        try:
-            all_records = self.connector.execute_query(query)
-            return all_records[:self.sample_size]
+            return self._fetch_sample(query, self.sample_size)
         except Exception:
             return []
-    
-    def _serialize_records(self, records: list[dict]) -> list[dict]:
-        """Convert records to JSON-serializable format."""
-        return [
-            {k: self._serialize_value(v) for k, v in record.items()}
-            for record in records
-        ]
-    
-    def _serialize_value(self, value: Any) -> Any:
-        """Convert value to JSON-serializable format."""
-        if value is None:
-            return None
-        if isinstance(value, (int, float, str, bool)):
-            return value
-        # Handle dates, decimals, bytes, etc.
-        return str(value)
@@ -5,10 +5,141 @@ Finds records that have the same values in the specified column combination,
 which may indicate data entry errors or integration issues.
 """
 
-import time
-from typing import Any
+import functools
 
-from src.validators.base import BaseValidator, ValidationResult
+from src.validators.base import BaseValidator, ValidationResult, _dialect_limit, _dialect_quote
+
+
+# Approximate distinct-count aggregate per connector dialect. Dialects
+# without one always use the exact grouped count.
+_APPROX_DISTINCT_FORMATS = {
+    'mssql': 'APPROX_COUNT_DISTINCT({expr})',
+}
+
+# One key column as a non-NULL string for the approximate count: 'N' for
+# NULL, else the value's length, ':' and the value. Length prefixes keep
+# concatenated parts from colliding, e.g. ('a|b', 'c') and ('a', 'b|c').
+_APPROX_KEY_PART_FORMATS = {
+    'mssql': (
+        "CASE WHEN {expr} IS NULL THEN 'N' ELSE CONCAT("
+        "DATALENGTH(CAST({expr} AS NVARCHAR(MAX))), ':', "
+        "CAST({expr} AS NVARCHAR(MAX))) END"
+    ),
+}
+
+# Documented error of SQL Server's APPROX_COUNT_DISTINCT (2% at 97%
+# probability), reported with approximate counts
+_APPROX_ERROR_BOUND = 0.02
+
+
+@functools.lru_cache(maxsize=512)
+def _build_duplicates_sql(
+    table: str,
+    columns: tuple[str, ...],
+    case_sensitive: bool,
+    ignore_null: bool,
+    approximate: bool,
+    dialect: str,
+    sample_size: int
+) -> tuple[str, str, str | None, str]:
+    """
+    Build the queries for a duplicates rule.
+    
+    Pure function of the rule's shape, so rules re-run by a scheduler
+    reuse the generated SQL instead of rebuilding it.
+    
+    Returns:
+        Tuple of (duplicate groups query, top groups query with the total
+        violation count, approximate count query or None, duplicate
+        records sample query)
+    """
+    quoted_table = _dialect_quote(table, dialect)
+    
+    # Build column expressions (with optional case handling)
+    col_expressions = []
+    for col in columns:
+        if case_sensitive:
+            col_expressions.append(_dialect_quote(col, dialect))
+        else:
+            col_expressions.append(f'LOWER({_dialect_quote(col, dialect)})')
+    
+    col_list = ', '.join(col_expressions)
+    
+    # Grouped columns keep their own names, so the (possibly
+    # lower-cased) key can be referenced from outer queries
+    quoted_cols = ', '.join(
+        f'{expr} AS {_dialect_quote(col, dialect)}'
+        for expr, col in zip(col_expressions, columns)
+    )
+    
+    # Build NULL exclusion if needed
+    null_conditions = ""
+    if ignore_null:
+        null_checks = [f'{_dialect_quote(col, dialect)} IS NOT NULL' for col in columns]
+        null_conditions = f"WHERE {' AND '.join(null_checks)}"
+    
+    # Find duplicate groups
+    duplicates_query = f"""
+        SELECT {quoted_cols}, COUNT(*) as duplicate_count
+        FROM {quoted_table}
+        {null_conditions}
+        GROUP BY {col_list}
+        HAVING COUNT(*) > 1
+    """
+    
+    # Largest groups, each carrying the total number of excess duplicate
+    # records (window sum evaluated before the row limit), so one
+    # GROUP BY pass yields both the violation count and the groups
+    groups_query = _dialect_limit(
+        f"""
+        SELECT d.*, SUM(d.duplicate_count - 1) OVER () as _violation_count
+        FROM ({duplicates_query}) AS d
+        """,
+        10,
+        dialect,
+        order_by='duplicate_count DESC'
+    )
+    
+    # Rows minus estimated distinct keys = excess duplicate rows. The
+    # aggregate skips NULLs, so unless NULL keys are already excluded
+    # (or there are several columns) each key is encoded as a string.
+    count_query = None
+    if approximate:
+        if len(columns) == 1 and ignore_null:
+            key = col_expressions[0]
+        else:
+            parts = [
+                _APPROX_KEY_PART_FORMATS[dialect].format(expr=expr)
+                for expr in col_expressions
+            ]
+            key = parts[0] if len(parts) == 1 else f"CONCAT({', '.join(parts)})"
+        approx_distinct = _APPROX_DISTINCT_FORMATS[dialect].format(expr=key)
+        count_query = f"""
+            SELECT COUNT(*) - {approx_distinct} as violation_count
+            FROM {quoted_table}
+            {null_conditions}
+        """
+    
+    # Get actual duplicate records with their group size. A window count
+    # over the grouping key finds them in one pass over the table (no
+    # self-join), and the derived table keeps the query wrappable.
+    records_query = f"""
+        SELECT *
+        FROM (
+            SELECT t.*, COUNT(*) OVER (PARTITION BY {col_list}) as _duplicate_count
+            FROM {quoted_table} t
+            {null_conditions}
+        ) AS d
+        WHERE _duplicate_count > 1
+    """
+    sample_query = _dialect_limit(
+        records_query,
+        sample_size * 2,
+        dialect,
+        order_by=_dialect_quote(columns[0], dialect)
+    )
+    
+    return duplicates_query, groups_query, count_query, sample_query
 
 
 class DuplicatesValidator(BaseValidator):
@@ -20,7 +151,15 @@ class DuplicatesValidator(BaseValidator):
         columns: List of columns that should be unique together
         case_sensitive: Whether string comparison is case-sensitive (default: True)
         ignore_null: Whether to exclude NULL values from comparison (default: True)
-        
+        approximate: Run an approximate distinct count first and skip
+            grouping every key when it estimates no duplicates
+            (default: False). The estimate has a ~2% error, so a table
+            with a few duplicates can pass; when it finds any, the exact
+            grouped count is reported. Ignored on dialects without an
+            approximate aggregate
+        include_samples: Fetch sample duplicate records (default: True);
+            the top duplicate groups are always reported
+    
     Example rule:
         - name: no_duplicate_clients
           table: clients
@@ -34,100 +173,58 @@ class DuplicatesValidator(BaseValidator):
     
     def validate(self, rule: dict) -> ValidationResult:
         """Find duplicate records based on specified columns."""
-        start_time = time.time()
-        
         table = rule['table']
         columns = rule['columns']
         case_sensitive = rule.get('case_sensitive', True)
         ignore_null = rule.get('ignore_null', True)
+        approx_format = None
+        if rule.get('approximate', False):
+            approx_format = _APPROX_DISTINCT_FORMATS.get(self._dialect())
         
-        # Build column expressions (with optional case handling)
-        col_expressions = []
-        for col in columns:
-            if case_sensitive:
-                col_expressions.append(self._quote_identifier(col))
-            else:
-                col_expressions.append(f'LOWER({self._quote_identifier(col)})')
-        
-        col_list = ', '.join(col_expressions)
-        quoted_cols = ', '.join(self._quote_identifier(col) for col in columns)
-        
-        # Build NULL exclusion if needed
-        null_conditions = ""
-        if ignore_null:
-            null_checks = [f'{self._quote_identifier(col)} IS NOT NULL' for col in columns]
-            null_conditions = f"WHERE {' AND '.join(null_checks)}"
-        
-        # Find duplicate groups
-        duplicates_query = f"""
-            SELECT {quoted_cols}, COUNT(*) as duplicate_count
-            FROM {self._quote_identifier(table)}
-            {null_conditions}
-            GROUP BY {col_list}
-            HAVING COUNT(*) > 1
-        """
-        
-        # Count total duplicate records (not groups)
-        count_query = f"""
-            SELECT SUM(cnt - 1) as violation_count
-            FROM (
-                SELECT COUNT(*) as cnt
-                FROM {self._quote_identifier(table)}
-                {null_conditions}
-                GROUP BY {col_list}
-                HAVING COUNT(*) > 1
-            ) AS dups
-        """
-        
-        # Get actual duplicate records with group info
-        records_query = f"""
-            WITH DuplicateGroups AS (
-                SELECT {col_list}, COUNT(*) as dup_count
-                FROM {self._quote_identifier(table)}
-                {null_conditions}
-                GROUP BY {col_list}
-                HAVING COUNT(*) > 1
-            )
-            SELECT t.*, dg.dup_count as _duplicate_count
-            FROM {self._quote_identifier(table)} t
-            INNER JOIN DuplicateGroups dg ON {self._build_join_conditions(columns, case_sensitive)}
-        """
+        duplicates_query, groups_query, count_query, sample_query = _build_duplicates_sql(
+            table,
+            tuple(columns),
+            case_sensitive,
+            ignore_null,
+            bool(approx_format),
+            self._dialect(),
+            self.sample_size
+        )
         
         try:
-            # Get count of excess records (total duplicates minus one per group)
-            count_result = self.connector.execute_query(count_query)
-            violation_count = int(count_result[0]['violation_count'] or 0) if count_result else 0
-            
-            # Get sample of duplicate groups
             sample_records = []
             duplicate_groups = []
             
-            if violation_count > 0:
-                # Get duplicate groups info
-                try:
-                    groups_query = f"{duplicates_query} ORDER BY COUNT(*) DESC OFFSET 0 ROWS FETCH NEXT 10 ROWS ONLY"
-                    duplicate_groups = self.connector.execute_query(groups_query)
-                except Exception:
-                    try:
-                        groups_query = f"SELECT TOP 10 * FROM ({duplicates_query}) AS t ORDER BY duplicate_count DESC"
-                        duplicate_groups = self.connector.execute_query(groups_query)
-                    except Exception:
-                        all_groups = self.connector.execute_query(duplicates_query)
-                        duplicate_groups = sorted(all_groups, key=lambda x: x.get('duplicate_count', 0), reverse=True)[:10]
-                
+            approximate = False
+            if count_query:
+                # Estimated count of excess records; an estimate of none
+                # skips the exact grouping (and may miss a few duplicates)
+                count_result = self.connector.execute_query(count_query)
+                estimate = int(count_result[0]['violation_count'] or 0) if count_result else 0
+                approximate = estimate <= 0
+            
+            if approximate:
+                violation_count = 0
+            else:
+                # Duplicate groups (largest first) plus the exact count of
+                # excess records (total duplicates minus one per group)
+                duplicate_groups = self.connector.execute_query(groups_query)
+                violation_count = int(duplicate_groups[0]['_violation_count']) if duplicate_groups else 0
+            
+            if violation_count > 0 and self._sample_limit(rule):
                 # Get sample records
-                try:
-                    sample_query = f"{records_query} ORDER BY t.{self._quote_identifier(columns[0])} OFFSET 0 ROWS FETCH NEXT {self.sample_size * 2} ROWS ONLY"
-                    sample_records = self.connector.execute_query(sample_query)
-                except Exception:
-                    try:
-                        sample_query = f"SELECT TOP {self.sample_size * 2} * FROM ({records_query}) AS t ORDER BY {self._quote_identifier(columns[0])}"
-                        sample_records = self.connector.execute_query(sample_query)
-                    except Exception:
-                        all_records = self.connector.execute_query(records_query)
-                        sample_records = all_records[:self.sample_size * 2]
+                sample_records = self.connector.execute_query(sample_query)
             
-            execution_time = (time.time() - start_time) * 1000
+            metadata = {
+                'columns_checked': columns,
+                'case_sensitive': case_sensitive,
+                'ignore_null': ignore_null,
+                'duplicate_groups': self._serialize_records(duplicate_groups),
+                'group_count': len(duplicate_groups),
+                'approximate': approximate
+            }
+            if approximate:
+                metadata['error_bound'] = _APPROX_ERROR_BOUND
             
             return self._build_result(
                 rule=rule,
@@ -135,17 +232,10 @@ class DuplicatesValidator(BaseValidator):
                 violation_count=violation_count,
                 sample_records=self._serialize_records(sample_records),
                 query=duplicates_query.strip(),
-                metadata={
-                    'columns_checked': columns,
-                    'case_sensitive': case_sensitive,
-                    'ignore_null': ignore_null,
-                    'duplicate_groups': self._serialize_records(duplicate_groups),
-                    'group_count': len(duplicate_groups)
-                }
+                metadata=metadata
             )
-            
+        
         except Exception as e:
-            execution_time = (time.time() - start_time) * 1000
             return self._build_result(
                 rule=rule,
                 passed=False,
@@ -153,17 +243,6 @@ class DuplicatesValidator(BaseValidator):
                 query=duplicates_query.strip()
             )
     
-    def _build_join_conditions(self, columns: list[str], case_sensitive: bool) -> str:
-        """Build JOIN conditions for matching duplicates."""
-        conditions = []
-        for col in columns:
-            quoted = self._quote_identifier(col)
-            if case_sensitive:
-                conditions.append(f't.{quoted} = dg.{quoted}')
-            else:
-                conditions.append(f'LOWER(t.{quoted}) = LOWER(dg.{quoted})')
-        return ' AND '.join(conditions)
-    
     def _serialize_records(self, records: list[dict]) -> list[dict]:
         """Convert records to JSON-serializable format."""
         cleaned = []
@@ -179,11 +258,3 @@ class DuplicatesValidator(BaseValidator):
                 cleaned_record['group_size'] = record['duplicate_count']
             cleaned.append(cleaned_record)
         return cleaned
-    
-    def _serialize_value(self, value: Any) -> Any:
-        """Convert value to JSON-serializable format."""
-        if value is None:
-            return None
-        if isinstance(value, (int, float, str, bool)):
-            return value
-        return str(value)
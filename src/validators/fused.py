@@ -0,0 +1,134 @@
+"""
+Fused validator - checks rules of several types on one table in one scan.
+
+Rules whose validator can express them as a row predicate (see
+BaseValidator.compile_predicate) are counted together: one aggregate
+query with a SUM(CASE ...) column per rule replaces one table scan per
+rule. Only rules that fail and want sample records go back to their own
+validator.
+"""
+
+from src.validators import VALIDATOR_REGISTRY
+from src.validators.base import BaseValidator, ValidationResult, _dialect_quote
+
+
+class FusedValidator(BaseValidator):
+    """
+    Validate fusable rules on the same table with one aggregate query.
+    
+    Not a rule type of its own: RuleEngine hands it batches of rules of
+    any fusable types (range, pattern, completeness, ...) on one table,
+    and each rule's result is reported under the rule's own type.
+    """
+    
+    validator_type = "fused"
+    batchable = True
+    
+    def __init__(self, connector, settings: dict | None = None):
+        """Initialize fused validator; per-type validators are created on use."""
+        super().__init__(connector, settings)
+        self._validators: dict[str, BaseValidator] = {}
+    
+    def _validator(self, rule_type: str) -> BaseValidator:
+        """Validator for one rule type, sharing this connector and settings."""
+        validator = self._validators.get(rule_type)
+        if validator is None:
+            validator = VALIDATOR_REGISTRY[rule_type](self.connector, self.settings)
+            self._validators[rule_type] = validator
+        return validator
+    
+    def validate(self, rule: dict) -> ValidationResult:
+        """Validate a single rule with its own validator."""
+        return self._validator(rule['type']).validate(rule)
+    
+    def validate_many(self, rules: list[dict]) -> list[ValidationResult]:
+        """
+        Validate several rules on the same table in one scan.
+        
+        One aggregate query counts the violations of every rule. Rules
+        that pass, or fail without wanting samples, are answered from
+        the counts; failing rules that want samples are re-run by their
+        own validator (batched per type). Falls back to the per-type
+        validators if the aggregate query fails.
+        """
+        rule_types = {rule['type'] for rule in rules}
+        if len(rule_types) == 1:
+            validator = self._validator(rules[0]['type'])
+            if validator.batchable:
+                return validator.validate_many(rules)
+        
+        counts = []
+        params = {}
+        compiled = {}
+        for i, rule in enumerate(rules):
+            predicate = self._validator(rule['type']).compile_predicate(rule, f'r{i}_')
+            if predicate is None:
+                continue
+            condition, rule_params, metadata = predicate
+            counts.append(f"SUM(CASE WHEN ({condition}) THEN 1 ELSE 0 END) AS _r{i}")
+            # Placeholders appear in rule order, matching positional binding
+            params.update(rule_params)
+            compiled[i] = metadata
+        
+        if not compiled:
+            return self._delegate(rules, list(range(len(rules))))
+        
+        dialect = self._dialect()
+        count_query = f"""
+            SELECT
+                {', '.join(counts)}
+            FROM {_dialect_quote(rules[0]['table'], dialect)}
+        """
+        
+        try:
+            row = self.connector.execute_query(count_query, params or None)[0]
+        except Exception:
+            return self._delegate(rules, list(range(len(rules))))
+        
+        results: dict[int, ValidationResult] = {}
+        rerun = []
+        for i, rule in enumerate(rules):
+            if i not in compiled:
+                rerun.append(i)
+                continue
+            
+            # SUM over an empty table is NULL
+            violation_count = int(row[f'_r{i}'] or 0)
+            if violation_count and self._validator(rule['type'])._sample_limit(rule):
+                rerun.append(i)
+                continue
+            
+            results[i] = self._build_result(
+                rule=rule,
+                passed=violation_count == 0,
+                violation_count=violation_count,
+                query=count_query.strip(),
+                metadata=compiled[i]
+            )
+        
+        results.update(zip(rerun, self._delegate(rules, rerun)))
+        return [results[i] for i in range(len(rules))]
+    
+    def _delegate(self, rules: list[dict], indices: list[int]) -> list[ValidationResult]:
+        """
+        Validate the given rules with their own validators.
+        
+        Rules of one type go to that validator together, so batchable
+        types keep their own single-scan path.
+        
+        Returns:
+            Results in the order of indices
+        """
+        by_type: dict[str, list[int]] = {}
+        for i in indices:
+            by_type.setdefault(rules[i]['type'], []).append(i)
+        
+        results: dict[int, ValidationResult] = {}
+        for rule_type, group in by_type.items():
+            validator = self._validator(rule_type)
+            if len(group) == 1:
+                group_results = [validator.validate(rules[group[0]])]
+            else:
+                group_results = validator.validate_many([rules[i] for i in group])
+            results.update(zip(group, group_results))
+        return [results[i] for i in indices]
@@ -5,10 +5,100 @@ Uses z-score or IQR methods to identify records with values significantly
 outside the normal range, which may indicate data entry errors or fraud.
 """
 
-import time
-from typing import Any
+import functools
+import heapq
 
-from src.validators.base import BaseValidator, ValidationResult
+from src.validators.base import BaseValidator, ValidationResult, _dialect_limit
+
+
+# Block-level table sample (~1% of pages) per connector dialect, used
+# for z-score statistics on very large tables. REPEATABLE keeps the
+# sample identical wherever it appears in the same query.
+_TABLESAMPLE_FORMATS = {
+    'mssql': '{table} TABLESAMPLE SYSTEM (1 PERCENT) REPEATABLE (42)',
+    'postgres': '{table} TABLESAMPLE SYSTEM (1) REPEATABLE (42)',
+}
+
+# Value at a given rank of the column's sorted non-null values; the
+# row-skipping clause depends on the connector dialect
+_NTH_VALUE_QUERY = 'SELECT {column} FROM {table} WHERE {column} IS NOT NULL ORDER BY {column} '
+_NTH_VALUE_CLAUSES = {
+    'mssql': 'OFFSET {offset} ROWS FETCH NEXT 1 ROWS ONLY',
+    'sqlite': 'LIMIT 1 OFFSET {offset}',
+    'postgres': 'LIMIT 1 OFFSET {offset}',
+    'mysql': 'LIMIT 1 OFFSET {offset}',
+}
+
+
+@functools.lru_cache(maxsize=512)
+def _build_zscore_sql(
+    table: str,
+    column: str,
+    threshold: float,
+    direction: str,
+    stats_source: str,
+    dialect: str,
+    sample_size: int,
+    known_stats: tuple[float, float] | None = None
+) -> tuple[str, str]:
+    """
+    Build the queries for a z-score outlier rule.
+    
+    Identifiers arrive already quoted. Memoized on the rule's shape,
+    so repeated runs reuse the SQL instead of rebuilding it.
+    
+    known_stats, a (mean, standard deviation) pair cached from another
+    rule on the same column, replaces the aggregate over stats_source
+    with literal values.
+    
+    Returns:
+        Tuple of (outlier query, combined stats + count + sample query)
+    """
+    if known_stats:
+        stats_query = f"SELECT {known_stats[0]!r} as mean_val, {known_stats[1]!r} as std_val"
+    else:
+        stats_query = f"""
+            SELECT 
+                AVG(CAST({column} AS FLOAT)) as mean_val,
+                STDEV(CAST({column} AS FLOAT)) as std_val
+            FROM {stats_source}
+            WHERE {column} IS NOT NULL
+        """
+    
+    # NULLIF keeps zero-variance data from dividing by zero; those
+    # rows then match no outlier condition
+    zscore = f"(t.{column} - s.mean_val) / NULLIF(s.std_val, 0)"
+    
+    # Build outlier conditions based on direction
+    if direction == 'both':
+        outlier_condition = f"ABS({zscore}) > {threshold}"
+    elif direction == 'high':
+        outlier_condition = f"{zscore} > {threshold}"
+    else:  # low
+        outlier_condition = f"{zscore} < -{threshold}"
+    
+    # Find outliers
+    query = f"""
+        SELECT 
+            t.*,
+            {zscore} as _zscore,
+            COUNT(*) OVER () as _violation_count
+        FROM {table} t
+        CROSS JOIN ({stats_query}) s
+        WHERE t.{column} IS NOT NULL
+          AND {outlier_condition}
+    """
+    
+    sample_query = _dialect_limit(
+        query, max(sample_size, 1), dialect, order_by='ABS(_zscore) DESC'
+    )
+    combined_query = f"""
+        SELECT s.mean_val as _mean_val, s.std_val as _std_val, o.*
+        FROM ({stats_query}) s
+        LEFT JOIN ({sample_query}) o ON 1 = 1
+    """
+    
+    return query, combined_query
 
 
 class OutliersValidator(BaseValidator):
@@ -21,7 +111,15 @@ class OutliersValidator(BaseValidator):
         method: Detection method - 'zscore' or 'iqr' (default: 'zscore')
         threshold: Z-score threshold or IQR multiplier (default: 3 for zscore, 1.5 for IQR)
         direction: 'both', 'high', or 'low' (default: 'both')
-        
+        min_rows: Skip detection on tables whose estimated row count is
+            below this (default: 0, never skip)
+        sample_stats: For z-scores on tables with more than
+            stats_sample_threshold estimated rows (default: 1,000,000),
+            compute mean and standard deviation from a ~1% TABLESAMPLE
+            where the database supports it (default: True). Outliers are
+            still searched in the full table.
+        include_samples: Fetch sample outlier records (default: True)
+    
     Example rule:
         - name: price_outliers
           table: products
@@ -36,8 +134,6 @@ class OutliersValidator(BaseValidator):
     
     def validate(self, rule: dict) -> ValidationResult:
         """Detect outliers using statistical methods."""
-        start_time = time.time()
-        
         table = rule['table']
         column = rule['column']
         method = rule.get('method', 'zscore').lower()
@@ -49,10 +145,26 @@ class OutliersValidator(BaseValidator):
         else:  # IQR
             threshold = rule.get('threshold', 1.5)
         
-        quoted_col = self._quote_identifier(column)
-        quoted_table = self._quote_identifier(table)
+        quoted_col = self._quote(column)
+        quoted_table = self._quote(table)
         
         try:
+            # Too few rows for meaningful statistics; the catalog estimate
+            # avoids scanning the table just to find that out
+            min_rows = rule.get('min_rows', 0)
+            if min_rows > 0:
+                estimate = self._estimated_rowcount(table)
+                if estimate is not None and estimate < min_rows:
+                    return self._build_result(
+                        rule=rule,
+                        passed=True,
+                        violation_count=0,
+                        metadata={
+                            'note': f'Skipped: about {estimate} rows, fewer than min_rows ({min_rows})',
+                            'estimated_rows': estimate
+                        }
+                    )
+            
             if method == 'zscore':
                 result = self._zscore_detection(quoted_table, quoted_col, threshold, direction, rule)
             elif method == 'iqr':
@@ -65,7 +177,7 @@ class OutliersValidator(BaseValidator):
                 )
             
             return result
-            
+        
         except Exception as e:
             return self._build_result(
                 rule=rule,
@@ -81,20 +193,38 @@ class OutliersValidator(BaseValidator):
         direction: str,
         rule: dict
     ) -> ValidationResult:
-        """Detect outliers using z-score method."""
+        """
+        Detect outliers using z-score method.
         
-        # First, get statistics
-        stats_query = f"""
-            SELECT 
-                AVG(CAST({column} AS FLOAT)) as mean_val,
-                STDEV(CAST({column} AS FLOAT)) as std_val,
-                COUNT(*) as total_count
-            FROM {table}
-            WHERE {column} IS NOT NULL
+        Statistics, violation count and sample come back in one query:
+        the single-row stats subquery is LEFT JOINed to the top outliers
+        (each carrying a window count of all outliers), so the result
+        always has at least the stats row.
         """
+        # Mean and standard deviation barely move when estimated from a
+        # sample of a very large table, so scan only ~1% of it for them
+        stats_source = table
+        stats_sampled = False
+        sample_format = _TABLESAMPLE_FORMATS.get(self._dialect())
+        if sample_format and rule.get('sample_stats', True):
+            estimate = self._estimated_rowcount(rule['table'])
+            if estimate is not None and estimate > rule.get('stats_sample_threshold', 1_000_000):
+                stats_source = sample_format.format(table=table)
+                stats_sampled = True
         
-        stats = self.connector.execute_query(stats_query)
-        if not stats or stats[0]['std_val'] is None or stats[0]['std_val'] == 0:
+        # Another rule on this column may have computed the statistics
+        # moments ago; then only the outlier search scans the table
+        stats_key = ('zscore', table, column, stats_source)
+        known_stats = self._get_stats(stats_key)
+        
+        sample_limit = self._sample_limit(rule)
+        query, combined_query = _build_zscore_sql(
+            table, column, threshold, direction, stats_source,
+            self._dialect(), sample_limit, known_stats
+        )
+        
+        rows = self.connector.execute_query(combined_query)
+        if not rows or rows[0]['_std_val'] is None or rows[0]['_std_val'] == 0:
             return self._build_result(
                 rule=rule,
                 passed=True,
@@ -102,50 +232,17 @@ class OutliersValidator(BaseValidator):
                 metadata={'note': 'No variance in data or insufficient records'}
             )
         
-        mean_val = float(stats[0]['mean_val'])
-        std_val = float(stats[0]['std_val'])
-        
-        # Build outlier conditions based on direction
-        if direction == 'both':
-            outlier_condition = f"ABS(({column} - {mean_val}) / {std_val}) > {threshold}"
-        elif direction == 'high':
-            outlier_condition = f"({column} - {mean_val}) / {std_val} > {threshold}"
-        else:  # low
-            outlier_condition = f"({column} - {mean_val}) / {std_val} < -{threshold}"
+        mean_val = float(rows[0]['_mean_val'])
+        std_val = float(rows[0]['_std_val'])
+        if known_stats is None:
+            self._put_stats(stats_key, (mean_val, std_val))
         
-        # Find outliers
-        query = f"""
-            SELECT 
-                *,
-                ({column} - {mean_val}) / {std_val} as _zscore
-            FROM {table}
-            WHERE {column} IS NOT NULL
-              AND {outlier_condition}
-        """
+        # Without outliers the join yields a single row of NULLs
+        outliers = [row for row in rows if row['_zscore'] is not None]
+        violation_count = int(outliers[0]['_violation_count']) if outliers else 0
         
-        count_query = f"""
-            SELECT COUNT(*) as violation_count
-            FROM {table}
-            WHERE {column} IS NOT NULL
-              AND {outlier_condition}
-        """
-        
-        count_result = self.connector.execute_query(count_query)
-        violation_count = count_result[0]['violation_count'] if count_result else 0
-        
-        sample_records = []
-        if violation_count > 0:
-            try:
-                sample_query = f"{query} ORDER BY ABS(({column} - {mean_val}) / {std_val}) DESC OFFSET 0 ROWS FETCH NEXT {self.sample_size} ROWS ONLY"
-                sample_records = self.connector.execute_query(sample_query)
-            except Exception:
-                try:
-                    sample_query = f"SELECT TOP {self.sample_size} * FROM ({query}) AS t ORDER BY ABS(_zscore) DESC"
-                    sample_records = self.connector.execute_query(sample_query)
-                except Exception:
-                    all_records = self.connector.execute_query(query)
-                    all_records.sort(key=lambda x: abs(x.get('_zscore', 0)), reverse=True)
-                    sample_records = all_records[:self.sample_size]
+        # Row order is not preserved through the join
+        sample_records = heapq.nlargest(sample_limit, outliers, key=lambda row: abs(row['_zscore']))
         
         return self._build_result(
             rule=rule,
@@ -160,7 +257,8 @@ class OutliersValidator(BaseValidator):
                 'mean': round(mean_val, 4),
                 'std_dev': round(std_val, 4),
                 'lower_bound': round(mean_val - threshold * std_val, 4) if direction in ['both', 'low'] else None,
-                'upper_bound': round(mean_val + threshold * std_val, 4) if direction in ['both', 'high'] else None
+                'upper_bound': round(mean_val + threshold * std_val, 4) if direction in ['both', 'high'] else None,
+                'stats_sampled': stats_sampled
             }
         )
     
@@ -185,11 +283,16 @@ class OutliersValidator(BaseValidator):
             WHERE {column} IS NOT NULL
         """
         
-        try:
-            quartiles = self.connector.execute_query(quartiles_query)
-        except Exception:
-            # Fallback for databases without PERCENTILE_CONT
-            return self._iqr_detection_fallback(table, column, threshold, direction, rule)
+        stats_key = ('quartiles', table, column)
+        quartiles = self._get_stats(stats_key)
+        if quartiles is None:
+            try:
+                quartiles = self.connector.execute_query(quartiles_query)
+            except Exception:
+                # Fallback for databases without PERCENTILE_CONT
+                return self._iqr_detection_fallback(table, column, threshold, direction, rule)
+            if quartiles and quartiles[0]['q1'] is not None:
+                self._put_stats(stats_key, quartiles)
         
         if not quartiles or quartiles[0]['q1'] is None:
             return self._build_result(
@@ -215,44 +318,10 @@ class OutliersValidator(BaseValidator):
         lower_bound = q1 - threshold * iqr
         upper_bound = q3 + threshold * iqr
         
-        # Build outlier condition
-        if direction == 'both':
-            outlier_condition = f"({column} < {lower_bound} OR {column} > {upper_bound})"
-        elif direction == 'high':
-            outlier_condition = f"{column} > {upper_bound}"
-        else:  # low
-            outlier_condition = f"{column} < {lower_bound}"
-        
-        query = f"""
-            SELECT *
-            FROM {table}
-            WHERE {column} IS NOT NULL
-              AND {outlier_condition}
-        """
-        
-        count_query = f"""
-            SELECT COUNT(*) as violation_count
-            FROM {table}
-            WHERE {column} IS NOT NULL
-              AND {outlier_condition}
-        """
-        
-        count_result = self.connector.execute_query(count_query)
-        violation_count = count_result[0]['violation_count'] if count_result else 0
-        
-        sample_records = []
-        if violation_count > 0:
-            try:
-                # Order by distance from median
-                sample_query = f"{query} ORDER BY ABS({column} - {median}) DESC OFFSET 0 ROWS FETCH NEXT {self.sample_size} ROWS ONLY"
-                sample_records = self.connector.execute_query(sample_query)
-            except Exception:
-                try:
-                    sample_query = f"SELECT TOP {self.sample_size} * FROM ({query}) AS t ORDER BY ABS({column} - {median}) DESC"
-                    sample_records = self.connector.execute_query(sample_query)
-                except Exception:
-                    all_records = self.connector.execute_query(query)
-                    sample_records = all_records[:self.sample_size]
+        query, violation_count, sample_records = self._find_iqr_outliers(
+            table, column, lower_bound, upper_bound, direction, median,
+            self._sample_limit(rule)
+        )
         
         return self._build_result(
             rule=rule,
@@ -281,53 +350,64 @@ class OutliersValidator(BaseValidator):
         direction: str,
         rule: dict
     ) -> ValidationResult:
-        """Fallback IQR calculation for databases without PERCENTILE_CONT."""
-        # This is less efficient but more compatible
-        all_values_query = f"""
-            SELECT {column} as val
+        """
+        Fallback IQR calculation for databases without PERCENTILE_CONT.
+        
+        Each quartile is the value at its rank (n/4, n/2, 3n/4) in sorted
+        order, fetched by the database with OFFSET, so no values are
+        pulled into Python. Outliers are then counted in SQL.
+        """
+        count_query = f"""
+            SELECT COUNT(*) as total_count
             FROM {table}
             WHERE {column} IS NOT NULL
-            ORDER BY {column}
         """
         
         try:
-            all_values = self.connector.execute_query(all_values_query)
-            values = [float(r['val']) for r in all_values]
-            
-            if len(values) < 4:
-                return self._build_result(
-                    rule=rule,
-                    passed=True,
-                    violation_count=0,
-                    metadata={'note': 'Insufficient data for IQR calculation'}
+            stats_key = ('rank_quartiles', table, column)
+            quartiles = self._get_stats(stats_key)
+            if quartiles is None:
+                count_result = self.connector.execute_query(count_query)
+                n = int(count_result[0]['total_count'] or 0) if count_result else 0
+                
+                if n < 4:
+                    return self._build_result(
+                        rule=rule,
+                        passed=True,
+                        violation_count=0,
+                        metadata={'note': 'Insufficient data for IQR calculation'}
+                    )
+                
+                # Calculate quartiles by rank
+                dialect = getattr(self.connector, 'dialect', 'mssql')
+                nth_format = _NTH_VALUE_QUERY + _NTH_VALUE_CLAUSES.get(dialect, _NTH_VALUE_CLAUSES['mssql'])
+                ranks = {'q1': n // 4, 'median': n // 2, 'q3': (3 * n) // 4}
+                quartiles_query = 'SELECT ' + ', '.join(
+                    f"({nth_format.format(column=column, table=table, offset=offset)}) as {name}"
+                    for name, offset in ranks.items()
                 )
+                quartiles = self.connector.execute_query(quartiles_query)[0]
+                self._put_stats(stats_key, quartiles)
             
-            # Calculate quartiles manually
-            n = len(values)
-            q1_idx = n // 4
-            q3_idx = (3 * n) // 4
-            
-            q1 = values[q1_idx]
-            q3 = values[q3_idx]
-            median = values[n // 2]
+            q1 = float(quartiles['q1'])
+            q3 = float(quartiles['q3'])
+            median = float(quartiles['median'])
             iqr = q3 - q1
             
             lower_bound = q1 - threshold * iqr
             upper_bound = q3 + threshold * iqr
             
-            # Find outliers
-            if direction == 'both':
-                outliers = [v for v in values if v < lower_bound or v > upper_bound]
-            elif direction == 'high':
-                outliers = [v for v in values if v > upper_bound]
-            else:
-                outliers = [v for v in values if v < lower_bound]
+            query, violation_count, sample_records = self._find_iqr_outliers(
+                table, column, lower_bound, upper_bound, direction, median,
+                self._sample_limit(rule)
+            )
             
             return self._build_result(
                 rule=rule,
-                passed=len(outliers) == 0,
-                violation_count=len(outliers),
-                sample_records=[{'value': v} for v in outliers[:self.sample_size]],
+                passed=violation_count == 0,
+                violation_count=violation_count,
+                sample_records=self._serialize_records(sample_records, column),
+                query=query.strip(),
                 metadata={
                     'method': 'iqr (fallback)',
                     'threshold': threshold,
@@ -340,7 +420,7 @@ class OutliersValidator(BaseValidator):
                     'upper_bound': round(upper_bound, 4)
                 }
             )
-            
+        
         except Exception as e:
             return self._build_result(
                 rule=rule,
@@ -348,6 +428,60 @@ class OutliersValidator(BaseValidator):
                 error_message=f"IQR fallback calculation failed: {str(e)}"
             )
     
+    def _find_iqr_outliers(
+        self,
+        table: str,
+        column: str,
+        lower_bound: float,
+        upper_bound: float,
+        direction: str,
+        median: float,
+        sample_limit: int
+    ) -> tuple[str, int, list[dict]]:
+        """
+        Count values outside the IQR bounds and fetch up to sample_limit
+        of them.
+        
+        Returns:
+            Tuple of (outlier query, violation_count, sample_records)
+        """
+        # Build outlier condition
+        if direction == 'both':
+            outlier_condition = f"({column} < {lower_bound} OR {column} > {upper_bound})"
+        elif direction == 'high':
+            outlier_condition = f"{column} > {upper_bound}"
+        else:  # low
+            outlier_condition = f"{column} < {lower_bound}"
+        
+        query = f"""
+            SELECT *
+            FROM {table}
+            WHERE {column} IS NOT NULL
+              AND {outlier_condition}
+        """
+        
+        count_query = f"""
+            SELECT COUNT(*) as violation_count
+            FROM {table}
+            WHERE {column} IS NOT NULL
+              AND {outlier_condition}
+        """
+        
+        count_result = self.connector.execute_query(count_query)
+        violation_count = count_result[0]['violation_count'] if count_result else 0
+        
+        sample_records = []
+        if violation_count > 0 and sample_limit:
+            # Order by distance from median
+            sample_query = self._limit_query(
+                query,
+                sample_limit,
+                order_by=f"ABS({column} - {median}) DESC"
+            )
+            sample_records = self.connector.execute_query(sample_query)
+        
+        return query, violation_count, sample_records
+    
     def _serialize_records(self, records: list[dict], value_column: str) -> list[dict]:
         """Convert records to JSON-serializable format with zscore info."""
         cleaned = []
@@ -361,11 +495,3 @@ class OutliersValidator(BaseValidator):
                 cleaned_record['zscore'] = round(float(record['_zscore']), 4)
             cleaned.append(cleaned_record)
         return cleaned
-    
-    def _serialize_value(self, value: Any) -> Any:
-        """Convert value to JSON-serializable format."""
-        if value is None:
-            return None
-        if isinstance(value, (int, float, str, bool)):
-            return value
-        return str(value)
@@ -5,10 +5,248 @@ Validates string formats like email addresses, phone numbers, postal codes,
 and other structured data that should follow specific patterns.
 """
 
-import time
-from typing import Any
+import functools
+import re
+import string
+from contextlib import closing
+from typing import Callable
 
-from src.validators.base import BaseValidator, ValidationResult
+from src.validators.base import BaseValidator, ValidationResult, _dialect_param
+
+
+# Characters a regex matches literally that LIKE also treats literally
+_LIKE_LITERAL_CHARS = frozenset(string.ascii_letters + string.digits + ' @-,:;/#=!~<>&\'"')
+
+# Characters allowed inside a [...] class copied into a SQL Server LIKE
+_LIKE_CLASS_CHARS = _LIKE_LITERAL_CHARS | frozenset('._%+')
+
+# Regex shorthand classes with an exact bracket-class equivalent (ASCII)
+_LIKE_SHORTHANDS = {'d': '[0-9]', 'w': '[A-Za-z0-9_]'}
+
+# Exact repetition count after a single-character token, e.g. \d{4}
+_FIXED_REPEAT = re.compile(r'\{(\d+)\}')
+
+
+# Compiled matchers for client-side filtering. Bounded so a long-running
+# monitor with many distinct patterns keeps a fixed memory footprint;
+# 128 comfortably covers the patterns of one rule set.
+@functools.lru_cache(maxsize=128)
+def _compile_pattern(pattern: str) -> Callable[[str], re.Match | None]:
+    """
+    Compile a regex once and return its match function.
+    
+    A pattern anchored at both ends (and without alternation, where the
+    anchors bind to single branches) uses fullmatch on the unanchored
+    body, so a mismatch fails at the end of the value instead of being
+    retried from later start positions; everything else uses search.
+    
+    Args:
+        pattern: Regular expression
+    
+    Returns:
+        Function taking a value and returning a match or None
+    """
+    if (
+        pattern.startswith('^')
+        and pattern.endswith('$')
+        and not pattern.endswith('\\$')
+        and '|' not in pattern
+    ):
+        return re.compile(pattern[1:-1]).fullmatch
+    return re.compile(pattern).search
+
+
+# Dialects with a pattern operator of their own: PATINDEX on SQL Server,
+# regex operators on PostgreSQL and SQLite (REGEXP, from the connector)
+_PATTERN_DIALECTS = frozenset({'mssql', 'postgres', 'sqlite'})
+
+
+def _sql_can_match(pattern: str, dialect: str) -> bool:
+    """Whether the database can evaluate the pattern, or needs client-side matching."""
+    return dialect in _PATTERN_DIALECTS or _try_translate_to_like(pattern, dialect) is not None
+
+
+@functools.lru_cache(maxsize=256)
+def _try_translate_to_like(regex_pattern: str, dialect: str = 'mssql') -> str | None:
+    """
+    Try to translate a regex to an equivalent SQL LIKE pattern.
+    
+    Only exact translations are made: literal characters, '.' (any
+    character), '.*' and '.+', fixed repetition counts ({n}) and, on
+    SQL Server, '\\d', '\\w' and [...] character classes, which its
+    LIKE supports natively. Unanchored ends become '%'.
+    
+    SQLite's connector always provides an exact REGEXP, so there only
+    translations without letters (its LIKE ignores ASCII case) or '.'
+    ('_' and '%' match newlines, which '.' does not) are made.
+    
+    Elsewhere two differences are accepted, since the alternative
+    (PATINDEX) shares them: LIKE compares under the column's collation
+    (case-insensitive by default on SQL Server, so [A-Z] also accepts
+    lowercase), and '.' translated to '_' or '%' also matches newlines.
+    
+    Args:
+        regex_pattern: Regular expression
+        dialect: Connector dialect; bracket classes are SQL Server only
+    
+    Returns:
+        LIKE pattern, or None if the regex uses anything LIKE cannot
+        express exactly (quantifiers, groups, alternation)
+    """
+    brackets = dialect == 'mssql'
+    regexp_fallback = dialect == 'sqlite'
+    pattern = regex_pattern
+    
+    anchored_start = pattern.startswith('^')
+    if anchored_start:
+        pattern = pattern[1:]
+    anchored_end = pattern.endswith('$') and not pattern.endswith('\\$')
+    if anchored_end:
+        pattern = pattern[:-1]
+    
+    tokens = [] if anchored_start else ['%']
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        following = pattern[i + 1:i + 2]
+        
+        if char == '.' and regexp_fallback:
+            return None
+        
+        if char == '.' and following in ('*', '+'):
+            tokens.extend(['%'] if following == '*' else ['_', '%'])
+            i += 2
+            continue
+        
+        if char == '.':
+            token = '_'
+        elif char == '\\':
+            if following in _LIKE_SHORTHANDS and brackets:
+                token = _LIKE_SHORTHANDS[following]
+            elif following and not following.isalnum():
+                token = _like_literal(following, brackets)
+            else:
+                return None
+            i += 1
+        elif char == '[' and brackets:
+            close = pattern.find(']', i + 1)
+            members = pattern[i + 1:close].removeprefix('^')
+            if close == -1 or not members or not _LIKE_CLASS_CHARS.issuperset(members):
+                return None
+            token = pattern[i:close + 1]
+            i = close
+        elif char in _LIKE_LITERAL_CHARS or char in '_%':
+            if regexp_fallback and char in string.ascii_letters:
+                return None
+            token = _like_literal(char, brackets)
+        else:
+            return None
+        
+        if token is None:
+            return None
+        i += 1
+        
+        repeat = _FIXED_REPEAT.match(pattern, i)
+        if repeat:
+            tokens.extend([token] * int(repeat.group(1)))
+            i = repeat.end()
+        else:
+            tokens.append(token)
+    
+    if not anchored_end:
+        tokens.append('%')
+    return ''.join(tokens)
+
+
+def _like_literal(char: str, brackets: bool) -> str | None:
+    """LIKE pattern matching one literal character (None if inexpressible)."""
+    if char in '%_[':
+        # Escapable only with SQL Server brackets; elsewhere an ESCAPE
+        # clause would be needed
+        return f'[{char}]' if brackets else None
+    if char in ']^$.*+?(){}|\\/' or char in _LIKE_LITERAL_CHARS:
+        return char
+    return None
+
+
+@functools.lru_cache(maxsize=512)
+def _build_pattern_predicate(
+    column: str,
+    pattern: str,
+    match_null: bool,
+    inverse: bool,
+    dialect: str,
+    prefix: str = ""
+) -> tuple[str, str, str]:
+    """
+    Build the violation condition of a pattern rule.
+    
+    LIKE where the regex translates exactly, otherwise the dialect's
+    regex operator (PATINDEX on SQL Server). Every operator yields NULL
+    for a NULL value, so NULLs are excluded without an IS NOT NULL
+    check, and are flagged only when match_null is False. The column
+    arrives already quoted.
+    
+    Returns:
+        Tuple of (condition, pattern type, value to bind as
+        '<prefix>pattern')
+    """
+    placeholder = _dialect_param(f'{prefix}pattern', dialect)
+    
+    simple_pattern = None
+    if dialect != 'postgres':
+        simple_pattern = _try_translate_to_like(pattern, dialect)
+    
+    if simple_pattern:
+        operator = "LIKE" if inverse else "NOT LIKE"
+        condition, pattern_type, bound = f"{column} {operator} {placeholder}", 'like', simple_pattern
+    elif dialect == 'postgres':
+        # PostgreSQL uses ~ for regex match, !~ for not match
+        operator = "~" if inverse else "!~"
+        condition, pattern_type, bound = f"{column} {operator} {placeholder}", 'regex', pattern
+    elif dialect == 'sqlite':
+        operator = "REGEXP" if inverse else "NOT REGEXP"
+        condition, pattern_type, bound = f"{column} {operator} {placeholder}", 'regex', pattern
+    else:
+        # PATINDEX (limited regex support in SQL Server) returns 0 if no match
+        comparison = "> 0" if inverse else "= 0"
+        condition = f"PATINDEX({placeholder}, {column}) {comparison}"
+        pattern_type, bound = 'patindex', f'%{pattern}%'
+    
+    if not match_null:
+        condition = f"({condition} OR {column} IS NULL)"
+    return condition, pattern_type, bound
+
+
+@functools.lru_cache(maxsize=512)
+def _build_pattern_sql(
+    table: str,
+    column: str,
+    pattern: str,
+    match_null: bool,
+    inverse: bool,
+    dialect: str
+) -> tuple[str, str, str]:
+    """
+    Build the violation query for a pattern rule.
+    
+    Identifiers arrive already quoted; the pattern itself is bound as
+    the 'pattern' parameter, so the server reuses one plan per rule
+    shape. Memoized, so scheduled runs also skip the translation.
+    
+    Returns:
+        Tuple of (violation query, pattern type: 'like', 'regex' or
+        'patindex', value to bind as 'pattern')
+    """
+    condition, pattern_type, bound = _build_pattern_predicate(
+        column, pattern, match_null, inverse, dialect
+    )
+    query = f"""
+        SELECT *
+        FROM {table}
+        WHERE {condition}
+    """
+    return query, pattern_type, bound
 
 
 class PatternValidator(BaseValidator):
@@ -21,7 +259,11 @@ class PatternValidator(BaseValidator):
         pattern: Regular expression pattern
         match_null: Whether NULL values pass validation (default: True)
         inverse: If True, flag records that DO match (default: False)
-        
+    
+    On SQL Server, patterns that translate to LIKE follow the column's
+    collation (case-insensitive by default) and '.' also matches a
+    newline; PostgreSQL and SQLite match with exact regex semantics.
+    
     Example rules:
         - name: valid_email
           table: customers
@@ -29,7 +271,7 @@ class PatternValidator(BaseValidator):
           column: email
           pattern: "^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}$"
           severity: high
-          
+        
         - name: valid_canadian_postal
           table: clients
           type: pattern
@@ -39,6 +281,7 @@ class PatternValidator(BaseValidator):
     """
     
     validator_type = "pattern"
+    fusable = True
     
     # Common patterns for convenience
     COMMON_PATTERNS = {
@@ -55,8 +298,6 @@ class PatternValidator(BaseValidator):
     
     def validate(self, rule: dict) -> ValidationResult:
         """Check that values match the specified pattern."""
-        start_time = time.time()
-        
         table = rule['table']
         column = rule['column']
         pattern = rule.get('pattern', '')
@@ -74,28 +315,47 @@ class PatternValidator(BaseValidator):
                 error_message="Pattern validation requires 'pattern' field"
             )
         
-        quoted_col = self._quote_identifier(column)
-        quoted_table = self._quote_identifier(table)
+        quoted_col = self._quote(column)
+        quoted_table = self._quote(table)
+        
+        # Different databases have different regex syntax; the builder
+        # picks it from the connector dialect instead of trying each in
+        # turn. Patterns the database cannot evaluate are matched in Python.
+        if _sql_can_match(pattern, self._dialect()):
+            validate = self._validate_sql
+        else:
+            validate = self._validate_client_side
         
-        # Different databases have different regex syntax
-        # We'll try SQL Server syntax first, then adapt
         try:
-            result = self._validate_sqlserver(quoted_table, quoted_col, pattern, match_null, inverse, rule)
-            return result
+            return validate(quoted_table, quoted_col, pattern, match_null, inverse, rule)
         except Exception as e:
-            # Try POSIX regex (PostgreSQL)
-            try:
-                result = self._validate_postgres(quoted_table, quoted_col, pattern, match_null, inverse, rule)
-                return result
-            except Exception:
-                # Fall back to LIKE pattern (limited)
-                return self._build_result(
-                    rule=rule,
-                    passed=False,
-                    error_message=f"Pattern validation not supported by database: {str(e)}"
-                )
+            return self._build_result(
+                rule=rule,
+                passed=False,
+                error_message=f"Query execution failed: {str(e)}"
+            )
     
-    def _validate_sqlserver(
+    def compile_predicate(self, rule: dict, prefix: str = "") -> tuple[str, dict, dict] | None:
+        """Express the rule as one mismatch condition (see BaseValidator)."""
+        pattern = rule.get('pattern', '')
+        pattern = self.COMMON_PATTERNS.get(pattern, pattern)
+        if not pattern or not _sql_can_match(pattern, self._dialect()):
+            return None
+        
+        match_null = rule.get('match_null', True)
+        inverse = rule.get('inverse', False)
+        condition, pattern_type, bound_pattern = _build_pattern_predicate(
+            self._quote(rule['column']), pattern, match_null, inverse, self._dialect(), prefix
+        )
+        metadata = {
+            'pattern': pattern,
+            'match_null': match_null,
+            'inverse': inverse,
+            'pattern_type': pattern_type
+        }
+        return condition, {f'{prefix}pattern': bound_pattern}, metadata
+    
+    def _validate_sql(
         self,
         table: str,
         column: str,
@@ -105,76 +365,19 @@ class PatternValidator(BaseValidator):
         rule: dict
     ) -> ValidationResult:
         """
-        Validate using SQL Server pattern matching.
+        Validate in the database with the dialect's pattern operator.
         
-        Note: SQL Server doesn't have native regex, so we use a combination of
-        LIKE and PATINDEX, or require CLR functions for full regex support.
-        For simple patterns, we translate to LIKE; for complex ones, we note the limitation.
+        LIKE where the regex translates exactly, otherwise ~ on
+        PostgreSQL, REGEXP on SQLite and PATINDEX on SQL Server (which
+        has no native regex; see _build_pattern_predicate).
         """
-        # For SQL Server, we'll use a simplified approach
-        # Full regex requires CLR integration which may not be available
-        
-        null_condition = "" if match_null else f"AND {column} IS NOT NULL"
-        
-        # Check if pattern can be translated to LIKE
-        simple_pattern = self._try_translate_to_like(pattern)
-        
-        if simple_pattern:
-            match_operator = "NOT LIKE" if inverse else "LIKE"
-            not_match_operator = "LIKE" if inverse else "NOT LIKE"
-            
-            query = f"""
-                SELECT *
-                FROM {table}
-                WHERE {column} {not_match_operator} '{simple_pattern}'
-                {null_condition}
-            """
-            
-            count_query = f"""
-                SELECT COUNT(*) as violation_count
-                FROM {table}
-                WHERE {column} {not_match_operator} '{simple_pattern}'
-                {null_condition}
-            """
-        else:
-            # Try PATINDEX (limited regex support in SQL Server)
-            # PATINDEX returns 0 if no match
-            if inverse:
-                match_condition = f"PATINDEX('%{self._escape_patindex(pattern)}%', {column}) > 0"
-            else:
-                match_condition = f"PATINDEX('%{self._escape_patindex(pattern)}%', {column}) = 0"
-            
-            query = f"""
-                SELECT *
-                FROM {table}
-                WHERE {column} IS NOT NULL
-                  AND {match_condition}
-                {null_condition}
-            """
-            
-            count_query = f"""
-                SELECT COUNT(*) as violation_count
-                FROM {table}
-                WHERE {column} IS NOT NULL
-                  AND {match_condition}
-                {null_condition}
-            """
-        
-        count_result = self.connector.execute_query(count_query)
-        violation_count = count_result[0]['violation_count'] if count_result else 0
+        query, pattern_type, bound_pattern = _build_pattern_sql(
+            table, column, pattern, match_null, inverse, self._dialect()
+        )
         
-        sample_records = []
-        if violation_count > 0:
-            try:
-                sample_query = f"{query} OFFSET 0 ROWS FETCH NEXT {self.sample_size} ROWS ONLY"
-                sample_records = self.connector.execute_query(sample_query)
-            except Exception:
-                try:
-                    sample_query = f"SELECT TOP {self.sample_size} * FROM ({query}) AS t"
-                    sample_records = self.connector.execute_query(sample_query)
-                except Exception:
-                    all_records = self.connector.execute_query(query)
-                    sample_records = all_records[:self.sample_size]
+        violation_count, sample_records = self._fetch_violations(
+            query, rule, {'pattern': bound_pattern}
+        )
         
         return self._build_result(
             rule=rule,
@@ -186,11 +389,11 @@ class PatternValidator(BaseValidator):
                 'pattern': pattern,
                 'match_null': match_null,
                 'inverse': inverse,
-                'pattern_type': 'like' if simple_pattern else 'patindex'
+                'pattern_type': pattern_type
             }
         )
     
-    def _validate_postgres(
+    def _validate_client_side(
         self,
         table: str,
         column: str,
@@ -199,38 +402,39 @@ class PatternValidator(BaseValidator):
         inverse: bool,
         rule: dict
     ) -> ValidationResult:
-        """Validate using PostgreSQL regex operators."""
-        null_condition = "" if match_null else f"AND {column} IS NOT NULL"
-        
-        # PostgreSQL uses ~ for regex match, !~ for not match
-        if inverse:
-            match_condition = f"{column} ~ '{pattern}'"
-        else:
-            match_condition = f"{column} !~ '{pattern}'"
+        """
+        Validate by streaming the column's values and matching in Python.
         
-        query = f"""
-            SELECT *
-            FROM {table}
-            WHERE {column} IS NOT NULL
-              AND {match_condition}
-            {null_condition}
+        Used for dialects that can evaluate neither a regex nor the
+        pattern's LIKE translation. Only the column is streamed; the
+        pattern is compiled once (see _compile_pattern). Sample rows are
+        then fetched by the first violating values.
         """
+        matcher = _compile_pattern(pattern)
+        sample_limit = self._sample_limit(rule)
         
-        count_query = f"""
-            SELECT COUNT(*) as violation_count
+        # NULLs are only fetched when they count as violations
+        null_filter = f"WHERE {column} IS NOT NULL" if match_null else ""
+        query = f"""
+            SELECT {column} AS _pattern_value
             FROM {table}
-            WHERE {column} IS NOT NULL
-              AND {match_condition}
-            {null_condition}
+            {null_filter}
         """
         
-        count_result = self.connector.execute_query(count_query)
-        violation_count = count_result[0]['violation_count'] if count_result else 0
+        violation_count = 0
+        sample_values = []
+        with closing(self.connector.execute_query_iter(query)) as rows:
+            for record in rows:
+                value = record['_pattern_value']
+                if value is not None and (matcher(str(value)) is not None) != inverse:
+                    continue
+                violation_count += 1
+                if len(sample_values) < sample_limit and value not in sample_values:
+                    sample_values.append(value)
         
         sample_records = []
-        if violation_count > 0:
-            sample_query = f"{query} LIMIT {self.sample_size}"
-            sample_records = self.connector.execute_query(sample_query)
+        if sample_values:
+            sample_records = self._fetch_rows_by_value(table, column, sample_values, sample_limit)
         
         return self._build_result(
             rule=rule,
@@ -242,52 +446,31 @@ class PatternValidator(BaseValidator):
                 'pattern': pattern,
                 'match_null': match_null,
                 'inverse': inverse,
-                'pattern_type': 'regex'
+                'pattern_type': 'client'
             }
         )
     
-    def _try_translate_to_like(self, regex_pattern: str) -> str | None:
-        """
-        Try to translate simple regex to SQL LIKE pattern.
-        Returns None if pattern is too complex.
-        """
-        # Only handle very simple patterns
-        # ^ and $ anchors, literal characters, and basic wildcards
-        
-        simple_chars = set('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789@.-_ ')
-        
-        pattern = regex_pattern
-        
-        # Remove anchors (LIKE is implicitly anchored)
-        if pattern.startswith('^'):
-            pattern = pattern[1:]
-        if pattern.endswith('$'):
-            pattern = pattern[:-1]
+    def _fetch_rows_by_value(
+        self,
+        table: str,
+        column: str,
+        values: list,
+        limit: int
+    ) -> list[dict]:
+        """Fetch up to limit rows whose column holds one of the values (None: NULL)."""
+        dialect = self._dialect()
+        params = {f's{i}': v for i, v in enumerate(v for v in values if v is not None)}
         
-        # Check if remaining pattern only has simple characters
-        if all(c in simple_chars for c in pattern):
-            return pattern
+        conditions = []
+        if params:
+            placeholders = ', '.join(_dialect_param(name, dialect) for name in params)
+            conditions.append(f"{column} IN ({placeholders})")
+        if None in values:
+            conditions.append(f"{column} IS NULL")
         
-        # Pattern is too complex for LIKE
-        return None
-    
-    def _escape_patindex(self, pattern: str) -> str:
-        """Escape special characters for PATINDEX."""
-        # PATINDEX uses a subset of regex: [ ] ^ - are special
-        # This is a simplified escape - full regex not supported
-        return pattern.replace("'", "''")
-    
-    def _serialize_records(self, records: list[dict]) -> list[dict]:
-        """Convert records to JSON-serializable format."""
-        return [
-            {k: self._serialize_value(v) for k, v in record.items()}
-            for record in records
-        ]
-    
-    def _serialize_value(self, value: Any) -> Any:
-        """Convert value to JSON-serializable format."""
-        if value is None:
-            return None
-        if isinstance(value, (int, float, str, bool)):
-            return value
-        return str(value)
+        query = f"""
+            SELECT *
+            FROM {table}
+            WHERE {' OR '.join(conditions)}
+        """
+        return self.connector.execute_query(self._limit_query(query, limit), params or None)
@@ -5,10 +5,102 @@ Validates that values are within specified minimum and maximum thresholds,
 useful for business rules like positive prices, valid percentages, etc.
 """
 
-import time
-from typing import Any
+import functools
 
-from src.validators.base import BaseValidator, ValidationResult
+from src.validators.base import BaseValidator, ValidationResult, _dialect_param, _dialect_quote
+
+
+@functools.lru_cache(maxsize=512)
+def _range_conditions(
+    column: str,
+    has_min: bool,
+    has_max: bool,
+    inclusive: bool,
+    dialect: str,
+    prefix: str = ""
+) -> tuple[str, ...]:
+    """
+    Build one out-of-range comparison per bound.
+    
+    The bounds are bound as the '<prefix>min_val' and '<prefix>max_val'
+    parameters, in that order.
+    
+    Returns:
+        Tuple of SQL conditions, each true for rows violating one bound
+    """
+    quoted_col = _dialect_quote(column, dialect)
+    
+    conditions = []
+    if has_min:
+        placeholder = _dialect_param(f'{prefix}min_val', dialect)
+        if inclusive:
+            conditions.append(f'{quoted_col} < {placeholder}')
+        else:
+            conditions.append(f'{quoted_col} <= {placeholder}')
+    
+    if has_max:
+        placeholder = _dialect_param(f'{prefix}max_val', dialect)
+        if inclusive:
+            conditions.append(f'{quoted_col} > {placeholder}')
+        else:
+            conditions.append(f'{quoted_col} >= {placeholder}')
+    
+    return tuple(conditions)
+
+
+@functools.lru_cache(maxsize=512)
+def _build_range_sql(
+    table: str,
+    column: str,
+    has_min: bool,
+    has_max: bool,
+    inclusive: bool,
+    dialect: str,
+    split: bool = True
+) -> str:
+    """
+    Build the violation query for a range rule.
+    
+    The bounds are bound as the 'min_val' and 'max_val' parameters (in
+    that order), so rules differing only in their bounds share one
+    query text and server plan. Memoized on the rule's shape.
+    
+    Each bound is a single sargable predicate, so an index on the column
+    can serve it as a range seek. With one bound no NULL check is needed
+    (NULL never compares true); with both, the two predicates become
+    UNION ALL legs rather than one OR, which usually forces a scan.
+    
+    Args:
+        split: Use the UNION ALL form for two bounds. Only valid when the
+            bounds cannot both match a row (min < max, or min == max
+            with inclusive bounds); otherwise the legs overlap and rows
+            would be counted twice.
+    
+    Returns:
+        SQL query string
+    """
+    quoted_col = _dialect_quote(column, dialect)
+    quoted_table = _dialect_quote(table, dialect)
+    conditions = _range_conditions(column, has_min, has_max, inclusive, dialect)
+    
+    if len(conditions) == 1 or split:
+        legs = [
+            f"""
+            SELECT *
+            FROM {quoted_table}
+            WHERE {condition}"""
+            for condition in conditions
+        ]
+        return '\n            UNION ALL'.join(legs) + '\n        '
+    
+    where_clause = ' OR '.join(conditions)
+    
+    return f"""
+            SELECT *
+            FROM {quoted_table}
+            WHERE {quoted_col} IS NOT NULL
+              AND ({where_clause})
+        """
 
 
 class RangeValidator(BaseValidator):
@@ -21,7 +113,7 @@ class RangeValidator(BaseValidator):
         min: Minimum allowed value (optional)
         max: Maximum allowed value (optional)
         inclusive: Whether bounds are inclusive (default: True)
-        
+    
     Example rules:
         - name: valid_prices
           table: products
@@ -29,7 +121,7 @@ class RangeValidator(BaseValidator):
           column: price
           min: 0
           severity: high
-          
+        
         - name: valid_percentage
           table: metrics
           type: range
@@ -40,11 +132,10 @@ class RangeValidator(BaseValidator):
     """
     
     validator_type = "range"
+    fusable = True
     
     def validate(self, rule: dict) -> ValidationResult:
         """Check that values are within specified range."""
-        start_time = time.time()
-        
         table = rule['table']
         column = rule['column']
         min_val = rule.get('min')
@@ -58,57 +149,27 @@ class RangeValidator(BaseValidator):
                 error_message="Range validation requires at least 'min' or 'max' to be specified"
             )
         
-        quoted_col = self._quote_identifier(column)
-        quoted_table = self._quote_identifier(table)
-        
-        # Build conditions
-        conditions = []
-        if min_val is not None:
-            if inclusive:
-                conditions.append(f'{quoted_col} < {min_val}')
-            else:
-                conditions.append(f'{quoted_col} <= {min_val}')
-                
-        if max_val is not None:
-            if inclusive:
-                conditions.append(f'{quoted_col} > {max_val}')
-            else:
-                conditions.append(f'{quoted_col} >= {max_val}')
+        # The UNION ALL legs are disjoint only if no value can violate
+        # both bounds: exclusive bounds at min == max both match min
+        try:
+            split = (
+                min_val is None
+                or max_val is None
+                or min_val < max_val
+                or (min_val == max_val and inclusive)
+            )
+        except TypeError:
+            split = False
         
-        where_clause = ' OR '.join(conditions)
+        query = _build_range_sql(
+            table, column, min_val is not None, max_val is not None, inclusive,
+            self._dialect(), split
+        )
         
-        query = f"""
-            SELECT *
-            FROM {quoted_table}
-            WHERE {quoted_col} IS NOT NULL
-              AND ({where_clause})
-        """
-        
-        count_query = f"""
-            SELECT COUNT(*) as violation_count
-            FROM {quoted_table}
-            WHERE {quoted_col} IS NOT NULL
-              AND ({where_clause})
-        """
+        params = self._bound_params(min_val, max_val)
         
         try:
-            count_result = self.connector.execute_query(count_query)
-            violation_count = count_result[0]['violation_count'] if count_result else 0
-            
-            sample_records = []
-            if violation_count > 0:
-                try:
-                    sample_query = f"{query} OFFSET 0 ROWS FETCH NEXT {self.sample_size} ROWS ONLY"
-                    sample_records = self.connector.execute_query(sample_query)
-                except Exception:
-                    try:
-                        sample_query = f"SELECT TOP {self.sample_size} * FROM ({query}) AS t"
-                        sample_records = self.connector.execute_query(sample_query)
-                    except Exception:
-                        all_records = self.connector.execute_query(query)
-                        sample_records = all_records[:self.sample_size]
-            
-            execution_time = (time.time() - start_time) * 1000
+            violation_count, sample_records = self._fetch_violations(query, rule, params)
             
             return self._build_result(
                 rule=rule,
@@ -123,7 +184,7 @@ class RangeValidator(BaseValidator):
                     'inclusive': inclusive
                 }
             )
-            
+        
         except Exception as e:
             return self._build_result(
                 rule=rule,
@@ -132,17 +193,32 @@ class RangeValidator(BaseValidator):
                 query=query.strip()
             )
     
-    def _serialize_records(self, records: list[dict]) -> list[dict]:
-        """Convert records to JSON-serializable format."""
-        return [
-            {k: self._serialize_value(v) for k, v in record.items()}
-            for record in records
-        ]
-    
-    def _serialize_value(self, value: Any) -> Any:
-        """Convert value to JSON-serializable format."""
-        if value is None:
+    def compile_predicate(self, rule: dict, prefix: str = "") -> tuple[str, dict, dict] | None:
+        """Express the rule as one out-of-range condition (see BaseValidator)."""
+        min_val = rule.get('min')
+        max_val = rule.get('max')
+        inclusive = rule.get('inclusive', True)
+        if min_val is None and max_val is None:
             return None
-        if isinstance(value, (int, float, str, bool)):
-            return value
-        return str(value)
+        
+        conditions = _range_conditions(
+            rule['column'], min_val is not None, max_val is not None, inclusive,
+            self._dialect(), prefix
+        )
+        metadata = {
+            'column': rule['column'],
+            'min': min_val,
+            'max': max_val,
+            'inclusive': inclusive
+        }
+        return ' OR '.join(conditions), self._bound_params(min_val, max_val, prefix), metadata
+    
+    @staticmethod
+    def _bound_params(min_val, max_val, prefix: str = "") -> dict:
+        """Bind parameters for the set bounds (placeholder order: min before max)."""
+        params = {}
+        if min_val is not None:
+            params[f'{prefix}min_val'] = min_val
+        if max_val is not None:
+            params[f'{prefix}max_val'] = max_val
+        return params
@@ -5,10 +5,65 @@ Ensures that values in a column reference existing values in another table,
 maintaining database integrity even when formal FK constraints aren't defined.
 """
 
-import time
-from typing import Any
+import functools
 
-from src.validators.base import BaseValidator, ValidationResult
+from src.validators.base import BaseValidator, ValidationResult, _dialect_limit, _dialect_quote
+
+
+@functools.lru_cache(maxsize=512)
+def _build_referential_sql(
+    table: str,
+    column: str,
+    ref_table: str,
+    ref_column: str,
+    allow_null: bool,
+    dialect: str,
+    sample_size: int
+) -> tuple[str, str, str]:
+    """
+    Build the queries for a referential integrity rule.
+    
+    Orphans are found with a NOT EXISTS anti-join, which databases
+    plan as a single (hash) anti-semi-join pass without materializing
+    joined rows. Memoized on the rule's shape, so scheduled runs reuse
+    the SQL instead of rebuilding it.
+    
+    Returns:
+        Tuple of (orphan records query, orphan values + count query,
+        sample query)
+    """
+    col = _dialect_quote(column, dialect)
+    ref_col = _dialect_quote(ref_column, dialect)
+    orphan_join = f"""
+            FROM {_dialect_quote(table, dialect)} t
+            WHERE NOT EXISTS (
+                SELECT 1 FROM {_dialect_quote(ref_table, dialect)} r
+                WHERE r.{ref_col} = t.{col}
+            )
+            {f"AND t.{col} IS NOT NULL" if allow_null else ""}"""
+    
+    # Build the orphan records query
+    query = f"""
+            SELECT t.*{orphan_join}
+        """
+    
+    # The 20 most frequent orphan values with their record counts
+    # (useful for diagnosis), each carrying the total orphan record
+    # count: the sum of the per-value counts is windowed over all
+    # values before the row limit
+    orphan_values_query = f"""
+            SELECT
+                t.{col} as orphan_value,
+                COUNT(*) as orphan_count,
+                SUM(COUNT(*)) OVER () as _violation_count{orphan_join}
+            GROUP BY t.{col}
+        """
+    
+    return (
+        query,
+        _dialect_limit(orphan_values_query, 20, dialect, order_by='orphan_count DESC'),
+        _dialect_limit(query, max(sample_size, 1), dialect)
+    )
 
 
 class ReferentialIntegrityValidator(BaseValidator):
@@ -21,7 +76,7 @@ class ReferentialIntegrityValidator(BaseValidator):
         reference_table: Table being referenced
         reference_column: Column in reference table (usually primary key)
         allow_null: Whether NULL values are acceptable (default: True)
-        
+    
     Example rule:
         - name: orders_valid_customer
           table: orders
@@ -34,84 +89,35 @@ class ReferentialIntegrityValidator(BaseValidator):
     
     validator_type = "referential_integrity"
     
+    @classmethod
+    def source_tables(cls, rule: dict) -> list[str] | None:
+        """Child and reference tables; a change to either invalidates."""
+        return [rule['table'], rule['reference_table']]
+    
     def validate(self, rule: dict) -> ValidationResult:
         """Check that all values in column exist in reference table."""
-        start_time = time.time()
-        
         table = rule['table']
         column = rule['column']
         ref_table = rule['reference_table']
         ref_column = rule['reference_column']
         allow_null = rule.get('allow_null', True)
         
-        # Build the orphan records query
-        null_condition = f"AND t.{self._quote_identifier(column)} IS NOT NULL" if allow_null else ""
-        
-        query = f"""
-            SELECT t.*
-            FROM {self._quote_identifier(table)} t
-            LEFT JOIN {self._quote_identifier(ref_table)} r 
-                ON t.{self._quote_identifier(column)} = r.{self._quote_identifier(ref_column)}
-            WHERE r.{self._quote_identifier(ref_column)} IS NULL
-            {null_condition}
-        """
-        
-        # Count query
-        count_query = f"""
-            SELECT COUNT(*) as violation_count
-            FROM {self._quote_identifier(table)} t
-            LEFT JOIN {self._quote_identifier(ref_table)} r 
-                ON t.{self._quote_identifier(column)} = r.{self._quote_identifier(ref_column)}
-            WHERE r.{self._quote_identifier(ref_column)} IS NULL
-            {null_condition}
-        """
-        
-        # Query to get distinct orphan values (useful for diagnosis)
-        orphan_values_query = f"""
-            SELECT DISTINCT t.{self._quote_identifier(column)} as orphan_value
-            FROM {self._quote_identifier(table)} t
-            LEFT JOIN {self._quote_identifier(ref_table)} r 
-                ON t.{self._quote_identifier(column)} = r.{self._quote_identifier(ref_column)}
-            WHERE r.{self._quote_identifier(ref_column)} IS NULL
-            {null_condition}
-        """
+        query, orphan_query, sample_query = _build_referential_sql(
+            table, column, ref_table, ref_column, allow_null,
+            self._dialect(), self.sample_size
+        )
         
         try:
-            # Get violation count
-            count_result = self.connector.execute_query(count_query)
-            violation_count = count_result[0]['violation_count'] if count_result else 0
+            # Violation count plus distinct orphan values in one pass
+            # over the join
+            orphan_results = self.connector.execute_query(orphan_query)
+            violation_count = int(orphan_results[0]['_violation_count']) if orphan_results else 0
+            orphan_values = [self._serialize_value(r['orphan_value']) for r in orphan_results]
             
-            # Get sample records and orphan values if violations exist
+            # Get sample of violating records if violations exist
             sample_records = []
-            orphan_values = []
-            
-            if violation_count > 0:
-                # Get sample of violating records
-                try:
-                    sample_query = f"{query} OFFSET 0 ROWS FETCH NEXT {self.sample_size} ROWS ONLY"
-                    sample_records = self.connector.execute_query(sample_query)
-                except Exception:
-                    try:
-                        sample_query = f"SELECT TOP {self.sample_size} * FROM ({query}) AS t"
-                        sample_records = self.connector.execute_query(sample_query)
-                    except Exception:
-                        all_records = self.connector.execute_query(query)
-                        sample_records = all_records[:self.sample_size]
-                
-                # Get distinct orphan values (limit to 20 for readability)
-                try:
-                    orphan_query = f"{orphan_values_query} OFFSET 0 ROWS FETCH NEXT 20 ROWS ONLY"
-                    orphan_results = self.connector.execute_query(orphan_query)
-                except Exception:
-                    try:
-                        orphan_query = f"SELECT TOP 20 * FROM ({orphan_values_query}) AS t"
-                        orphan_results = self.connector.execute_query(orphan_query)
-                    except Exception:
-                        orphan_results = self.connector.execute_query(orphan_values_query)[:20]
-                
-                orphan_values = [r['orphan_value'] for r in orphan_results]
-            
-            execution_time = (time.time() - start_time) * 1000
+            if violation_count > 0 and self._sample_limit(rule):
+                sample_records = self.connector.execute_query(sample_query)
             
             return self._build_result(
                 rule=rule,
@@ -124,31 +130,19 @@ class ReferentialIntegrityValidator(BaseValidator):
                     'source_column': column,
                     'reference_table': ref_table,
                     'reference_column': ref_column,
-                    'orphan_values': [self._serialize_value(v) for v in orphan_values],
+                    'orphan_values': orphan_values,
+                    'orphan_value_counts': [
+                        {'value': value, 'count': int(r['orphan_count'])}
+                        for value, r in zip(orphan_values, orphan_results)
+                    ],
                     'allow_null': allow_null
                 }
             )
-            
+        
         except Exception as e:
-            execution_time = (time.time() - start_time) * 1000
             return self._build_result(
                 rule=rule,
                 passed=False,
                 error_message=f"Query execution failed: {str(e)}",
                 query=query.strip()
             )
-    
-    def _serialize_records(self, records: list[dict]) -> list[dict]:
-        """Convert records to JSON-serializable format."""
-        return [
-            {k: self._serialize_value(v) for k, v in record.items()}
-            for record in records
-        ]
-    
-    def _serialize_value(self, value: Any) -> Any:
-        """Convert value to JSON-serializable format."""
-        if value is None:
-            return None
-        if isinstance(value, (int, float, str, bool)):
-            return value
-        return str(value)
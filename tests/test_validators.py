@@ -4,28 +4,31 @@ Unit tests for data quality validators.
 Run with: pytest tests/test_validators.py -v
 """
 
+import asyncio
 import pytest
 import sqlite3
-import tempfile
-from pathlib import Path
+import yaml
 
+from src.config_loader import ConfigLoader, ConfigurationError, normalize_rule
 from src.connectors.sqlite import SQLiteConnector
+from src.rule_engine import RuleEngine
 from src.validators import (
     CompletenessValidator,
     ReferentialIntegrityValidator,
     DuplicatesValidator,
     RangeValidator,
+    PatternValidator,
     OutliersValidator,
     CustomSQLValidator,
+    FusedValidator,
     Severity
 )
 
 
-@pytest.fixture
-def test_db():
-    """Create temporary test database."""
-    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
-        db_path = f.name
+@pytest.fixture(scope="session")
+def test_db(tmp_path_factory):
+    """Create the test database once for the whole test session."""
+    db_path = str(tmp_path_factory.mktemp('data') / 'test.db')
     
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
@@ -63,19 +66,25 @@ def test_db():
     conn.commit()
     conn.close()
     
-    yield db_path
-    
-    # Cleanup
-    Path(db_path).unlink(missing_ok=True)
+    return db_path
 
 
 @pytest.fixture
 def connector(test_db):
-    """Create SQLite connector for test database."""
+    """
+    Create SQLite connector for test database.
+    
+    Every query of the test runs on one connection inside a transaction
+    that is rolled back afterwards, so the shared database never sees a
+    test's writes.
+    """
     config = {'type': 'sqlite', 'path': test_db}
     conn = SQLiteConnector(config)
     conn.connect()
-    yield conn
+    with conn.session():
+        conn.execute_query("BEGIN")
+        yield conn
+        conn.execute_query("ROLLBACK")
     conn.disconnect()
 
 
@@ -175,6 +184,179 @@ class TestRangeValidator:
         
         assert result.failed
         assert result.violation_count == 1  # Eve has age 150
+    
+    def test_two_bounds_violating_each_side(self, connector):
+        validator = RangeValidator(connector, {'sample_size': 5})
+        rule = {
+            'name': 'test_score_band',
+            'type': 'range',
+            'table': 'customers',
+            'column': 'score',
+            'min': 80,
+            'max': 100,
+            'severity': 'medium'
+        }
+        
+        result = validator.validate(rule)
+        
+        assert result.violation_count == 2  # Charlie below, Frank above
+        assert sorted(r['id'] for r in result.sample_records) == [3, 6]
+    
+    def test_single_bound(self, connector):
+        validator = RangeValidator(connector, {'sample_size': 5})
+        rule = {
+            'name': 'test_max_score',
+            'type': 'range',
+            'table': 'customers',
+            'column': 'score',
+            'max': 100,
+            'severity': 'medium'
+        }
+        
+        result = validator.validate(rule)
+        
+        assert result.violation_count == 1  # Frank has score 999
+        assert [r['id'] for r in result.sample_records] == [6]
+    
+    def test_exclusive_equal_bounds_count_each_row_once(self, connector):
+        validator = RangeValidator(connector, {'sample_size': 10})
+        rule = {
+            'name': 'test_age_between',
+            'type': 'range',
+            'table': 'customers',
+            'column': 'age',
+            'min': 30,
+            'max': 30,
+            'inclusive': False,
+            'severity': 'medium'
+        }
+        
+        result = validator.validate(rule)
+        
+        # Every non-NULL age violates; age 30 violates both bounds
+        assert result.violation_count == 5
+        assert sorted(r['id'] for r in result.sample_records) == [1, 2, 4, 5, 6]
+
+
+class TestPatternValidator:
+    """Tests for pattern validation."""
+    
+    def test_lettered_pattern_uses_regexp_on_sqlite(self, connector):
+        validator = PatternValidator(connector, {'sample_size': 5})
+        rule = {
+            'name': 'test_alice_emails',
+            'type': 'pattern',
+            'table': 'customers',
+            'column': 'email',
+            'pattern': r'^alice.*@test\.com$',
+            'severity': 'low'
+        }
+        
+        result = validator.validate(rule)
+        
+        # SQLite's LIKE ignores case, so lettered patterns use REGEXP
+        assert result.metadata['pattern_type'] == 'regex'
+        assert result.violation_count == 3  # Charlie, Eve and Frank; NULL passes
+    
+    def test_case_free_pattern_uses_like(self, connector):
+        validator = PatternValidator(connector, {'sample_size': 5})
+        rule = {
+            'name': 'test_age_thirty',
+            'type': 'pattern',
+            'table': 'customers',
+            'column': 'age',
+            'pattern': r'^30$',
+            'severity': 'low'
+        }
+        
+        result = validator.validate(rule)
+        
+        assert result.metadata['pattern_type'] == 'like'
+        assert result.violation_count == 3  # Bob, Eve and Frank
+    
+    def test_pattern_matching_is_case_sensitive(self, connector):
+        validator = PatternValidator(connector, {'sample_size': 10})
+        rule = {
+            'name': 'test_lowercase_alice',
+            'type': 'pattern',
+            'table': 'customers',
+            'column': 'name',
+            'pattern': r'^alice$',
+            'severity': 'low'
+        }
+        
+        result = validator.validate(rule)
+        
+        assert result.violation_count == 6  # 'Alice' does not match 'alice'
+    
+    def test_dot_does_not_match_newline(self, connector):
+        connector.execute_query("INSERT INTO customers (id, name) VALUES (7, '1' || char(10) || '2')")
+        validator = PatternValidator(connector, {'sample_size': 10})
+        rule = {
+            'name': 'test_one_char_two',
+            'type': 'pattern',
+            'table': 'customers',
+            'column': 'name',
+            'pattern': r'^1.2$',
+            'severity': 'low'
+        }
+        
+        result = validator.validate(rule)
+        
+        assert result.metadata['pattern_type'] == 'regex'
+        assert result.violation_count == 7  # including the newline value
+    
+    def test_client_side_fallback_when_database_cannot_match(self, connector, monkeypatch):
+        monkeypatch.setattr('src.validators.pattern._sql_can_match', lambda pattern, dialect: False)
+        validator = PatternValidator(connector, {'sample_size': 5})
+        rule = {
+            'name': 'test_client_emails',
+            'type': 'pattern',
+            'table': 'customers',
+            'column': 'email',
+            'pattern': r'^[a-z]+@test\.com$',
+            'match_null': False,
+            'severity': 'low'
+        }
+        
+        result = validator.validate(rule)
+        
+        assert result.metadata['pattern_type'] == 'client'
+        assert result.violation_count == 2  # Bob (NULL) and alice2
+        assert sorted(r['id'] for r in result.sample_records) == [2, 4]
+    
+    def test_query_errors_are_reported_not_retried(self, connector):
+        validator = PatternValidator(connector, {'sample_size': 5})
+        rule = {
+            'name': 'test_missing_table',
+            'type': 'pattern',
+            'table': 'no_such_table',
+            'column': 'email',
+            'pattern': 'email',
+            'severity': 'low'
+        }
+        
+        result = validator.validate(rule)
+        
+        assert result.error_message.startswith('Query execution failed')
+        assert 'no_such_table' in result.error_message
+    
+    def test_nulls_fail_when_match_null_is_false(self, connector):
+        validator = PatternValidator(connector, {'sample_size': 5})
+        rule = {
+            'name': 'test_email_lowercase',
+            'type': 'pattern',
+            'table': 'customers',
+            'column': 'email',
+            'pattern': r'^[a-z]',
+            'match_null': False,
+            'severity': 'low'
+        }
+        
+        result = validator.validate(rule)
+        
+        assert result.failed
+        assert result.violation_count == 1  # Bob has no email
 
 
 class TestOutliersValidator:
@@ -197,6 +379,22 @@ class TestOutliersValidator:
         # Frank's score of 999 should be detected as outlier
         assert result.failed
         assert result.violation_count >= 1
+    
+    def test_shared_stats_expire_with_table_version(self, connector, monkeypatch):
+        validator = OutliersValidator(connector, {'stats_cache_ttl': 60})
+        version = ['v1']
+        monkeypatch.setattr(connector, 'get_table_version', lambda table: version[0])
+        
+        validator._put_stats(('quartiles', 'customers', 'score'), (1.0, 2.0))
+        assert validator._get_stats(('quartiles', 'customers', 'score')) == (1.0, 2.0)
+        
+        version[0] = 'v2'
+        assert validator._get_stats(('quartiles', 'customers', 'score')) is None
+    
+    def test_shared_stats_off_by_default(self, connector):
+        validator = OutliersValidator(connector, {})
+        validator._put_stats(('quartiles', 'customers', 'age'), (1.0, 2.0))
+        assert validator._get_stats(('quartiles', 'customers', 'age')) is None
 
 
 class TestCustomSQLValidator:
@@ -231,5 +429,199 @@ class TestCustomSQLValidator:
         assert result.violation_count == 0
 
 
+class TestFusedValidator:
+    """Tests for fused single-scan validation."""
+    
+    def test_fused_counts_match_individual_rules(self, connector):
+        validator = FusedValidator(connector, {'sample_size': 5})
+        rules = [
+            {
+                'name': 'test_valid_age',
+                'type': 'range',
+                'table': 'customers',
+                'column': 'age',
+                'min': 0,
+                'max': 120,
+                'severity': 'medium',
+                'include_samples': False
+            },
+            {
+                'name': 'test_email_required',
+                'type': 'completeness',
+                'table': 'customers',
+                'columns': ['email'],
+                'severity': 'high'
+            },
+            {
+                'name': 'test_name_capitalized',
+                'type': 'pattern',
+                'table': 'customers',
+                'column': 'name',
+                'pattern': r'^[A-Z]',
+                'severity': 'low'
+            }
+        ]
+        
+        results = validator.validate_many(rules)
+        
+        assert [r.rule_type for r in results] == ['range', 'completeness', 'pattern']
+        assert results[0].violation_count == 1  # Eve has age 150
+        assert results[1].violation_count == 1  # Bob has no email
+        assert len(results[1].sample_records) == 1
+        assert results[2].passed
+
+
+class TestConfigLoader:
+    """Tests for configuration validation."""
+    
+    @pytest.mark.parametrize('field, value', [
+        ('severity', ['high']),
+        ('type', {'range': True}),
+    ])
+    def test_non_string_values_are_configuration_errors(self, tmp_path, field, value):
+        rule = {'name': 'bad_rule', 'type': 'range', 'table': 'customers',
+                'column': 'age', 'severity': 'high', field: value}
+        config_path = tmp_path / 'rules.yaml'
+        config_path.write_text(yaml.safe_dump({
+            'connections': {'test': {'type': 'sqlite', 'path': ':memory:'}},
+            'rules': [rule],
+        }))
+        
+        with pytest.raises(ConfigurationError):
+            ConfigLoader(config_path).load()
+
+
+# Mixed rules for engine tests: fusable rules on customers share a scan,
+# the rest run on their own
+ENGINE_RULES = [
+    {'name': 'email_required', 'type': 'completeness', 'table': 'customers',
+     'columns': ['email'], 'severity': 'high'},
+    {'name': 'valid_age', 'type': 'range', 'table': 'customers',
+     'column': 'age', 'min': 0, 'max': 120, 'severity': 'medium'},
+    {'name': 'name_capitalized', 'type': 'pattern', 'table': 'customers',
+     'column': 'name', 'pattern': '^[A-Z]', 'severity': 'low'},
+    {'name': 'unique_name_age', 'type': 'duplicates', 'table': 'customers',
+     'columns': ['name', 'age'], 'severity': 'high'},
+    {'name': 'valid_customer', 'type': 'referential_integrity', 'table': 'orders',
+     'column': 'customer_id', 'reference_table': 'customers',
+     'reference_column': 'id', 'severity': 'critical'},
+    {'name': 'positive_amount', 'type': 'custom_sql',
+     'query': 'SELECT * FROM orders WHERE amount <= 0', 'severity': 'medium'},
+]
+
+
+def _engine_config(tmp_path, db_path, **settings) -> ConfigLoader:
+    """Write and load a config running ENGINE_RULES on the test database."""
+    config_path = tmp_path / 'rules.yaml'
+    config_path.write_text(yaml.safe_dump({
+        'settings': settings,
+        'connections': {'test': {'type': 'sqlite', 'path': db_path}},
+        'rules': ENGINE_RULES,
+    }))
+    config = ConfigLoader(config_path)
+    config.load()
+    return config
+
+
+def _outcomes(report) -> dict:
+    """Comparable outcome of each rule in a report, by rule name."""
+    return {
+        r.rule_name: (r.rule_type, r.passed, r.violation_count, r.error_message)
+        for r in report.results
+    }
+
+
+class TestRuleEngine:
+    """Tests for rule batching, execution modes and the result cache."""
+    
+    def test_parallel_matches_sequential(self, test_db, tmp_path):
+        config = _engine_config(tmp_path, test_db)
+        
+        with RuleEngine(config, max_workers=1) as engine:
+            sequential = _outcomes(engine.run())
+        with RuleEngine(config, max_workers=4) as engine:
+            parallel = _outcomes(engine.run())
+        with RuleEngine(config, max_workers=4) as engine:
+            concurrent = _outcomes(asyncio.run(engine.run_async()))
+        
+        assert sequential == parallel == concurrent
+        assert set(sequential) == {rule['name'] for rule in ENGINE_RULES}
+        assert sequential['email_required'][1:3] == (False, 1)
+        assert sequential['valid_age'][1:3] == (False, 1)
+        assert sequential['name_capitalized'][1:3] == (True, 0)
+        assert sequential['valid_customer'][1:3] == (False, 1)
+        assert sequential['positive_amount'][1:3] == (True, 0)
+    
+    def test_fusable_rules_share_a_batch_but_tableless_rules_do_not(self, test_db, tmp_path):
+        engine = RuleEngine(_engine_config(tmp_path, test_db))
+        tableless = [
+            normalize_rule({'name': f'no_table_{i}', 'type': 'completeness',
+                            'columns': ['email'], 'severity': 'low'})
+            for i in range(2)
+        ]
+        
+        batches = engine._coalesce(engine.config.get_rules() + tableless)
+        
+        names = [[rule['name'] for rule in batch] for batch in batches]
+        assert ['email_required', 'valid_age', 'name_capitalized'] in names
+        assert ['no_table_0'] in names
+        assert ['no_table_1'] in names
+    
+    def test_second_run_reuses_cached_results(self, test_db, tmp_path):
+        config = _engine_config(tmp_path, test_db, result_cache_ttl=60)
+        
+        with RuleEngine(config, max_workers=1) as engine:
+            first = engine.run()
+            second = engine.run()
+        
+        assert _outcomes(first) == _outcomes(second)
+        assert not any(r.metadata.get('cached') for r in first.results)
+        for result in second.results:
+            # Arbitrary SQL may read any table, so custom_sql is never cached
+            if result.rule_type != 'custom_sql':
+                assert result.metadata.get('cached') is True
+    
+    def test_stop_on_critical_skips_remaining_rules(self, test_db, tmp_path):
+        config = _engine_config(tmp_path, test_db, stop_on_critical=True)
+        
+        with RuleEngine(config, max_workers=1) as engine:
+            report = engine.run()
+        
+        # valid_customer fails critically; positive_amount never runs
+        assert [r.rule_name for r in report.results][-1] == 'valid_customer'
+        assert 'positive_amount' not in _outcomes(report)
+
+
+class TestSQLiteConnector:
+    """Tests for SQLite table versions."""
+    
+    def test_table_version_changes_on_every_commit(self, tmp_path):
+        db_path = str(tmp_path / 'versions.db')
+        writer = sqlite3.connect(db_path)
+        writer.execute("CREATE TABLE t (a INTEGER)")
+        writer.execute("INSERT INTO t VALUES (0)")
+        writer.commit()
+        
+        conn = SQLiteConnector({'type': 'sqlite', 'path': db_path})
+        conn.connect()
+        other = SQLiteConnector({'type': 'sqlite', 'path': db_path})
+        other.connect()
+        
+        versions = [conn.get_table_version('t')]
+        for i in range(3):
+            # Same-size commits within one mtime tick still differ
+            writer.execute("UPDATE t SET a = ?", (i + 1,))
+            writer.commit()
+            versions.append(conn.get_table_version('t'))
+        
+        assert len(set(versions)) == len(versions)
+        assert other.get_table_version('t') == versions[-1]
+        assert conn.get_table_version('t') == versions[-1]
+        
+        conn.disconnect()
+        other.disconnect()
+        writer.close()
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])